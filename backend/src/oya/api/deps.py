@@ -10,6 +10,7 @@ from oya.db.connection import Database
 from oya.db.migrations import run_migrations
 from oya.db.repo_registry import RepoRegistry, RepoRecord
 from oya.llm.client import LLMClient
+from oya.llm.ratelimit import RetryPolicy, TokenBucket
 from oya.repo.git_repo import GitRepo
 from oya.repo.repo_paths import RepoPaths
 from oya.vectorstore.issues import IssuesStore
@@ -240,6 +241,16 @@ def get_llm() -> LLMClient:
             api_key=settings.llm_api_key,
             endpoint=settings.llm_endpoint,
             log_path=log_path,
+            retry_policy=RetryPolicy(
+                max_retries=settings.llm.max_retries,
+                base_delay=settings.llm.retry_base_delay,
+                max_delay=settings.llm.retry_max_delay,
+            ),
+            rate_limiter=(
+                TokenBucket.per_minute(settings.llm.requests_per_minute)
+                if settings.llm.requests_per_minute
+                else None
+            ),
         )
     return _llm_instance
 
@@ -4,6 +4,7 @@ import asyncio
 import json
 import logging
 from datetime import datetime
+from typing import Any
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
@@ -29,6 +30,9 @@ class JobStatus(BaseModel):
     total_phases: int | None = None
     error_message: str | None = None
     changes_made: bool | None = None
+    concurrency_limit: int | None = None
+    # LLM tokens and cost by phase and page; only returned for a single job
+    usage: dict[str, Any] | None = None
 
 
 class JobCancelled(BaseModel):
@@ -48,7 +52,8 @@ async def list_jobs(
     cursor = db.execute(
         """
         SELECT id, type, status, started_at, completed_at,
-               current_phase, total_phases, error_message, changes_made
+               current_phase, total_phases, error_message, changes_made,
+               concurrency_limit
         FROM generations
         ORDER BY started_at DESC
         LIMIT ?
@@ -69,6 +74,7 @@ async def list_jobs(
                 total_phases=row["total_phases"],
                 error_message=row["error_message"],
                 changes_made=bool(row["changes_made"]) if row["changes_made"] is not None else None,
+                concurrency_limit=row["concurrency_limit"],
             )
         )
 
@@ -84,7 +90,8 @@ async def get_job(
     cursor = db.execute(
         """
         SELECT id, type, status, started_at, completed_at,
-               current_phase, total_phases, error_message, changes_made
+               current_phase, total_phases, error_message, changes_made,
+               concurrency_limit, usage
         FROM generations
         WHERE id = ?
         """,
@@ -105,6 +112,8 @@ async def get_job(
         total_phases=row["total_phases"],
         error_message=row["error_message"],
         changes_made=bool(row["changes_made"]) if row["changes_made"] is not None else None,
+        concurrency_limit=row["concurrency_limit"],
+        usage=json.loads(row["usage"]) if row["usage"] else None,
     )
 
 
@@ -177,7 +186,7 @@ async def stream_job_progress(
                 cursor = current_db.execute(
                     """
                     SELECT id, status, current_phase, total_phases,
-                           current_step, total_steps, error_message
+                           current_step, total_steps, error_message, concurrency_limit
                     FROM generations WHERE id = ?
                     """,
                     (job_id,),
@@ -206,6 +215,7 @@ async def stream_job_progress(
                 "total_phases": row["total_phases"],
                 "current_step": row["current_step"],
                 "total_steps": row["total_steps"],
+                "concurrency_limit": row["concurrency_limit"],
             }
 
             if status == "completed":
@@ -5,6 +5,7 @@ from pydantic import BaseModel
 
 from oya.config import load_settings
 from oya.db.repo_registry import RepoRegistry
+from oya.llm.querylog import rotated_log_files
 from oya.repo.repo_paths import RepoPaths
 
 router = APIRouter(prefix="/api/v2/repos", tags=["logs"])
@@ -65,17 +66,20 @@ async def get_llm_logs(repo_id: int) -> LogsResponse:
 
 @router.delete("/{repo_id}/logs/llm-queries", response_model=DeleteLogsResponse)
 async def delete_llm_logs(repo_id: int) -> DeleteLogsResponse:
-    """Delete the LLM query logs for a repository."""
+    """Delete the LLM query logs for a repository, including rotated logs."""
     repo, settings = _get_repo_or_404(repo_id)
     paths = RepoPaths(settings.data_dir, repo.local_path)
     log_file = paths.oya_logs / "llm-queries.jsonl"
+    rotated = rotated_log_files(log_file)
 
-    if not log_file.exists():
+    if not log_file.exists() and not rotated:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No logs to delete",
         )
 
-    log_file.unlink()
+    # The log writer reopens the file for each batch, so it starts a new one
+    for file in [log_file, *rotated]:
+        file.unlink(missing_ok=True)
 
     return DeleteLogsResponse(message="Logs deleted successfully")
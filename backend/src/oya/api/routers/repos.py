@@ -1,5 +1,6 @@
 """Repository management endpoints."""
 
+import json
 import logging
 import os
 import uuid
@@ -32,14 +33,21 @@ from oya.db.connection import Database
 from oya.db.migrations import run_migrations
 from oya.config import Settings
 from oya.generation.cleanup import cleanup_stale_content
+from oya.generation.concurrency import AdaptiveConcurrency
 from oya.generation.orchestrator import GenerationOrchestrator, GenerationProgress
 from oya.generation.staging import (
     prepare_staging_directory,
     promote_staging_to_production,
 )
 from oya.indexing.service import IndexingService
+from oya.indexing.streaming import StreamingIndexer
+from oya.llm.cache import ResponseCache
 from oya.llm.client import LLMClient
+from oya.llm.ratelimit import RetryPolicy, TokenBucket
+from oya.llm.usage import UsageTracker
 from oya.notes.service import NotesService
+from oya.parsing.cache import ParseCache
+from oya.parsing.pool import resolve_parse_workers
 from oya.vectorstore.store import VectorStore
 from oya.vectorstore.issues import IssuesStore
 
@@ -379,6 +387,40 @@ async def init_repo(
     return JobCreated(job_id=job_id, message="Wiki generation started")
 
 
+def _record_job_in_staging(db: Database, staging_db: Database, job_id: str) -> None:
+    """Copy the current job's row into the staging database.
+
+    The staging database replaces the job-tracking database on promotion, so
+    it must hold the current job. A fresh staging directory may not have the
+    row at all, and one resumed from an interrupted build holds that build's
+    job instead, still marked running. That job is marked failed here so it
+    does not stay running after promotion.
+
+    Args:
+        db: Database connection for job tracking.
+        staging_db: Database connection for the staging directory.
+        job_id: Unique job identifier.
+    """
+    row = db.execute("SELECT * FROM generations WHERE id = ?", (job_id,)).fetchone()
+    if row is not None:
+        columns = row.keys()
+        staging_db.execute(
+            f"INSERT OR REPLACE INTO generations ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})",
+            tuple(row),
+        )
+    staging_db.execute(
+        """
+        UPDATE generations
+        SET status = 'failed', error_message = ?,
+            completed_at = COALESCE(completed_at, datetime('now'))
+        WHERE id != ? AND status IN ('running', 'pending')
+        """,
+        (f"Superseded by generation {job_id}", job_id),
+    )
+    staging_db.commit()
+
+
 async def _run_generation(
     job_id: str,
     repo: GitRepo,
@@ -421,6 +463,20 @@ async def _run_generation(
         "indexing": 8,
     }
 
+    # Adapts LLM calls in flight during generation; reported with progress
+    concurrency = (
+        AdaptiveConcurrency(
+            initial=settings.parallel_file_limit,
+            maximum=settings.generation.max_parallel_limit,
+            latency_factor=settings.generation.latency_backoff_factor,
+        )
+        if settings.generation.adaptive_concurrency
+        else None
+    )
+
+    # Tokens used by the generation's LLM calls, stored with the job
+    usage = UsageTracker()
+
     async def progress_callback(progress: GenerationProgress) -> None:
         """Update database with current progress."""
         phase_name = progress.phase.value
@@ -432,16 +488,24 @@ async def _run_generation(
             """
             UPDATE generations
             SET current_phase = ?, status = 'running',
-                current_step = ?, total_steps = ?
+                current_step = ?, total_steps = ?, concurrency_limit = ?
             WHERE id = ?
             """,
-            (f"{phase_num}:{phase_name}", progress.step, progress.total_steps, job_id),
+            (
+                f"{phase_num}:{phase_name}",
+                progress.step,
+                progress.total_steps,
+                concurrency.limit if concurrency else settings.parallel_file_limit,
+                job_id,
+            ),
         )
         db.commit()
 
     # Create staging database connection (separate from job tracking db)
     # This db is used by orchestrator for wiki_pages and survives promotion
     staging_db: Database | None = None
+    indexer: StreamingIndexer | None = None
+    response_cache: ResponseCache | None = None
 
     try:
         # Sync repository to default branch before generation
@@ -479,8 +543,11 @@ async def _run_generation(
             )
             db.commit()
 
-        # Prepare staging directory (copies production for incremental, or creates empty)
-        prepare_staging_directory(staging_path, production_path)
+        # Prepare staging directory (copies production for incremental, or creates empty).
+        # A staging directory left by an interrupted build of the same mode is kept,
+        # and the orchestrator resumes from the pages it checkpointed there.
+        if prepare_staging_directory(staging_path, production_path, mode=mode):
+            logger.info("Resuming interrupted build in %s", staging_path)
 
         # Create staging database connection for orchestrator
         # This ensures wiki_pages data survives the staging → production promotion
@@ -488,6 +555,7 @@ async def _run_generation(
         staging_db = Database(staging_db_path)
         # Run migrations on staging db to ensure schema is up to date
         run_migrations(staging_db)
+        _record_job_in_staging(db, staging_db, job_id)
 
         # Cleanup stale content before generation
         try:
@@ -514,14 +582,53 @@ async def _run_generation(
 
         # Create orchestrator to build in staging directory
         log_path = paths.oya_logs / "llm-queries.jsonl"
+        if settings.llm.response_cache:
+            # Outside .oyawiki so that full regeneration does not wipe it
+            response_cache = ResponseCache(
+                paths.oya_cache / "llm-responses.db",
+                max_bytes=settings.llm.response_cache_mb * 1024 * 1024,
+                skip_phases=[
+                    phase.strip()
+                    for phase in settings.llm.response_cache_skip_phases.split(",")
+                    if phase.strip()
+                ],
+            )
         llm = LLMClient(
             provider=settings.llm_provider,
             model=settings.llm_model,
             api_key=settings.llm_api_key,
             endpoint=settings.llm_endpoint,
             log_path=log_path,
+            cache=response_cache,
+            retry_policy=RetryPolicy(
+                max_retries=settings.llm.max_retries,
+                base_delay=settings.llm.retry_base_delay,
+                max_delay=settings.llm.retry_max_delay,
+            ),
+            rate_limiter=(
+                TokenBucket.per_minute(settings.llm.requests_per_minute)
+                if settings.llm.requests_per_minute
+                else None
+            ),
+            on_rate_limit=concurrency.on_congestion if concurrency else None,
+            on_response=concurrency.on_latency if concurrency else None,
+            usage=usage,
         )
         issues_store = IssuesStore(staging_meta_path / "vectorstore")
+
+        # Index wiki content for Q&A search (in staging). Pages are indexed as the
+        # orchestrator saves them, overlapping with generation; the rest at the end.
+        staging_chroma_path = staging_meta_path / "chroma"
+        vectorstore = VectorStore(staging_chroma_path)
+        indexing_service = IndexingService(
+            vectorstore=vectorstore,
+            db=staging_db,  # Use staging db for FTS content
+            wiki_path=staging_wiki_path,
+            meta_path=staging_meta_path,
+        )
+        indexing_service.clear_index()
+        indexer = StreamingIndexer(indexing_service)
+
         orchestrator = GenerationOrchestrator(
             llm_client=llm,
             repo=repo,
@@ -530,11 +637,19 @@ async def _run_generation(
             parallel_limit=settings.parallel_file_limit,
             issues_store=issues_store,
             ignore_path=paths.oyaignore,
+            task_timeout=settings.generation.task_timeout or None,
+            parse_workers=resolve_parse_workers(settings.generation.parse_workers),
+            parse_cache=ParseCache(staging_meta_path / "cache" / "parse.pickle"),
+            git_change_detection=settings.generation.git_change_detection,
+            indexer=indexer,
+            directory_damping=settings.generation.directory_damping,
+            progress_rate=settings.generation.progress_updates_per_second,
+            concurrency=concurrency,
         )
 
         generation_result = await orchestrator.run(progress_callback=progress_callback)
 
-        # Index wiki content for Q&A search (in staging)
+        # Finish indexing: pages still queued, and pages not saved during this run
         db.execute(
             """UPDATE generations
             SET current_phase = '8:indexing', current_step = 0, total_steps = 0
@@ -543,16 +658,6 @@ async def _run_generation(
         )
         db.commit()
 
-        # Use staging chroma path for indexing
-        staging_chroma_path = staging_meta_path / "chroma"
-        vectorstore = VectorStore(staging_chroma_path)
-        indexing_service = IndexingService(
-            vectorstore=vectorstore,
-            db=staging_db,  # Use staging db for FTS content
-            wiki_path=staging_wiki_path,
-            meta_path=staging_meta_path,
-        )
-
         # Progress callback for indexing
         async def indexing_progress_callback(step: int, total: int, message: str) -> None:
             db.execute(
@@ -565,9 +670,7 @@ async def _run_generation(
             )
             db.commit()
 
-        # Clear old index and reindex with new content
-        indexing_service.clear_index()
-        await indexing_service.index_wiki_pages(
+        await indexer.finish(
             embedding_provider=settings.active_provider,
             embedding_model=settings.active_model,
             progress_callback=indexing_progress_callback,
@@ -581,29 +684,40 @@ async def _run_generation(
             generation_result.files_regenerated or generation_result.directories_regenerated
         )
 
+        usage_json = json.dumps(usage.to_dict())
+        total = usage.total
+        logger.info(
+            f"LLM usage: {total.calls} calls ({total.cached_calls} cached), "
+            f"{total.prompt_tokens} prompt + {total.completion_tokens} completion tokens, "
+            f"${total.cost:.4f}"
+        )
+
         # Update status in BOTH databases before promoting staging.
         # Production DB: so current SSE consumers see "completed" immediately.
+        # The commit hash lets the next generation ask git what changed since.
         db.execute(
             """
             UPDATE generations
-            SET status = 'completed', completed_at = datetime('now'), changes_made = ?
+            SET status = 'completed', completed_at = datetime('now'), changes_made = ?,
+                commit_hash = ?, usage = ?
             WHERE id = ?
             """,
-            (changes_made, job_id),
+            (changes_made, generation_result.commit_hash, usage_json, job_id),
         )
         db.commit()
 
         # Also update staging DB so the promoted DB has the correct final
-        # status. The staging DB is a copy from before generation started,
-        # so it has the job with stale status "running". Without this,
+        # status. The job was recorded there before generation started,
+        # with the stale status "running". Without this,
         # SSE streams polling get_db() after promotion see "running" forever.
         staging_db.execute(
             """
             UPDATE generations
-            SET status = 'completed', completed_at = datetime('now'), changes_made = ?
+            SET status = 'completed', completed_at = datetime('now'), changes_made = ?,
+                commit_hash = ?, usage = ?
             WHERE id = ?
             """,
-            (changes_made, job_id),
+            (changes_made, generation_result.commit_hash, usage_json, job_id),
         )
         staging_db.commit()
 
@@ -625,13 +739,20 @@ async def _run_generation(
         db.execute(
             """
             UPDATE generations
-            SET status = 'failed', error_message = ?, completed_at = datetime('now')
+            SET status = 'failed', error_message = ?, completed_at = datetime('now'),
+                usage = ?
             WHERE id = ?
             """,
-            (str(e), job_id),
+            (str(e), json.dumps(usage.to_dict()), job_id),
         )
         db.commit()
     finally:
+        # Stop background indexing left running by a failed generation
+        if indexer is not None:
+            indexer.cancel()
+        if response_cache is not None:
+            logger.info("LLM response cache: %s", response_cache.stats())
+            response_cache.close()
         # Ensure staging db is closed
         if staging_db is not None:
             staging_db.close()
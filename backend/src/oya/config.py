@@ -38,7 +38,45 @@ CONFIG_SCHEMA: dict[str, dict[str, tuple[type, Any, Any, Any, str]]] = {
         "chunk_tokens": (int, 1000, 100, 10000, "Target chunk size for large files"),
         "chunk_overlap_lines": (int, 5, 0, 50, "Overlap between chunks"),
         "progress_report_interval": (int, 1, 1, 100, "Progress update frequency"),
+        "progress_updates_per_second": (
+            float,
+            4.0,
+            0.0,
+            1000.0,
+            "Max progress updates written per second (0 = unlimited)",
+        ),
         "parallel_limit": (int, 10, 1, 50, "Concurrent LLM calls"),
+        "task_timeout": (int, 600, 0, 7200, "Per-page generation timeout in seconds (0 = none)"),
+        "parse_workers": (int, 0, 0, 64, "Processes for parsing files (0 = one per CPU core)"),
+        "git_change_detection": (
+            bool,
+            True,
+            None,
+            None,
+            "Skip reading files git reports unchanged since the last clean analysis",
+        ),
+        "directory_damping": (
+            float,
+            0.0,
+            0.0,
+            1.0,
+            "Child purpose similarity below which parent directories regenerate (0 = off)",
+        ),
+        "adaptive_concurrency": (
+            bool,
+            False,
+            None,
+            None,
+            "Adapt concurrent LLM calls to provider rate limits and latency",
+        ),
+        "max_parallel_limit": (int, 32, 1, 200, "Most concurrent LLM calls when adapting"),
+        "latency_backoff_factor": (
+            float,
+            3.0,
+            0.0,
+            100.0,
+            "Call latency, relative to average, that lowers concurrency (0 = ignore)",
+        ),
     },
     "files": {
         "max_file_size_kb": (int, 500, 1, 10000, "File size limit in KB"),
@@ -81,6 +119,37 @@ CONFIG_SCHEMA: dict[str, dict[str, tuple[type, Any, Any, Any, str]]] = {
         "max_tokens": (int, 8192, 256, 32768, "Max response tokens"),
         "default_temperature": (float, 0.7, 0.0, 2.0, "Default LLM temperature"),
         "json_temperature": (float, 0.3, 0.0, 1.0, "Temperature for structured output"),
+        "max_retries": (int, 5, 0, 20, "Retries of a rate-limited LLM call"),
+        "retry_base_delay": (float, 1.0, 0.1, 60.0, "First retry backoff in seconds"),
+        "retry_max_delay": (float, 60.0, 1.0, 600.0, "Longest retry backoff in seconds"),
+        "requests_per_minute": (int, 0, 0, 100000, "LLM requests per minute (0 = unlimited)"),
+        "query_log_max_mb": (int, 50, 0, 10000, "Rotate the LLM query log at this size"),
+        "query_log_max_age_hours": (int, 0, 0, 8760, "Rotate the LLM query log at this age"),
+        "query_log_backups": (int, 5, 0, 100, "Rotated LLM query logs to keep"),
+        "query_log_compress": (bool, True, None, None, "Gzip rotated LLM query logs"),
+        "query_log_sample_rate": (
+            float,
+            1.0,
+            0.0,
+            1.0,
+            "Fraction of successful LLM calls logged (errors are always logged)",
+        ),
+        "query_log_max_chars": (
+            int,
+            0,
+            0,
+            10_000_000,
+            "Truncate logged prompts and responses to this length (0 = never)",
+        ),
+        "response_cache": (bool, False, None, None, "Cache LLM responses on disk"),
+        "response_cache_mb": (int, 512, 1, 65536, "Size limit of the LLM response cache"),
+        "response_cache_skip_phases": (
+            str,
+            "",
+            None,
+            None,
+            "Comma-separated generation phases that bypass the response cache",
+        ),
     },
     "paths": {
         "wiki_dir": (str, ".oyawiki", None, None, "Wiki directory name"),
@@ -187,6 +256,14 @@ class GenerationConfig:
     chunk_overlap_lines: int
     progress_report_interval: int
     parallel_limit: int
+    task_timeout: int = 600
+    parse_workers: int = 0
+    git_change_detection: bool = True
+    directory_damping: float = 0.0
+    progress_updates_per_second: float = 4.0
+    adaptive_concurrency: bool = False
+    max_parallel_limit: int = 32
+    latency_backoff_factor: float = 3.0
 
 
 @dataclass(frozen=True)
@@ -239,6 +316,19 @@ class LLMConfig:
     max_tokens: int
     default_temperature: float
     json_temperature: float
+    max_retries: int = 5
+    retry_base_delay: float = 1.0
+    retry_max_delay: float = 60.0
+    requests_per_minute: int = 0
+    query_log_max_mb: int = 50
+    query_log_max_age_hours: int = 0
+    query_log_backups: int = 5
+    query_log_compress: bool = True
+    query_log_sample_rate: float = 1.0
+    query_log_max_chars: int = 0
+    response_cache: bool = False
+    response_cache_mb: int = 512
+    response_cache_skip_phases: str = ""
 
 
 @dataclass(frozen=True)
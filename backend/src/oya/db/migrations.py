@@ -3,7 +3,7 @@
 from oya.db.connection import Database
 
 # Schema version for tracking migrations
-SCHEMA_VERSION = 7
+SCHEMA_VERSION = 10
 
 SCHEMA_SQL = """
 -- Schema version tracking
@@ -27,7 +27,9 @@ CREATE TABLE IF NOT EXISTS generations (
     total_steps INTEGER,  -- Total steps in current phase
     error_message TEXT,
     metadata TEXT,  -- JSON for additional data
-    changes_made INTEGER  -- Boolean: whether any content was regenerated
+    changes_made INTEGER,  -- Boolean: whether any content was regenerated
+    concurrency_limit INTEGER,  -- LLM calls currently allowed in flight
+    usage TEXT  -- JSON: LLM tokens and cost by phase and page
 );
 
 -- Wiki page metadata
@@ -106,6 +108,18 @@ CREATE TABLE IF NOT EXISTS code_index (
     UNIQUE(file_path, symbol_name)
 );
 
+-- Checkpoints of an in-progress generation
+-- Summaries of file/directory pages completed since the last successful
+-- generation, so an interrupted generation can resume without repeating LLM calls
+CREATE TABLE IF NOT EXISTS generation_checkpoints (
+    kind TEXT NOT NULL,  -- 'file' or 'directory'
+    target TEXT NOT NULL,  -- File or directory path
+    source_hash TEXT NOT NULL,  -- Content hash or directory signature the page was built from
+    summary TEXT NOT NULL,  -- JSON-serialized FileSummary or DirectorySummary
+    created_at TEXT NOT NULL DEFAULT (datetime('now')),
+    PRIMARY KEY (kind, target)
+);
+
 -- Indexes for common queries
 CREATE INDEX IF NOT EXISTS idx_wiki_pages_type ON wiki_pages(type);
 CREATE INDEX IF NOT EXISTS idx_wiki_pages_target ON wiki_pages(target);
@@ -179,6 +193,24 @@ def run_migrations(db: Database) -> None:
                 # Column may already exist if schema was recreated
                 pass
 
+        # Version 9 migration: Add concurrency_limit column to generations table
+        if current_version >= 1 and current_version < 9:
+            try:
+                db.execute("ALTER TABLE generations ADD COLUMN concurrency_limit INTEGER")
+                db.commit()
+            except Exception:
+                # Column may already exist if schema was recreated
+                pass
+
+        # Version 10 migration: Add usage column to generations table
+        if current_version >= 1 and current_version < 10:
+            try:
+                db.execute("ALTER TABLE generations ADD COLUMN usage TEXT")
+                db.commit()
+            except Exception:
+                # Column may already exist if schema was recreated
+                pass
+
         # Record schema version
         db.execute(
             "INSERT OR REPLACE INTO schema_version (version) VALUES (?)",
@@ -0,0 +1,23 @@
+"""File writing helpers shared by the wiki builders.
+
+A staging build shares unchanged files with the production wiki through
+hardlinks (see oya.generation.staging). Writing into such a file in place
+would change the production copy as well, so files in a wiki are written to
+a temporary sibling and renamed over the original, which gives the staging
+copy its own inode and never leaves a half-written file behind.
+"""
+
+import os
+from pathlib import Path
+
+
+def replace_text(path: Path, content: str) -> None:
+    """Write a text file by replacing it rather than rewriting it in place.
+
+    Args:
+        path: File to write.
+        content: Text to write, encoded as UTF-8.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
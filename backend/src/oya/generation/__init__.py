@@ -8,6 +8,7 @@ from oya.generation.chunking import (
     Chunk,
     chunk_by_symbols,
     chunk_file_content,
+    chunk_large_file,
     estimate_tokens,
 )
 from oya.generation.overview import (
@@ -49,6 +50,7 @@ __all__ = [
     "Chunk",
     "chunk_by_symbols",
     "chunk_file_content",
+    "chunk_large_file",
     "estimate_tokens",
     # Overview Generator
     "GeneratedPage",
@@ -237,3 +237,103 @@ def chunk_by_symbols(
         chunks.append(chunk)
 
     return chunks
+
+
+def chunk_large_file(
+    content: str,
+    file_path: str,
+    symbols: list[ParsedSymbol],
+    max_tokens: int,
+) -> list[Chunk]:
+    """Split a large file into symbol-aligned chunks that cover every line.
+
+    Symbols too large for one chunk are split along their nested symbols (e.g.
+    a class into its methods). The symbol chunks are then widened so that
+    together they cover the whole file, including imports and code between
+    symbols. Chunks still far over the limit are split by lines.
+
+    Args:
+        content: File content to chunk.
+        file_path: Path to the source file.
+        symbols: All ParsedSymbol objects of the file, including nested ones.
+        max_tokens: Target tokens per chunk.
+
+    Returns:
+        Chunks in file order, each listing the symbols that start inside it.
+    """
+    if not content:
+        return []
+
+    lines = content.split("\n")
+    units = _symbol_units(symbols, lines, max_tokens)
+    if not units:
+        return chunk_file_content(content, file_path, max_tokens, overlap_lines=0)
+
+    symbol_chunks = chunk_by_symbols(content, file_path, units, max_tokens)
+
+    chunks: list[Chunk] = []
+    for idx, chunk in enumerate(symbol_chunks):
+        start_line = 1 if idx == 0 else chunk.start_line
+        if idx + 1 < len(symbol_chunks):
+            end_line = symbol_chunks[idx + 1].start_line - 1
+        else:
+            end_line = len(lines)
+        chunk_content = "\n".join(lines[start_line - 1 : end_line])
+
+        if estimate_tokens(chunk_content) > max_tokens * 2:
+            # A single oversized symbol: fall back to line-based chunks
+            parts = chunk_file_content(chunk_content, file_path, max_tokens, overlap_lines=0)
+            for part in parts:
+                part.start_line += start_line - 1
+                part.end_line += start_line - 1
+        else:
+            parts = [
+                Chunk(
+                    content=chunk_content,
+                    file_path=file_path,
+                    start_line=start_line,
+                    end_line=end_line,
+                )
+            ]
+
+        for part in parts:
+            part.symbols = [s for s in symbols if part.start_line <= s.start_line <= part.end_line]
+            part.chunk_index = len(chunks)
+            chunks.append(part)
+
+    return chunks
+
+
+def _symbol_units(
+    symbols: list[ParsedSymbol], lines: list[str], max_tokens: int
+) -> list[ParsedSymbol]:
+    """Select non-overlapping symbols to chunk by, descending into large ones.
+
+    Args:
+        symbols: All symbols of the file, including nested ones.
+        lines: Lines of the file.
+        max_tokens: Target tokens per chunk.
+
+    Returns:
+        Symbols in file order, none nested in another.
+    """
+    ordered = sorted(symbols, key=lambda s: (s.start_line, -s.end_line))
+    units: list[ParsedSymbol] = []
+
+    def visit(group: list[ParsedSymbol]) -> None:
+        idx = 0
+        while idx < len(group):
+            symbol = group[idx]
+            end = idx + 1
+            while end < len(group) and group[end].end_line <= symbol.end_line:
+                end += 1
+            children = group[idx + 1 : end]
+            symbol_text = "\n".join(lines[symbol.start_line - 1 : symbol.end_line])
+            if children and estimate_tokens(symbol_text) > max_tokens:
+                visit(children)
+            else:
+                units.append(symbol)
+            idx = end
+
+    visit(ordered)
+    return units
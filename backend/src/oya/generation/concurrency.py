@@ -0,0 +1,424 @@
+"""Bounded concurrency helpers for LLM-bound generation work.
+
+Generation phases fan out many independent LLM calls. Running them in fixed
+batches means the slowest call of each batch decides when the next batch can
+start. The helpers here keep a sliding window of work in flight instead: a new
+item starts as soon as any slot frees up.
+
+Phases can also overlap: a ConcurrencyBudget caps the LLM calls in flight
+across every phase of a run, and a CompletionTracker lets one phase wait for
+the specific results it needs from another phase that is still running. An
+AdaptiveConcurrency controller lets the budget find the provider's capacity
+instead of using a fixed limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable, Mapping
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
+
+
+class TaskTimeoutError(Exception):
+    """Raised when a single unit of generation work exceeds its timeout."""
+
+    def __init__(self, item: object, timeout: float):
+        self.item = item
+        self.timeout = timeout
+        super().__init__(f"Task for {item!r} timed out after {timeout:g}s")
+
+
+class AdaptiveConcurrency:
+    """AIMD controller of how many LLM calls may be in flight.
+
+    The window grows by about one call for every window's worth of healthy
+    calls (additive increase), and is cut by decrease_factor when the
+    provider rate-limits a call, a call times out, or a provider response
+    takes much longer than usual (multiplicative decrease). Only calls
+    started after the last decrease can cause another, so one burst of
+    failures from the same window cuts it once.
+
+    Latency is judged against an average of the provider response times
+    reported to on_latency. A latency spike restarts that average from the
+    slow call, so a lasting shift in latency (e.g. to a phase with larger
+    prompts) cuts the window once rather than on every later call.
+    """
+
+    # Latency samples observed before latency spikes are trusted
+    _LATENCY_WARMUP = 10
+    # Weight of each new sample in the average latency
+    _LATENCY_SMOOTHING = 0.1
+
+    def __init__(
+        self,
+        initial: int,
+        maximum: int,
+        minimum: int = 1,
+        decrease_factor: float = 0.5,
+        latency_factor: float = 3.0,
+    ):
+        """Initialize the controller.
+
+        Args:
+            initial: Calls allowed in flight at first.
+            maximum: Most calls ever allowed in flight.
+            minimum: Fewest calls allowed in flight.
+            decrease_factor: Factor the window is multiplied by on congestion.
+            latency_factor: A response taking this many times the average latency
+                counts as congestion (0 ignores latency).
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.decrease_factor = decrease_factor
+        self.latency_factor = latency_factor
+        self.window = float(min(max(initial, self.minimum), self.maximum))
+        self._average_latency: float | None = None
+        self._samples = 0
+        self._last_decrease = float("-inf")
+
+    @property
+    def limit(self) -> int:
+        """Calls currently allowed in flight."""
+        return int(self.window)
+
+    def on_success(self, started: float) -> None:
+        """Record a call that completed.
+
+        Args:
+            started: time.monotonic() when the call started.
+        """
+        self.window = min(float(self.maximum), self.window + 1 / self.window)
+
+    def on_latency(self, started: float, latency: float) -> None:
+        """Record how long the provider took to answer one request.
+
+        Only provider responses should be reported: not cached responses, and
+        not time spent waiting for a rate limiter or before a retry.
+
+        Args:
+            started: time.monotonic() when the request was sent.
+            latency: Seconds the provider took to respond.
+        """
+        average = self._average_latency
+        spike = (
+            average is not None
+            and self.latency_factor > 0
+            and self._samples >= self._LATENCY_WARMUP
+            and latency > average * self.latency_factor
+        )
+        if spike:
+            # Judge later calls against the new latency, not the old average
+            self._average_latency = latency
+            self._samples = 1
+            self.on_congestion(started, reason=f"latency {latency:.1f}s")
+            return
+        self._samples += 1
+        if average is None:
+            self._average_latency = latency
+        else:
+            self._average_latency = average + self._LATENCY_SMOOTHING * (latency - average)
+
+    def on_congestion(self, started: float, reason: str = "rate limit") -> None:
+        """Record a call that hit a rate limit, timed out or was very slow.
+
+        Args:
+            started: time.monotonic() when the call started.
+            reason: What happened, for logging.
+        """
+        if started < self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        previous = self.limit
+        self.window = max(float(self.minimum), self.window * self.decrease_factor)
+        if self.limit != previous:
+            logger.info(f"LLM concurrency {previous} -> {self.limit} ({reason})")
+
+
+class ConcurrencyBudget:
+    """Limit on LLM calls in flight, shared by every phase of a generation run.
+
+    Overlapping phases draw from the same budget, so running them concurrently
+    never raises the total number of calls above the limit. The limit is fixed,
+    or follows an AdaptiveConcurrency controller, which is told how each call
+    went. The timeout applies to each call itself, not to the time spent
+    waiting for a slot.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        timeout: float | None = None,
+        controller: AdaptiveConcurrency | None = None,
+    ):
+        """Initialize the budget.
+
+        Args:
+            limit: Maximum number of concurrent calls, unless a controller is given.
+            timeout: Optional per-call timeout in seconds.
+            controller: Optional controller adjusting the limit as calls complete.
+        """
+        self._limit = max(1, limit)
+        self.timeout = timeout
+        self.controller = controller
+        self._in_flight = 0
+        self._released = asyncio.Event()
+
+    @property
+    def limit(self) -> int:
+        """Calls currently allowed in flight."""
+        return self.controller.limit if self.controller is not None else self._limit
+
+    @property
+    def max_limit(self) -> int:
+        """Most calls the budget may ever allow in flight."""
+        return self.controller.maximum if self.controller is not None else self._limit
+
+    async def run(self, item: object, call: Callable[[], Awaitable[R]]) -> R:
+        """Run one call once a slot is free.
+
+        Args:
+            item: The unit of work, reported if the call times out.
+            call: Zero-argument callable creating the awaitable to run.
+
+        Returns:
+            The call's result.
+
+        Raises:
+            TaskTimeoutError: If the call exceeds the budget's timeout.
+        """
+        while self._in_flight >= self.limit:
+            self._released.clear()
+            await self._released.wait()
+        self._in_flight += 1
+        started = time.monotonic()
+        try:
+            result = await _run_one(lambda _: call(), item, self.timeout)
+        except TaskTimeoutError:
+            if self.controller is not None:
+                self.controller.on_congestion(started, reason="timeout")
+            raise
+        finally:
+            self._in_flight -= 1
+            self._released.set()
+        if self.controller is not None:
+            # Waiters woken above check the limit after this update
+            self.controller.on_success(started)
+        return result
+
+
+class CompletionTracker(Generic[T]):
+    """Tracks which keyed units of a running phase have completed.
+
+    The producing phase first declares the keys it will complete later with
+    expect(); any other key counts as already complete. Consumers block in
+    wait() until the producer has declared its work and every key they need
+    has completed. close() releases all waiters, and must be called when the
+    producer finishes or fails so that no consumer waits forever.
+    """
+
+    def __init__(self) -> None:
+        self._declared = asyncio.Event()
+        self._pending: dict[T, asyncio.Event] = {}
+
+    def expect(self, keys: Iterable[T]) -> None:
+        """Declare the keys that will complete later.
+
+        Args:
+            keys: Keys of the units still to be produced.
+        """
+        for key in keys:
+            self._pending.setdefault(key, asyncio.Event())
+        self._declared.set()
+
+    def complete(self, key: T) -> None:
+        """Mark one key as completed.
+
+        Args:
+            key: Key of the completed unit.
+        """
+        event = self._pending.get(key)
+        if event is not None:
+            event.set()
+
+    def close(self) -> None:
+        """Release every waiter, whether or not its keys completed."""
+        self._declared.set()
+        for event in self._pending.values():
+            event.set()
+
+    async def wait(self, keys: Iterable[T]) -> None:
+        """Wait until every given key has completed.
+
+        Args:
+            keys: Keys to wait for.
+        """
+        await self._declared.wait()
+        for key in keys:
+            event = self._pending.get(key)
+            if event is not None:
+                await event.wait()
+
+
+async def run_concurrently(*calls: Awaitable[Any]) -> list[Any]:
+    """Await several awaitables concurrently and return their results in order.
+
+    They start in the order given. If one raises, the others are cancelled
+    and the exception propagates.
+
+    Args:
+        calls: Awaitables to run.
+
+    Returns:
+        Results in the order of `calls`.
+    """
+    tasks = [asyncio.ensure_future(call) for call in calls]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def run_bounded(
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[R]],
+    limit: int,
+    timeout: float | None = None,
+) -> AsyncGenerator[tuple[T, R], None]:
+    """Run worker over items with at most `limit` calls in flight.
+
+    Results are yielded in completion order as soon as each one finishes.
+    A freed slot is refilled immediately, so one slow call only occupies a
+    single slot rather than stalling a whole batch.
+
+    If any worker raises (including a timeout), all outstanding work is
+    cancelled and the exception propagates to the consumer. Closing the
+    iterator early, or cancelling the consumer, also cancels outstanding work.
+
+    Args:
+        items: Work items to process.
+        worker: Async callable invoked once per item.
+        limit: Maximum number of concurrent worker calls.
+        timeout: Optional per-item timeout in seconds.
+
+    Yields:
+        Tuples of (item, result) in completion order.
+
+    Raises:
+        TaskTimeoutError: If a single worker call exceeds `timeout`.
+    """
+    limit = max(1, limit)
+    pending_items = iter(items)
+    in_flight: dict[asyncio.Task, T] = {}
+
+    def fill() -> None:
+        while len(in_flight) < limit:
+            try:
+                item = next(pending_items)
+            except StopIteration:
+                return
+            in_flight[asyncio.create_task(_run_one(worker, item, timeout))] = item
+
+    try:
+        fill()
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = in_flight.pop(task)
+                # Raises the worker's exception, which cancels the rest below
+                yield item, task.result()
+            fill()
+    finally:
+        await _cancel_all(in_flight)
+
+
+async def run_dependency_graph(
+    dependencies: Mapping[T, Iterable[T]],
+    worker: Callable[[T], Awaitable[R]],
+    limit: int,
+    timeout: float | None = None,
+) -> AsyncGenerator[tuple[T, R], None]:
+    """Run worker over a dependency graph with at most `limit` calls in flight.
+
+    Each node starts as soon as all of its prerequisites have finished, so
+    independent branches of the graph proceed concurrently. Nodes that become
+    ready at the same time start in the order they appear in `dependencies`.
+    Prerequisites that are not themselves nodes of the graph are ignored.
+
+    Failure and cancellation behave as in run_bounded.
+
+    Args:
+        dependencies: Mapping of node to the nodes it depends on.
+        worker: Async callable invoked once per node.
+        limit: Maximum number of concurrent worker calls.
+        timeout: Optional per-node timeout in seconds.
+
+    Yields:
+        Tuples of (node, result) in completion order.
+
+    Raises:
+        ValueError: If the graph contains a cycle.
+        TaskTimeoutError: If a single worker call exceeds `timeout`.
+    """
+    limit = max(1, limit)
+    waiting: dict[T, set[T]] = {}
+    dependents: dict[T, list[T]] = {node: [] for node in dependencies}
+    for node, prerequisites in dependencies.items():
+        waiting[node] = {p for p in prerequisites if p in dependents and p != node}
+        for prerequisite in waiting[node]:
+            dependents[prerequisite].append(node)
+
+    ready = deque(node for node, prerequisites in waiting.items() if not prerequisites)
+    in_flight: dict[asyncio.Task, T] = {}
+    remaining = len(waiting)
+
+    def fill() -> None:
+        while ready and len(in_flight) < limit:
+            node = ready.popleft()
+            in_flight[asyncio.create_task(_run_one(worker, node, timeout))] = node
+
+    try:
+        fill()
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                node = in_flight.pop(task)
+                result = task.result()
+                remaining -= 1
+                for dependent in dependents[node]:
+                    waiting[dependent].discard(node)
+                    if not waiting[dependent]:
+                        ready.append(dependent)
+                yield node, result
+            fill()
+        if remaining:
+            raise ValueError(f"Dependency cycle among {remaining} unfinished nodes")
+    finally:
+        await _cancel_all(in_flight)
+
+
+async def _run_one(worker: Callable[[T], Awaitable[R]], item: T, timeout: float | None) -> R:
+    """Invoke worker for one item, enforcing the optional timeout."""
+    if timeout is None:
+        return await worker(item)
+    try:
+        return await asyncio.wait_for(worker(item), timeout)
+    except asyncio.TimeoutError as e:
+        raise TaskTimeoutError(item, timeout) from e
+
+
+async def _cancel_all(in_flight: dict[asyncio.Task, T]) -> None:
+    """Cancel outstanding tasks and wait for them to unwind."""
+    for task in in_flight:
+        task.cancel()
+    if in_flight:
+        await asyncio.gather(*in_flight, return_exceptions=True)
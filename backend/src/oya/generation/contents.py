@@ -0,0 +1,157 @@
+"""Memory-bounded access to repository file contents during generation.
+
+The analysis phase reads every file once to parse it. Holding all of that text
+until generation finishes makes memory grow with the size of the repository,
+so FileContents keeps only a bounded, least-recently-used set of contents in
+memory and re-reads the rest from disk on demand. The hash, size and line
+count of every file are recorded up front, so incremental checks and code
+metrics never need the content itself.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+from oya.parsing.cache import hash_content
+
+logger = logging.getLogger(__name__)
+
+# Characters of file content kept in memory at once; larger repositories
+# re-read evicted files from disk when they are needed again
+CONTENT_CACHE_CHARS = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ContentInfo:
+    """What generation needs to know about a file without holding its content.
+
+    Attributes:
+        content_hash: SHA-256 hex digest of the content read during analysis.
+        size: Length of the content in characters.
+        lines: Number of lines in the content.
+    """
+
+    content_hash: str
+    size: int
+    lines: int
+
+    @classmethod
+    def of(cls, content: str) -> ContentInfo:
+        """Describe a file's content."""
+        return cls(
+            content_hash=hash_content(content), size=len(content), lines=len(content.splitlines())
+        )
+
+
+class FileContents(Mapping[str, str]):
+    """Read-only mapping of file path to content, loaded on demand.
+
+    Contents are cached in least-recently-used order up to max_chars. A file
+    evicted from the cache is read again from the repository; if it changed on
+    disk since analysis, the new content is returned and a warning logged, and
+    the next generation picks up the change through its hash.
+    """
+
+    def __init__(self, repo_path: Path, max_chars: int = CONTENT_CACHE_CHARS):
+        """Initialize an empty store.
+
+        Args:
+            repo_path: Repository root that file paths are relative to.
+            max_chars: Characters of content to keep in memory at once.
+        """
+        self.repo_path = Path(repo_path)
+        self.max_chars = max_chars
+        self._info: dict[str, ContentInfo] = {}
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cached_chars = 0
+        # Contents read back from disk after eviction (for tests and logging)
+        self.reloads = 0
+
+    def add(self, file_path: str, content: str) -> None:
+        """Record a file read during analysis.
+
+        Args:
+            file_path: File path relative to the repository root.
+            content: Content read from disk.
+        """
+        self._info[file_path] = ContentInfo.of(content)
+        self._remember(file_path, content)
+
+    def add_info(self, file_path: str, info: ContentInfo) -> None:
+        """Record a file that analysis did not read, e.g. one git reports unchanged.
+
+        Its content is read from the repository on first access.
+
+        Args:
+            file_path: File path relative to the repository root.
+            info: Known hash, size and line count of the file.
+        """
+        self._info[file_path] = info
+
+    def info(self, file_path: str) -> ContentInfo | None:
+        """Get the hash, size and line count of a file without loading it."""
+        return self._info.get(file_path)
+
+    def __getitem__(self, file_path: str) -> str:
+        if file_path not in self._info:
+            raise KeyError(file_path)
+        content = self._cache.get(file_path)
+        if content is not None:
+            self._cache.move_to_end(file_path)
+            return content
+        return self._load(file_path)
+
+    def __contains__(self, file_path: object) -> bool:
+        return file_path in self._info
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._info)
+
+    def __len__(self) -> int:
+        return len(self._info)
+
+    def _load(self, file_path: str) -> str:
+        """Read an evicted file back from the repository."""
+        try:
+            content = (self.repo_path / file_path).read_text(encoding="utf-8", errors="ignore")
+        except OSError as e:
+            logger.warning(f"Failed to re-read {file_path}: {e}")
+            return ""
+        self.reloads += 1
+        if hash_content(content) != self._info[file_path].content_hash:
+            logger.warning(f"{file_path} changed on disk during generation")
+        self._remember(file_path, content)
+        return content
+
+    def _remember(self, file_path: str, content: str) -> None:
+        """Cache content, evicting the least recently used files over budget."""
+        previous = self._cache.pop(file_path, None)
+        if previous is not None:
+            self._cached_chars -= len(previous)
+        if len(content) > self.max_chars:
+            return
+        self._cache[file_path] = content
+        self._cached_chars += len(content)
+        while self._cached_chars > self.max_chars:
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_chars -= len(evicted)
+
+
+def content_info(file_contents: Mapping[str, str], file_path: str) -> ContentInfo | None:
+    """Describe a file, without loading it when the contents are a FileContents.
+
+    Args:
+        file_contents: Mapping of file paths to contents.
+        file_path: File to describe.
+
+    Returns:
+        ContentInfo for the file, or None if it was not read.
+    """
+    if isinstance(file_contents, FileContents):
+        return file_contents.info(file_path)
+    content = file_contents.get(file_path)
+    return ContentInfo.of(content) if content is not None else None
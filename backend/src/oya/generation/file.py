@@ -2,31 +2,74 @@
 """File page generator."""
 
 import logging
+from collections.abc import Awaitable
 from pathlib import Path
 
-from oya.config import EXTENSION_LANGUAGES
+from oya.config import EXTENSION_LANGUAGES, ConfigError, load_settings
+from oya.generation.chunking import Chunk, chunk_large_file, estimate_tokens
+from oya.generation.concurrency import ConcurrencyBudget, run_concurrently
 from oya.generation.mermaid import ClassDiagramGenerator, DependencyGraphGenerator
 from oya.generation.mermaid_validator import validate_mermaid
 from oya.generation.overview import GeneratedPage
-from oya.generation.prompts import SYSTEM_PROMPT, get_file_prompt
+from oya.generation.prompts import (
+    SYSTEM_PROMPT,
+    get_file_chunk_prompt,
+    get_file_prompt,
+    get_file_sections_merge_prompt,
+)
 from oya.generation.summaries import FileSummary, SummaryParser, path_to_slug
 from oya.parsing.models import ParsedSymbol
 
 logger = logging.getLogger(__name__)
 
+# Share of the context limit a file's content may use in a single prompt; the
+# rest is left for instructions, symbols, synopsis and the response. Larger
+# files are summarized chunk by chunk (map) and the summaries combined (reduce).
+LARGE_FILE_CONTEXT_SHARE = 0.5
+
+# Most chunk summaries combined by one LLM call. When the summaries of a file
+# exceed the same context share, consecutive ones are combined in tiers.
+SECTION_MERGE_FAN_IN = 8
+
+# LLM calls in flight for one large file when no shared budget bounds them
+LARGE_FILE_CALL_LIMIT = 4
+
 
 class FileGenerator:
     """Generates file documentation pages."""
 
-    def __init__(self, llm_client, repo):
+    def __init__(
+        self,
+        llm_client,
+        repo,
+        context_limit: int | None = None,
+        chunk_tokens: int | None = None,
+    ):
         """Initialize the file generator.
 
         Args:
             llm_client: LLM client for generation.
             repo: Repository wrapper for context.
+            context_limit: Maximum tokens allowed in a single LLM call.
+            chunk_tokens: Target chunk size for files too large for one call.
         """
         self.llm_client = llm_client
         self.repo = repo
+        if context_limit is None or chunk_tokens is None:
+            try:
+                settings = load_settings()
+                if context_limit is None:
+                    context_limit = settings.generation.context_limit
+                if chunk_tokens is None:
+                    chunk_tokens = settings.generation.chunk_tokens
+            except (ValueError, OSError, ConfigError):
+                # Settings not available
+                if context_limit is None:
+                    context_limit = 100_000  # Default from CONFIG_SCHEMA
+                if chunk_tokens is None:
+                    chunk_tokens = 1000  # Default from CONFIG_SCHEMA
+        self.context_limit = context_limit
+        self.chunk_tokens = chunk_tokens
         self._parser = SummaryParser()
         self._class_diagram_gen = ClassDiagramGenerator()
         self._dep_diagram_gen = DependencyGraphGenerator()
@@ -43,9 +86,14 @@ class FileGenerator:
         notes: list[dict] | None = None,
         synopsis: str | None = None,
         call_site_synopsis: str | None = None,
+        budget: ConcurrencyBudget | None = None,
     ) -> tuple[GeneratedPage, FileSummary]:
         """Generate documentation for a file.
 
+        Files too large for one prompt (see is_large) are documented with
+        map-reduce: their chunks are summarized concurrently, then the page and
+        summary are generated from the chunk summaries.
+
         Args:
             file_path: Path to the file being documented.
             content: Content of the file.
@@ -57,12 +105,19 @@ class FileGenerator:
             notes: Optional list of human-authored notes to incorporate into documentation.
             synopsis: Optional code synopsis showing key usage patterns for this file.
             call_site_synopsis: Optional real usage example extracted from call sites in codebase.
+            budget: Optional budget each LLM call of this file takes a slot from.
 
         Returns:
             Tuple of (GeneratedPage with file documentation, FileSummary extracted from output).
         """
         language = self._detect_language(file_path)
 
+        section_summaries = None
+        if self.is_large(content):
+            section_summaries = await self._summarize_chunks(
+                file_path, content, symbols, parsed_symbols or [], language, budget
+            )
+
         prompt = get_file_prompt(
             file_path=file_path,
             content=content,
@@ -73,13 +128,11 @@ class FileGenerator:
             notes=notes,
             synopsis=synopsis,
             call_site_synopsis=call_site_synopsis,
+            section_summaries=section_summaries,
         )
 
         # First attempt
-        generated_content = await self.llm_client.generate(
-            prompt=prompt,
-            system_prompt=SYSTEM_PROMPT,
-        )
+        generated_content = await self._generate(file_path, prompt, budget)
 
         # Parse the YAML summary block and get clean markdown
         clean_content, file_summary = self._parser.parse_file_summary(generated_content, file_path)
@@ -88,11 +141,8 @@ class FileGenerator:
         if file_summary.purpose == "Unknown":
             logger.warning(f"YAML parsing failed for {file_path}, retrying...")
 
-            # Retry once with same prompt
-            generated_content = await self.llm_client.generate(
-                prompt=prompt,
-                system_prompt=SYSTEM_PROMPT,
-            )
+            # Retry once with same prompt, bypassing the cached bad response
+            generated_content = await self._generate(file_path, prompt, budget, refresh_cache=True)
             clean_content, file_summary = self._parser.parse_file_summary(
                 generated_content, file_path
             )
@@ -118,6 +168,147 @@ class FileGenerator:
 
         return page, file_summary
 
+    def is_large(self, content: str) -> bool:
+        """Check whether a file is too large to document in a single prompt.
+
+        Args:
+            content: Content of the file.
+
+        Returns:
+            True if the file should be documented chunk by chunk.
+        """
+        return estimate_tokens(content) > self.context_limit * LARGE_FILE_CONTEXT_SHARE
+
+    async def _summarize_chunks(
+        self,
+        file_path: str,
+        content: str,
+        symbols: list[dict],
+        parsed_symbols: list[ParsedSymbol],
+        language: str,
+        budget: ConcurrencyBudget | None,
+    ) -> list[tuple[int, int, str]]:
+        """Summarize the symbol-aligned chunks of a large file concurrently.
+
+        Args:
+            file_path: Path to the file being documented.
+            content: Content of the file.
+            symbols: Symbol dictionaries defined in the file.
+            parsed_symbols: ParsedSymbol objects used to align chunks with code.
+            language: Language identifier for syntax highlighting.
+            budget: Optional budget each chunk call takes a slot from.
+
+        Returns:
+            (start_line, end_line, summary) tuples in file order.
+        """
+        chunks = chunk_large_file(content, file_path, parsed_symbols, self.chunk_tokens)
+        logger.info(f"Documenting {file_path} in {len(chunks)} chunks")
+        if budget is None:
+            budget = ConcurrencyBudget(LARGE_FILE_CALL_LIMIT)
+
+        def summarize(chunk: Chunk):
+            prompt = get_file_chunk_prompt(
+                file_path=file_path,
+                content=chunk.content,
+                start_line=chunk.start_line,
+                end_line=chunk.end_line,
+                part=chunk.chunk_index + 1,
+                total_parts=len(chunks),
+                symbols=[
+                    s for s in symbols if chunk.start_line <= s.get("line", 0) <= chunk.end_line
+                ],
+                language=language,
+            )
+            return self._generate(f"{file_path}:{chunk.start_line}", prompt, budget)
+
+        summaries = await run_concurrently(*(summarize(chunk) for chunk in chunks))
+        sections = [
+            (chunk.start_line, chunk.end_line, summary) for chunk, summary in zip(chunks, summaries)
+        ]
+        return await self._reduce_sections(file_path, sections, budget)
+
+    async def _reduce_sections(
+        self,
+        file_path: str,
+        sections: list[tuple[int, int, str]],
+        budget: ConcurrencyBudget,
+    ) -> list[tuple[int, int, str]]:
+        """Combine chunk summaries in tiers until they fit in the page prompt.
+
+        Each tier combines runs of consecutive summaries, at most
+        SECTION_MERGE_FAN_IN of them and within the context share where
+        possible, so every tier shrinks the list.
+
+        Args:
+            file_path: Path to the file being documented.
+            sections: (start_line, end_line, summary) tuples in file order.
+            budget: Budget each merge call takes a slot from.
+
+        Returns:
+            (start_line, end_line, summary) tuples in file order.
+        """
+        limit = self.context_limit * LARGE_FILE_CONTEXT_SHARE
+        while len(sections) > 1 and _sections_tokens(sections) > limit:
+            groups: list[list[tuple[int, int, str]]] = []
+            for section in sections:
+                group = groups[-1] if groups else None
+                if (
+                    group is None
+                    or len(group) >= SECTION_MERGE_FAN_IN
+                    or (len(group) > 1 and _sections_tokens([*group, section]) > limit)
+                ):
+                    groups.append([section])
+                else:
+                    group.append(section)
+            logger.info(f"Combining {len(sections)} section summaries of {file_path}")
+            sections = await run_concurrently(
+                *(self._merge_sections(file_path, group, budget) for group in groups)
+            )
+        return sections
+
+    async def _merge_sections(
+        self,
+        file_path: str,
+        group: list[tuple[int, int, str]],
+        budget: ConcurrencyBudget,
+    ) -> tuple[int, int, str]:
+        """Combine the summaries of consecutive chunks with one LLM call."""
+        start_line, end_line = group[0][0], group[-1][1]
+        if len(group) == 1:
+            return group[0]
+        prompt = get_file_sections_merge_prompt(file_path, group)
+        summary = await self._generate(f"{file_path}:{start_line}-{end_line}", prompt, budget)
+        return start_line, end_line, summary
+
+    async def _generate(
+        self,
+        item: str,
+        prompt: str,
+        budget: ConcurrencyBudget | None,
+        refresh_cache: bool = False,
+    ) -> str:
+        """Make one LLM call, in a budget slot if a budget is given.
+
+        Args:
+            item: The unit of work, reported if the call times out.
+            prompt: Prompt to send.
+            budget: Optional concurrency budget.
+            refresh_cache: Ignore a cached response for this prompt.
+
+        Returns:
+            Generated text.
+        """
+
+        def call() -> Awaitable[str]:
+            response: Awaitable[str] = self.llm_client.generate(
+                prompt=prompt, system_prompt=SYSTEM_PROMPT, refresh_cache=refresh_cache
+            )
+            return response
+
+        if budget is None:
+            return await call()
+        return await budget.run(item, call)
+
     def _detect_language(self, file_path: str) -> str:
         """Detect the programming language from the file extension.
 
@@ -179,3 +370,8 @@ class FileGenerator:
             lines.append(f"```mermaid\n{diagram}\n```")
 
         return "\n".join(lines)
+
+
+def _sections_tokens(sections: list[tuple[int, int, str]]) -> int:
+    """Estimate the tokens taken by section summaries in a prompt."""
+    return sum(estimate_tokens(summary) for _, _, summary in sections)
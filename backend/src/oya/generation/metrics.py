@@ -7,19 +7,22 @@ across architectural layers.
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Mapping
 
+from oya.generation.contents import content_info
 from oya.generation.summaries import CodeMetrics, FileSummary
 
 
 def compute_code_metrics(
     file_summaries: list[FileSummary],
-    file_contents: dict[str, str],
+    file_contents: Mapping[str, str],
 ) -> CodeMetrics:
     """Compute code metrics from analyzed files.
 
     Args:
         file_summaries: List of FileSummary objects with layer classifications.
-        file_contents: Mapping of file paths to their contents for LOC counting.
+        file_contents: Mapping of file paths to their contents for LOC counting. Line
+            counts recorded by a FileContents are used without loading files.
 
     Returns:
         CodeMetrics with file counts and lines of code by layer.
@@ -31,10 +34,9 @@ def compute_code_metrics(
         layer = summary.layer
         files_by_layer[layer] += 1
 
-        content = file_contents.get(summary.file_path, "")
-        if content:
-            loc = len(content.splitlines())
-            lines_by_layer[layer] += loc
+        info = content_info(file_contents, summary.file_path)
+        if info is not None:
+            lines_by_layer[layer] += info.lines
 
     return CodeMetrics(
         total_files=len(file_summaries),
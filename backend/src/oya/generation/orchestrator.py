@@ -11,24 +11,42 @@ of wiki generation in a bottom-up approach:
 5. Architecture - Generate architecture documentation using SynthesisMap
 6. Overview - Generate project overview using SynthesisMap
 7. Workflows - Generate workflow documentation from entry points
+
+Phases overlap where their inputs allow: a directory is generated as soon as
+its own files are done, and architecture, overview and workflows are generated
+concurrently. All phases share one budget of concurrent LLM calls.
 """
 
 import asyncio
+import difflib
+import functools
 import hashlib
 import json
 import logging
+import re
 import sqlite3
+import time
 import tomllib
 import uuid
 from collections import defaultdict
+from collections.abc import Mapping
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, Iterator
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Coroutine, ParamSpec, TypeVar
 
 from oya.generation.architecture import ArchitectureGenerator
+from oya.generation.contents import ContentInfo, FileContents, content_info
+from oya.generation.concurrency import (
+    CompletionTracker,
+    AdaptiveConcurrency,
+    ConcurrencyBudget,
+    run_bounded,
+    run_concurrently,
+    run_dependency_graph,
+)
 from oya.generation.frontmatter import build_frontmatter
 from oya.generation.directory import DirectoryGenerator
 from oya.generation.file import FileGenerator
@@ -39,28 +57,44 @@ from oya.generation.snippets import extract_call_snippet, is_test_file, select_b
 from oya.graph import build_graph, load_graph, save_graph
 from oya.graph.query import get_call_sites
 from oya.generation.metrics import compute_code_metrics
+from oya.generation.page_writer import PageWriter, PendingPage
 from oya.generation.overview import GeneratedPage, OverviewGenerator
 from oya.generation.summaries import DirectorySummary, EntryPointInfo, FileSummary, SynthesisMap
-from oya.generation.synthesis import SynthesisGenerator, load_synthesis_map, save_synthesis_map
+from oya.generation.synthesis import (
+    SYNTHESIS_CHANGE_THRESHOLD,
+    SynthesisGenerator,
+    load_synthesis_map,
+    save_synthesis_map,
+    synthesis_change_ratio,
+)
 from oya.generation.techstack import detect_tech_stack
 from oya.generation.workflows import (
     WorkflowGenerator,
+    WorkflowGroup,
     WorkflowGrouper,
     extract_entry_point_description,
     find_entry_points,
 )
 from oya.config import ConfigError, EXTENSION_LANGUAGES, load_settings
 from oya.db.code_index import CodeIndexBuilder
+from oya.llm.client import llm_page, llm_phase
+from oya.parsing.cache import ParseCache
 from oya.parsing.fallback_parser import FallbackParser
 from oya.parsing.models import ParsedFile, ParsedSymbol
+from oya.parsing.pool import FileParseOutcome, parse_files
 from oya.parsing.registry import ParserRegistry
 from oya.repo.file_filter import FileFilter, extract_directories_from_files
 
 if TYPE_CHECKING:
+    from oya.indexing.streaming import StreamingIndexer
     from oya.vectorstore.issues import IssuesStore
 
 logger = logging.getLogger(__name__)
 
+# SynthesisMap that the architecture, overview and workflow pages were last
+# generated from, kept next to synthesis.json in the meta directory
+PAGES_SYNTHESIS_FILE = "synthesis_pages.json"
+
 
 class GenerationPhase(Enum):
     """Phases of wiki generation."""
@@ -106,6 +140,7 @@ class GenerationResult:
         file_imports: Mapping of file paths to their imports.
         files_regenerated: Whether any files were regenerated.
         directories_regenerated: Whether any directories were regenerated.
+        commit_hash: Commit the generation documented, recorded for change detection.
     """
 
     job_id: str
@@ -114,25 +149,221 @@ class GenerationResult:
     file_imports: dict[str, list[str]] | None = None
     files_regenerated: bool = False
     directories_regenerated: bool = False
+    commit_hash: str | None = None
 
 
 # Type alias for progress callback
 ProgressCallback = Callable[[GenerationProgress], Coroutine[Any, Any, None]]
 
 
-def batched(iterable, n: int) -> Iterator[list]:
-    """Batch an iterable into chunks of size n.
+class ProgressThrottle:
+    """Coalesces progress updates so at most one per interval reaches a callback.
+
+    An update arriving within the interval of the last delivered one replaces any
+    update still waiting, and the waiting update is delivered when the interval
+    ends. A phase's final step is delivered immediately, and flush() delivers
+    whatever is still waiting, so the last state is never lost.
+    """
+
+    def __init__(self, callback: ProgressCallback, interval: float):
+        """Initialize the throttle.
+
+        Args:
+            callback: Callback that receives the coalesced updates.
+            interval: Minimum seconds between two delivered updates.
+        """
+        self.callback = callback
+        self.interval = interval
+        self._last_sent = float("-inf")
+        self._pending: GenerationProgress | None = None
+        self._timer: asyncio.Task[None] | None = None
+
+    async def emit(self, progress: GenerationProgress) -> None:
+        """Deliver an update now, or hold it until the interval has passed."""
+        elapsed = time.monotonic() - self._last_sent
+        finished = progress.total_steps > 0 and progress.step >= progress.total_steps
+        if finished or elapsed >= self.interval:
+            self._pending = None
+            await self._send(progress)
+            return
+        self._pending = progress
+        if self._timer is None:
+            self._timer = asyncio.create_task(self._send_later(self.interval - elapsed))
+
+    async def flush(self) -> None:
+        """Deliver the update still waiting, if any."""
+        self.cancel()
+        if self._pending is not None:
+            progress, self._pending = self._pending, None
+            await self._send(progress)
+
+    def cancel(self) -> None:
+        """Stop a scheduled delivery, e.g. when the generation failed."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    async def _send_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._timer = None
+        if self._pending is not None:
+            progress, self._pending = self._pending, None
+            try:
+                await self._send(progress)
+            except Exception as e:
+                logger.warning(f"Failed to report progress: {e}")
+
+    async def _send(self, progress: GenerationProgress) -> None:
+        self._last_sent = time.monotonic()
+        await self.callback(progress)
+
+
+@dataclass
+class AnalysisIndex:
+    """Lookup tables built once from analysis results.
+
+    Later phases use these instead of scanning every symbol or file for each
+    file and directory they process.
+
+    Attributes:
+        symbols_by_file: Mapping of file path to the symbols parsed from it.
+        files_by_dir: Mapping of directory path to its direct files (root is "").
+        child_dirs: Mapping of directory path to its direct child directories.
+    """
+
+    symbols_by_file: dict[str, list[ParsedSymbol]] = field(default_factory=dict)
+    files_by_dir: dict[str, list[str]] = field(default_factory=dict)
+    child_dirs: dict[str, list[str]] = field(default_factory=dict)
+
+    def files_under(self, dir_path: str) -> list[str]:
+        """Get all files in a directory and its subdirectories.
+
+        Args:
+            dir_path: Directory path (empty string for root).
+
+        Returns:
+            List of file paths, direct files first, then each subdirectory in order.
+        """
+        result: list[str] = []
+        stack = [dir_path]
+        while stack:
+            current = stack.pop()
+            result.extend(self.files_by_dir.get(current, []))
+            stack.extend(reversed(self.child_dirs.get(current, [])))
+        return result
+
+    def symbols_for(self, file_paths: list[str]) -> list[ParsedSymbol]:
+        """Get the symbols defined in the given files.
+
+        Args:
+            file_paths: File paths to collect symbols for.
+
+        Returns:
+            List of ParsedSymbol objects, grouped by file in the given order.
+        """
+        result: list[ParsedSymbol] = []
+        for file_path in file_paths:
+            result.extend(self.symbols_by_file.get(file_path, []))
+        return result
+
+
+def build_analysis_index(files: list[str], symbols: list[ParsedSymbol]) -> AnalysisIndex:
+    """Build per-file and per-directory lookup tables from analysis results.
 
     Args:
-        iterable: Items to batch.
-        n: Batch size.
+        files: List of analyzed file paths.
+        symbols: List of parsed symbols with their file set.
+
+    Returns:
+        AnalysisIndex covering every directory returned by
+        extract_directories_from_files, including root.
+    """
+    index = AnalysisIndex()
+
+    for symbol in symbols:
+        index.symbols_by_file.setdefault(symbol.file or "", []).append(symbol)
+
+    for dir_path in extract_directories_from_files(files):
+        index.files_by_dir[dir_path] = []
+        index.child_dirs.setdefault(dir_path, [])
+        if dir_path:
+            parent = dir_path.rsplit("/", 1)[0] if "/" in dir_path else ""
+            index.child_dirs.setdefault(parent, []).append(dir_path)
+
+    for file_path in files:
+        parent = file_path.rsplit("/", 1)[0] if "/" in file_path else ""
+        index.files_by_dir[parent].append(file_path)
+
+    return index
+
 
-    Yields:
-        Lists of up to n items.
+@dataclass
+class PageSnapshot:
+    """Stored page metadata and note timestamps, loaded once per run.
+
+    Incremental regeneration checks run against this snapshot instead of
+    querying the database for every file and directory.
+
+    Attributes:
+        pages: Mapping of (target, page type) to stored page info.
+        latest_notes: Mapping of note target to its newest updated_at timestamp.
+        checkpoints: Mapping of (kind, target) to (source hash, summary JSON) for
+            pages completed by an interrupted generation.
     """
-    it = iter(iterable)
-    while batch := list(islice(it, n)):
-        yield batch
+
+    pages: dict[tuple[str, str], dict] = field(default_factory=dict)
+    latest_notes: dict[str, str] = field(default_factory=dict)
+    checkpoints: dict[tuple[str, str], tuple[str, str]] = field(default_factory=dict)
+
+    def page_info(self, target: str, page_type: str) -> dict | None:
+        """Get stored info for a page, or None if it was never generated."""
+        return self.pages.get((target, page_type))
+
+    def has_new_notes(self, target: str, generated_at: str | None) -> bool:
+        """Check if a note for target was updated after generated_at."""
+        if not generated_at:
+            return False
+        latest = self.latest_notes.get(target)
+        return latest is not None and latest > generated_at
+
+    def checkpoint(self, kind: str, target: str, source_hash: str) -> dict | None:
+        """Get the checkpointed summary for a page built from source_hash, if any."""
+        entry = self.checkpoints.get((kind, target))
+        if entry is None or entry[0] != source_hash:
+            return None
+        try:
+            summary = json.loads(entry[1])
+        except json.JSONDecodeError:
+            return None
+        return summary if isinstance(summary, dict) else None
+
+
+@dataclass
+class FileResults:
+    """File-phase results, published while the file phase is still running.
+
+    A directory only needs its own files, so the directory phase waits for
+    those through `pending` rather than for the whole file phase.
+
+    Attributes:
+        hashes: Mapping of file path to content hash, for every source file.
+        summaries: Mapping of file path to FileSummary, filled as files complete.
+        pending: Tracks the files still being generated.
+    """
+
+    hashes: dict[str, str] = field(default_factory=dict)
+    summaries: dict[str, FileSummary] = field(default_factory=dict)
+    pending: CompletionTracker[str] = field(default_factory=CompletionTracker)
+
+    @classmethod
+    def finished(cls, hashes: dict[str, str], summaries: list[FileSummary]) -> "FileResults":
+        """Build results for a file phase that has already completed."""
+        results = cls(
+            hashes=hashes,
+            summaries={s.file_path: s for s in summaries if isinstance(s, FileSummary)},
+        )
+        results.pending.close()
+        return results
 
 
 def compute_content_hash(content: str) -> str:
@@ -187,6 +418,91 @@ def compute_directory_signature_with_children(
     return hashlib.sha256(combined.encode("utf-8")).hexdigest()
 
 
+def normalize_purpose(purpose: str) -> list[str]:
+    """Reduce a purpose to its lowercase words, ignoring punctuation and spacing.
+
+    Args:
+        purpose: Purpose text generated for a directory.
+
+    Returns:
+        List of words in the order they appear.
+    """
+    return re.findall(r"[a-z0-9]+", purpose.lower())
+
+
+def purpose_similarity(first: str, second: str) -> float:
+    """Measure how similar two purposes are after normalization.
+
+    Args:
+        first: First purpose text.
+        second: Second purpose text.
+
+    Returns:
+        Similarity from 0.0 (unrelated) to 1.0 (same words in the same order).
+    """
+    first_words = normalize_purpose(first)
+    second_words = normalize_purpose(second)
+    if not first_words and not second_words:
+        return 1.0
+    return difflib.SequenceMatcher(None, first_words, second_words, autojunk=False).ratio()
+
+
+def compute_damped_directory_signature(
+    file_hashes: list[tuple[str, str]],
+    children: list[tuple[str, list[str], str]],
+) -> str:
+    """Compute a directory signature that only tracks material child changes.
+
+    Unlike compute_directory_signature_with_children, a child contributes its
+    file names and the normalized purpose its parents were last generated from,
+    so rewording a child's purpose does not change its parents' signatures.
+
+    Args:
+        file_hashes: List of (filename, content_hash) tuples for files in directory.
+        children: List of (directory path, file names, signature purpose) tuples
+            for child directories.
+
+    Returns:
+        Hex digest of SHA-256 hash combining file hashes and child structure.
+    """
+    sorted_hashes = sorted(file_hashes, key=lambda x: x[0])
+    file_part = "|".join(f"{name}:{hash}" for name, hash in sorted_hashes)
+
+    child_part = "|".join(
+        f"{path}:{','.join(sorted(names))}:{' '.join(normalize_purpose(purpose))}"
+        for path, names, purpose in sorted(children, key=lambda x: x[0])
+    )
+
+    combined = f"{file_part}||{child_part}"
+    return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+
+def in_llm_phase(
+    phase: GenerationPhase,
+) -> Callable[[Callable[_P, Awaitable[_T]]], Callable[_P, Coroutine[Any, Any, _T]]]:
+    """Attribute the LLM calls of an orchestrator phase method to that phase.
+
+    Args:
+        phase: Phase the decorated coroutine method runs.
+    """
+
+    def decorate(
+        method: Callable[_P, Awaitable[_T]],
+    ) -> Callable[_P, Coroutine[Any, Any, _T]]:
+        @functools.wraps(method)
+        async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T:
+            with llm_phase(phase.value):
+                return await method(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
 def group_directories_by_depth(directories: list[str]) -> dict[int, list[str]]:
     """Group directories by their depth level.
 
@@ -238,7 +554,9 @@ class GenerationOrchestrator:
     Analysis → Files → Directories → Synthesis → Architecture → Overview → Workflows
 
     This ordering ensures that high-level documentation (Architecture, Overview)
-    is informed by actual code understanding from lower-level summaries.
+    is informed by actual code understanding from lower-level summaries. Each unit
+    of work starts as soon as its own inputs exist, within a concurrency budget
+    shared by all phases.
 
     Attributes:
         llm_client: LLM client for generation.
@@ -246,7 +564,8 @@ class GenerationOrchestrator:
         db: Database for recording pages.
         wiki_path: Path where wiki files will be saved.
         parser_registry: Parser registry for code analysis.
-        parallel_limit: Max concurrent LLM calls for file/directory generation.
+        parallel_limit: Max concurrent LLM calls across all generation phases.
+        task_timeout: Per-page generation timeout in seconds (None for no limit).
         meta_path: Path for synthesis storage.
     """
 
@@ -260,6 +579,14 @@ class GenerationOrchestrator:
         parallel_limit: int = 10,
         issues_store: "IssuesStore | None" = None,
         ignore_path: Path | None = None,
+        task_timeout: float | None = None,
+        parse_workers: int = 1,
+        parse_cache: ParseCache | None = None,
+        git_change_detection: bool = False,
+        indexer: "StreamingIndexer | None" = None,
+        directory_damping: float = 0.0,
+        progress_rate: float = 0.0,
+        concurrency: AdaptiveConcurrency | None = None,
     ):
         """Initialize the orchestrator.
 
@@ -269,9 +596,28 @@ class GenerationOrchestrator:
             db: Database for recording pages.
             wiki_path: Path where wiki files will be saved.
             parser_registry: Optional parser registry for code analysis.
-            parallel_limit: Max concurrent LLM calls for file/directory generation.
+            parallel_limit: Max concurrent LLM calls across all generation phases.
             issues_store: Optional IssuesStore for indexing detected code issues.
             ignore_path: Path to .oyaignore file. If None, defaults to repo_path/.oyaignore.
+            task_timeout: Optional timeout in seconds for the LLM call generating
+                each page. None disables the timeout.
+            parse_workers: Number of processes used to parse files during analysis.
+                1 parses in-process on the event loop thread.
+            parse_cache: Optional cache of parse results from previous generations,
+                so only changed files are parsed.
+            git_change_detection: Ask git which files changed since the parse cache
+                was saved from a clean working tree, and serve the others from the
+                cache without reading or hashing them.
+            indexer: Optional indexer that pages are handed to as they are saved, so
+                search indexing overlaps with generation.
+            directory_damping: Purpose similarity (0.0-1.0) below which a reworded
+                child directory regenerates its parents. 0 regenerates parents on
+                any change to a child's purpose.
+            progress_rate: Maximum progress updates per second passed to the
+                progress callback of run(); updates in between are coalesced.
+                0 passes on every update.
+            concurrency: Optional controller adapting the number of LLM calls in
+                flight, starting from parallel_limit, to how the provider copes.
         """
         self.llm_client = llm_client
         self.repo = repo
@@ -282,6 +628,31 @@ class GenerationOrchestrator:
         self.parallel_limit = parallel_limit
         self._issues_store = issues_store
         self.ignore_path = ignore_path
+        self.task_timeout = task_timeout
+        # LLM calls in flight across all phases, which may overlap
+        self._budget = ConcurrencyBudget(
+            parallel_limit, timeout=task_timeout, controller=concurrency
+        )
+        self.parse_workers = parse_workers
+        self.parse_cache = parse_cache
+        self._indexer = indexer
+        # Buffers saved pages and persists them in batched transactions
+        self._page_writer = PageWriter(
+            self.wiki_path, db, on_flush=indexer.submit if indexer else None
+        )
+        # Stored page info for incremental checks, loaded once per run
+        self._page_snapshot: PageSnapshot | None = None
+        # Pages restored from checkpoints of an interrupted generation, by kind
+        self._resumed: dict[str, int] = {"file": 0, "directory": 0}
+        self.git_change_detection = git_change_detection
+        self.directory_damping = directory_damping
+        self.progress_rate = progress_rate
+        # Commit documented by this run; None if the working tree was dirty
+        self._head_commit: str | None = None
+        # Results of a file phase running alongside the directory phase
+        self._file_results: FileResults | None = None
+        # Files regenerated in this run, for incremental synthesis (None: unknown)
+        self._regenerated_files: set[str] | None = None
 
         # Initialize generators
         self.overview_generator = OverviewGenerator(llm_client, repo)
@@ -290,7 +661,7 @@ class GenerationOrchestrator:
         self.workflow_generator = WorkflowGenerator(llm_client, repo)
         self.directory_generator = DirectoryGenerator(llm_client, repo)
         self.file_generator = FileGenerator(llm_client, repo)
-        self.synthesis_generator = SynthesisGenerator(llm_client)
+        self.synthesis_generator = SynthesisGenerator(llm_client, budget=self._budget)
 
         # Diagram generator for overview architecture diagram
         self.layer_diagram_generator = LayerDiagramGenerator()
@@ -301,39 +672,148 @@ class GenerationOrchestrator:
         # Meta path for synthesis storage
         self.meta_path = self.wiki_path.parent / "meta"
 
-    def _get_existing_page_info(self, target: str, page_type: str) -> dict | None:
-        """Get existing page info from database for incremental check.
-
-        Args:
-            target: Target path (file or directory path).
-            page_type: Type of page ('file' or 'directory').
+    def _load_page_snapshot(self) -> PageSnapshot:
+        """Load stored file/directory page info and note timestamps in bulk.
 
         Returns:
-            Dict with 'source_hash' and 'generated_at' if page exists, None otherwise.
+            PageSnapshot built from one query over wiki_pages and one over notes.
         """
+        snapshot = PageSnapshot()
         if not hasattr(self.db, "execute"):
-            return None
+            return snapshot
 
         try:
             cursor = self.db.execute(
                 """
-                SELECT metadata, generated_at FROM wiki_pages
-                WHERE target = ? AND type = ?
-                """,
-                (target, page_type),
+                SELECT target, type, metadata, generated_at FROM wiki_pages
+                WHERE type IN ('file', 'directory') AND target IS NOT NULL
+                """
             )
-            row = cursor.fetchone()
-            if row:
-                metadata = json.loads(row[0]) if row[0] else {}
-                return {
+            for target, page_type, raw_metadata, generated_at in cursor.fetchall():
+                try:
+                    metadata = json.loads(raw_metadata) if raw_metadata else {}
+                except (json.JSONDecodeError, TypeError) as e:
+                    logger.warning(f"Failed to parse cache metadata for {target}: {e}")
+                    continue
+                snapshot.pages[(target, page_type)] = {
                     "source_hash": metadata.get("source_hash"),
-                    "generated_at": row[1],
+                    "generated_at": generated_at,
                     "purpose": metadata.get("purpose"),
+                    "signature_purpose": metadata.get("signature_purpose"),
                     "layer": metadata.get("layer"),
                 }
         except Exception as e:
-            logger.warning(f"Failed to parse cache metadata: {e}")
-        return None
+            logger.warning(f"Failed to load existing page info: {e}")
+
+        try:
+            cursor = self.db.execute("SELECT target, MAX(updated_at) FROM notes GROUP BY target")
+            for target, updated_at in cursor.fetchall():
+                if updated_at is not None:
+                    snapshot.latest_notes[target] = updated_at
+        except Exception as e:
+            logger.error(f"Database error checking notes: {e}")
+            raise
+
+        try:
+            cursor = self.db.execute(
+                "SELECT kind, target, source_hash, summary FROM generation_checkpoints"
+            )
+            for kind, target, source_hash, summary in cursor.fetchall():
+                snapshot.checkpoints[(kind, target)] = (source_hash, summary)
+        except Exception as e:
+            logger.warning(f"Failed to load generation checkpoints: {e}")
+
+        return snapshot
+
+    def _clear_checkpoints(self) -> None:
+        """Drop checkpoints once a generation has completed."""
+        if not hasattr(self.db, "execute"):
+            return
+        try:
+            self.db.execute("DELETE FROM generation_checkpoints")
+            self.db.commit()
+        except sqlite3.OperationalError as e:
+            if "no such table" not in str(e):
+                raise
+
+    def _get_head_commit(self) -> str | None:
+        """Get the repository's HEAD commit, or None if it cannot be determined."""
+        try:
+            commit = self.repo.get_head_commit()
+        except Exception as e:
+            logger.warning(f"Could not determine HEAD commit: {e}")
+            return None
+        return commit if isinstance(commit, str) else None
+
+    def _is_tree_clean(self) -> bool:
+        """Check that the working tree has no uncommitted or untracked changes."""
+        try:
+            return self.repo.is_dirty() is False
+        except Exception as e:
+            logger.warning(f"Could not check the working tree for changes: {e}")
+            return False
+
+    def _documented_commit(self) -> str | None:
+        """Get the commit this generation documents.
+
+        With uncommitted changes the pages describe no commit, so none is
+        recorded for later generations to trust.
+
+        Returns:
+            HEAD commit if the working tree is clean, otherwise None.
+        """
+        head_commit = self._get_head_commit()
+        if head_commit is None or not self._is_tree_clean():
+            return None
+        return head_commit
+
+    def _detect_unchanged_paths(self, head_commit: str | None) -> set[str] | None:
+        """Ask git which files are unchanged since the parse cache was saved.
+
+        Args:
+            head_commit: Commit being documented by this generation, or None if
+                the working tree has uncommitted changes.
+
+        Returns:
+            Tracked paths git reports unchanged since the parse cache's commit,
+            or None if every file must be read instead (detection disabled, no
+            parse cache, cache saved from a dirty tree, unknown commit, or
+            uncommitted changes in the working tree).
+        """
+        if not self.git_change_detection or not head_commit or self.parse_cache is None:
+            return None
+        cache_commit = self.parse_cache.commit
+        if cache_commit is None:
+            return None
+        try:
+            changed: set[str] | None = self.repo.get_changed_paths(cache_commit)
+            if changed is None:
+                return None
+            tracked: list[str] = self.repo.list_files()
+        except Exception as e:
+            logger.warning(f"Git change detection failed, reading all files: {e}")
+            return None
+        logger.info(f"Git reports {len(changed)} paths changed since {cache_commit[:12]}")
+        # Untracked (e.g. gitignored) files can change without git noticing
+        return set(tracked) - changed
+
+    def _get_page_snapshot(self) -> PageSnapshot:
+        """Get the page snapshot for this run, loading it on first use."""
+        if self._page_snapshot is None:
+            self._page_snapshot = self._load_page_snapshot()
+        return self._page_snapshot
+
+    def _get_existing_page_info(self, target: str, page_type: str) -> dict | None:
+        """Get existing page info for incremental check.
+
+        Args:
+            target: Target path (file or directory path).
+            page_type: Type of page ('file' or 'directory').
+
+        Returns:
+            Dict with 'source_hash' and 'generated_at' if page exists, None otherwise.
+        """
+        return self._get_page_snapshot().page_info(target, page_type)
 
     def _has_new_notes(self, target: str, generated_at: str | None) -> bool:
         """Check if there are notes created after the page was generated.
@@ -345,51 +825,82 @@ class GenerationOrchestrator:
         Returns:
             True if there are new notes, False otherwise.
         """
-        if not generated_at or not hasattr(self.db, "execute"):
-            return False
+        return self._get_page_snapshot().has_new_notes(target, generated_at)
 
-        try:
-            cursor = self.db.execute(
-                """
-                SELECT COUNT(*) FROM notes
-                WHERE target = ? AND updated_at > ?
-                """,
-                (target, generated_at),
-            )
-            row = cursor.fetchone()
-            return row[0] > 0 if row else False
-        except Exception as e:
-            logger.error(f"Database error checking notes: {e}")
-            raise
+    def _stored_signature_purpose(self, existing: dict | None) -> str:
+        """Get the purpose a stored directory page's parents were generated from.
+
+        Args:
+            existing: Stored page info from _get_existing_page_info, if any.
+
+        Returns:
+            The stored signature purpose, falling back to the stored purpose for
+            pages saved without damping.
+        """
+        if not existing:
+            return ""
+        return existing.get("signature_purpose") or existing.get("purpose") or ""
+
+    def _signature_purpose(self, existing: dict | None, purpose: str) -> str:
+        """Choose the purpose a regenerated directory's parents are signed with.
+
+        With damping enabled, the purpose parents were last generated from is kept
+        while the new purpose stays similar to it. Comparing against that purpose
+        rather than the previous wording lets gradual drift eventually propagate.
+
+        Args:
+            existing: Stored page info from before regeneration, if any.
+            purpose: Newly generated purpose.
+
+        Returns:
+            Purpose to include in parent directory signatures.
+        """
+        stored = self._stored_signature_purpose(existing)
+        if (
+            stored
+            and self.directory_damping > 0
+            and purpose_similarity(purpose, stored) >= self.directory_damping
+        ):
+            return stored
+        return purpose
 
     def _get_direct_child_summaries(
         self,
-        parent_path: str,
+        child_dirs: list[str],
         all_summaries: dict[str, DirectorySummary],
     ) -> list[DirectorySummary]:
         """Get DirectorySummaries for direct children of a directory.
 
         Args:
-            parent_path: Path to the parent directory (empty string for root).
+            child_dirs: Paths of the directory's direct child directories.
             all_summaries: Dict mapping directory path to its DirectorySummary.
 
         Returns:
             List of DirectorySummary objects for direct child directories.
         """
-        result = []
-        prefix = f"{parent_path}/" if parent_path else ""
+        return [all_summaries[child] for child in child_dirs if child in all_summaries]
 
-        for child_path, summary in all_summaries.items():
-            if not child_path.startswith(prefix):
-                continue
-            remaining = child_path[len(prefix) :]
-            if "/" not in remaining and remaining:
-                result.append(summary)
+    def _get_analysis_index(self, analysis: dict) -> AnalysisIndex:
+        """Get the lookup index for analysis results, building it if needed.
 
-        return result
+        Args:
+            analysis: Analysis results from _run_analysis.
+
+        Returns:
+            AnalysisIndex stored under analysis["index"].
+        """
+        index = analysis.get("index")
+        if index is None:
+            index = build_analysis_index(analysis.get("files", []), analysis.get("symbols", []))
+            analysis["index"] = index
+        return index
 
     def _should_regenerate_file(
-        self, file_path: str, content: str, file_hashes: dict[str, str]
+        self,
+        file_path: str,
+        content: str,
+        file_hashes: dict[str, str],
+        content_hash: str | None = None,
     ) -> tuple[bool, str, dict | None]:
         """Check if a file page needs regeneration.
 
@@ -397,15 +908,18 @@ class GenerationOrchestrator:
             file_path: Path to the source file.
             content: Content of the source file.
             file_hashes: Dict to store computed hashes (modified in place).
+            content_hash: Hash of content, if already known.
 
         Returns:
             Tuple of (should_regenerate, content_hash, existing_info).
             existing_info is the stored page info if not regenerating, None otherwise.
         """
-        content_hash = compute_content_hash(content)
+        existing = self._get_existing_page_info(file_path, "file")
+
+        if content_hash is None:
+            content_hash = compute_content_hash(content)
         file_hashes[file_path] = content_hash
 
-        existing = self._get_existing_page_info(file_path, "file")
         if not existing:
             return True, content_hash, None
 
@@ -497,6 +1011,11 @@ class GenerationOrchestrator:
         - Synthesis combines all summaries into a coherent codebase map
         - Architecture and Overview use the synthesis map for accurate context
 
+        Phases overlap where their inputs allow. Directories are generated while
+        the file phase is still running, each as soon as its own files and child
+        directories are done. Architecture, overview and workflows only need the
+        synthesis map, so they are generated concurrently.
+
         Cascade behavior (Requirement 7.2):
         - If any file is regenerated, synthesis is regenerated
         - If synthesis is regenerated, architecture and overview are regenerated
@@ -507,38 +1026,90 @@ class GenerationOrchestrator:
         Returns:
             GenerationResult containing job_id, synthesis_map, and analysis data.
         """
+        if progress_callback is None or self.progress_rate <= 0:
+            return await self._run(progress_callback)
+
+        # Coalesce progress updates; a failed run must not report progress later
+        throttle = ProgressThrottle(progress_callback, 1 / self.progress_rate)
+        try:
+            result = await self._run(throttle.emit)
+        except BaseException:
+            throttle.cancel()
+            raise
+        await throttle.flush()
+        return result
+
+    async def _run(self, progress_callback: ProgressCallback | None) -> GenerationResult:
+        """Run the generation pipeline; see run()."""
         job_id = str(uuid.uuid4())
 
         # Ensure wiki and meta directories exist
         self.wiki_path.mkdir(parents=True, exist_ok=True)
         self.meta_path.mkdir(parents=True, exist_ok=True)
 
+        # Snapshot stored page info once; all skip/regenerate checks use it
+        self._page_snapshot = self._load_page_snapshot()
+        self._resumed = {"file": 0, "directory": 0}
+
+        # Commit this generation documents, if any
+        head_commit = self._documented_commit()
+        self._head_commit = head_commit
+
         # Phase 1: Analysis (with progress tracking for file parsing)
         analysis = await self._run_analysis(progress_callback)
 
         # Build code index from parsed files if enabled
         self._build_code_index(analysis.get("parsed_files", []))
 
-        # Phase 2: Files (run before directories to compute content hashes and collect summaries)
-        file_pages, file_hashes, file_summaries, file_layers = await self._run_files(
-            analysis, progress_callback
-        )
-        for page in file_pages:
-            await self._save_page_with_frontmatter(page, layer=file_layers.get(page.path))
+        # Pages are indexed for search as they are saved; give the indexer the
+        # analysis data used to enrich file page chunks
+        if self._indexer is not None:
+            self._indexer.set_analysis(
+                symbols=self._analysis_symbols(analysis),
+                file_imports=analysis.get("file_imports"),
+                entry_points=self._discover_entry_points(analysis.get("symbols", [])),
+            )
 
-        # Track if any files were regenerated (for cascade)
-        files_regenerated = len(file_pages) > 0
+        # Phases 2 and 3: Files and Directories, overlapped. The file phase publishes
+        # content hashes and summaries as files complete; each directory waits only
+        # for its own files (hashes for its signature, summaries for context).
+        file_results = FileResults()
+        self._file_results = file_results
 
-        # Phase 3: Directories
-        # (uses file_hashes for signature computation and file_summaries for context)
-        directory_pages, directory_summaries = await self._run_directories(
-            analysis, file_hashes, progress_callback, file_summaries=file_summaries
-        )
-        for page in directory_pages:
-            await self._save_page_with_frontmatter(page)
+        async def run_files():
+            try:
+                return await self._run_files(analysis, progress_callback)
+            finally:
+                # Never leave a directory waiting on a file phase that has stopped
+                file_results.pending.close()
+
+        try:
+            (
+                (file_pages, _, file_summaries, _),
+                (
+                    directory_pages,
+                    directory_summaries,
+                ),
+            ) = await run_concurrently(
+                run_files(),
+                self._run_directories(analysis, file_results.hashes, progress_callback),
+            )
+        finally:
+            self._file_results = None
+        # Pages are saved as they complete; persist the last partial batch
+        await self._flush_pages()
+
+        # Track if any files were regenerated (for cascade), including files
+        # regenerated by an interrupted generation that this run resumed
+        files_regenerated = len(file_pages) > 0 or self._resumed["file"] > 0
 
         # Track if any directories were regenerated (for cascade)
-        directories_regenerated = len(directory_pages) > 0
+        directories_regenerated = len(directory_pages) > 0 or self._resumed["directory"] > 0
+        if any(self._resumed.values()):
+            logger.info(
+                f"Resumed {self._resumed['file']} file and {self._resumed['directory']} "
+                "directory pages from checkpoints"
+            )
 
         # Phase 4: Synthesis (combine file and directory summaries into SynthesisMap)
         # Cascade: regenerate synthesis if any files or directories were regenerated
@@ -548,6 +1119,11 @@ class GenerationOrchestrator:
 
         synthesis_map: SynthesisMap | None = None
         if should_regenerate_synthesis:
+            # Synthesis only reprocesses what the regenerated files affect. Files
+            # resumed from checkpoints are not tracked by path and force a full run.
+            self._regenerated_files = (
+                None if self._resumed["file"] else {page.target for page in file_pages}
+            )
             await self._emit_progress(
                 progress_callback,
                 GenerationProgress(
@@ -594,84 +1170,144 @@ class GenerationOrchestrator:
         # At this point synthesis_map is guaranteed to be set
         assert synthesis_map is not None
 
-        # Phase 5: Architecture (uses SynthesisMap as primary context)
-        # Cascade: regenerate architecture only if synthesis was regenerated (Requirement 7.3, 7.5)
-        if should_regenerate_synthesis:
-            await self._emit_progress(
-                progress_callback,
-                GenerationProgress(
-                    phase=GenerationPhase.ARCHITECTURE,
-                    step=0,
-                    total_steps=1,
-                    message="Generating architecture page...",
-                ),
-            )
-            architecture_page = await self._run_architecture(analysis, synthesis_map=synthesis_map)
-            await self._save_page_with_frontmatter(architecture_page)
-            await self._emit_progress(
-                progress_callback,
-                GenerationProgress(
-                    phase=GenerationPhase.ARCHITECTURE,
-                    step=1,
-                    total_steps=1,
-                    message="Architecture complete",
-                ),
-            )
-
-        # Phase 6: Overview (uses SynthesisMap as primary context)
-        # Cascade: regenerate overview only if synthesis was regenerated (Requirement 7.3, 7.5)
-        if should_regenerate_synthesis:
-            await self._emit_progress(
-                progress_callback,
-                GenerationProgress(
-                    phase=GenerationPhase.OVERVIEW,
-                    step=0,
-                    total_steps=1,
-                    message="Generating overview page...",
-                ),
-            )
-            overview_page = await self._run_overview(analysis, synthesis_map=synthesis_map)
-            await self._save_page_with_frontmatter(overview_page)
-            await self._emit_progress(
-                progress_callback,
-                GenerationProgress(
-                    phase=GenerationPhase.OVERVIEW,
-                    step=1,
-                    total_steps=1,
-                    message="Overview complete",
-                ),
-            )
-
-        # Phase 7: Workflows
-        # Cascade: regenerate workflows only if synthesis was regenerated (Requirement 7.5)
+        # Phases 5-7: Architecture, Overview and Workflows (use SynthesisMap as primary
+        # context). They are independent of each other, so they run concurrently.
+        # Cascade: regenerate them only if synthesis was regenerated (Requirement 7.3, 7.5)
+        # and the map changed enough to matter for them
         if should_regenerate_synthesis:
-            workflow_pages = await self._run_workflows(
-                analysis, progress_callback, synthesis_map=synthesis_map
-            )
-            for page in workflow_pages:
-                await self._save_page_with_frontmatter(page)
+            await self._run_high_level_pages(analysis, synthesis_map, progress_callback)
+        await self._flush_pages()
 
-        # Convert ParsedSymbol objects to dicts for indexing
-        analysis_symbols = [
-            {
-                "name": s.name,
-                "type": s.symbol_type.value,
-                "file": s.metadata.get("file", ""),
-                "line": s.start_line,
-                "decorators": s.decorators,
-            }
-            for s in analysis.get("symbols", [])
-        ]
+        # Everything is persisted; a later failure must not resume from this run
+        self._clear_checkpoints()
 
         return GenerationResult(
             job_id=job_id,
             synthesis_map=synthesis_map,
-            analysis_symbols=analysis_symbols,
+            analysis_symbols=self._analysis_symbols(analysis),
             file_imports=analysis.get("file_imports"),
             files_regenerated=files_regenerated,
             directories_regenerated=directories_regenerated,
+            commit_hash=head_commit,
         )
 
+    async def _run_high_level_pages(
+        self,
+        analysis: dict,
+        synthesis_map: SynthesisMap,
+        progress_callback: ProgressCallback | None = None,
+    ) -> None:
+        """Regenerate the pages built from the SynthesisMap, if it changed enough.
+
+        The map the pages were last generated from is kept in PAGES_SYNTHESIS_FILE.
+        Architecture, overview and workflows are regenerated when the map changed
+        by more than SYNTHESIS_CHANGE_THRESHOLD; otherwise only workflows are, and
+        only if the entry points changed.
+
+        Args:
+            analysis: Analysis results.
+            synthesis_map: The new SynthesisMap.
+            progress_callback: Optional async callback for progress updates.
+        """
+        baseline, _ = load_synthesis_map(str(self.meta_path), PAGES_SYNTHESIS_FILE)
+        if baseline is None or (
+            synthesis_change_ratio(baseline, synthesis_map) > SYNTHESIS_CHANGE_THRESHOLD
+        ):
+            await run_concurrently(
+                self._generate_architecture_page(analysis, synthesis_map, progress_callback),
+                self._generate_overview_page(analysis, synthesis_map, progress_callback),
+                self._generate_workflow_pages(analysis, synthesis_map, progress_callback),
+            )
+            baseline = synthesis_map
+        elif baseline.entry_points != synthesis_map.entry_points:
+            logger.info("Synthesis changed little; regenerating workflows for new entry points")
+            await self._generate_workflow_pages(analysis, synthesis_map, progress_callback)
+            baseline.entry_points = synthesis_map.entry_points
+        else:
+            logger.info("Synthesis changed little; keeping architecture, overview and workflows")
+            return
+
+        save_synthesis_map(baseline, str(self.meta_path), PAGES_SYNTHESIS_FILE)
+
+    @in_llm_phase(GenerationPhase.ARCHITECTURE)
+    async def _generate_architecture_page(
+        self,
+        analysis: dict,
+        synthesis_map: SynthesisMap,
+        progress_callback: ProgressCallback | None = None,
+    ) -> None:
+        """Generate and save the architecture page, reporting progress."""
+        await self._emit_progress(
+            progress_callback,
+            GenerationProgress(
+                phase=GenerationPhase.ARCHITECTURE,
+                step=0,
+                total_steps=1,
+                message="Generating architecture page...",
+            ),
+        )
+        with llm_page("architecture"):
+            architecture_page = await self._budget.run(
+                "architecture",
+                lambda: self._run_architecture(analysis, synthesis_map=synthesis_map),
+            )
+        await self._save_page_with_frontmatter(architecture_page)
+        await self._emit_progress(
+            progress_callback,
+            GenerationProgress(
+                phase=GenerationPhase.ARCHITECTURE,
+                step=1,
+                total_steps=1,
+                message="Architecture complete",
+            ),
+        )
+
+    @in_llm_phase(GenerationPhase.OVERVIEW)
+    async def _generate_overview_page(
+        self,
+        analysis: dict,
+        synthesis_map: SynthesisMap,
+        progress_callback: ProgressCallback | None = None,
+    ) -> None:
+        """Generate and save the overview page, reporting progress."""
+        await self._emit_progress(
+            progress_callback,
+            GenerationProgress(
+                phase=GenerationPhase.OVERVIEW,
+                step=0,
+                total_steps=1,
+                message="Generating overview page...",
+            ),
+        )
+        with llm_page("overview"):
+            overview_page = await self._budget.run(
+                "overview", lambda: self._run_overview(analysis, synthesis_map=synthesis_map)
+            )
+        await self._save_page_with_frontmatter(overview_page)
+        await self._emit_progress(
+            progress_callback,
+            GenerationProgress(
+                phase=GenerationPhase.OVERVIEW,
+                step=1,
+                total_steps=1,
+                message="Overview complete",
+            ),
+        )
+
+    @in_llm_phase(GenerationPhase.WORKFLOWS)
+    async def _generate_workflow_pages(
+        self,
+        analysis: dict,
+        synthesis_map: SynthesisMap,
+        progress_callback: ProgressCallback | None = None,
+    ) -> None:
+        """Generate and save the workflow pages."""
+        workflow_pages = await self._run_workflows(
+            analysis, progress_callback, synthesis_map=synthesis_map
+        )
+        for page in workflow_pages:
+            await self._save_page_with_frontmatter(page)
+
     async def _emit_progress(
         self,
         callback: ProgressCallback | None,
@@ -702,7 +1338,8 @@ class GenerationOrchestrator:
         # Use FileFilter to respect .oyaignore and default exclusions
         file_filter = FileFilter(self.repo.path, ignore_path=self.ignore_path)
         files = file_filter.get_files()
-        file_contents: dict[str, str] = {}
+        # Contents are kept in a bounded cache and re-read on demand later
+        file_contents = FileContents(self.repo.path)
 
         # Build file tree
         file_tree = self._build_file_tree(files)
@@ -720,75 +1357,119 @@ class GenerationOrchestrator:
             ),
         )
 
-        # Parse each file
+        # Resolved once per run rather than for every parsed file
+        try:
+            progress_interval = load_settings().generation.progress_report_interval
+        except (ValueError, OSError, ConfigError):
+            # Settings not available
+            progress_interval = 1  # Default from CONFIG_SCHEMA
+
+        # Read and parse files (in worker processes for large repos); outcomes may
+        # arrive out of order, so collect them and assemble results in file order
+        outcomes: dict[str, FileParseOutcome] = {}
+        parsed_count = 0
+        loop = asyncio.get_running_loop()
+        # Files git reports unchanged are served from the parse cache unread
+        unchanged = await loop.run_in_executor(
+            None, self._detect_unchanged_paths, self._head_commit
+        )
+        results = parse_files(
+            self.repo.path,
+            files,
+            workers=self.parse_workers,
+            registry=self.parser_registry,
+            fallback_parser=self._fallback_parser,
+            cache=self.parse_cache,
+            unchanged=unchanged,
+        )
+        async with aclosing(results):
+            async for outcome in results:
+                if outcome.content is not None:
+                    # Hand the content to the bounded store instead of holding
+                    # every file's text until all files are parsed
+                    file_contents.add(outcome.path, outcome.content)
+                    outcome.content = ""
+                elif outcome.cached is not None:
+                    # Read later only if generation needs the content
+                    file_contents.add_info(
+                        outcome.path,
+                        ContentInfo(
+                            content_hash=outcome.cached.content_hash,
+                            size=outcome.cached.size,
+                            lines=outcome.cached.lines,
+                        ),
+                    )
+                outcomes[outcome.path] = outcome
+                parsed_count += 1
+
+                # Emit progress (configurable interval)
+                if parsed_count % progress_interval == 0 or parsed_count == total_files:
+                    await self._emit_progress(
+                        progress_callback,
+                        GenerationProgress(
+                            phase=GenerationPhase.ANALYSIS,
+                            step=parsed_count,
+                            total_steps=total_files,
+                            message=f"Parsed {parsed_count}/{total_files} files...",
+                        ),
+                    )
+
+        if self.parse_cache is not None:
+            # Drop entries for files that no longer exist and persist for next time;
+            # pickling a large cache is slow, so keep it off the event loop. Only a
+            # cache read from a tree still clean can be trusted by git later.
+            commit = self._head_commit if self._head_commit and self._is_tree_clean() else None
+            await loop.run_in_executor(
+                None, functools.partial(self.parse_cache.save, keep=files, commit=commit)
+            )
+            logger.info(
+                f"Parse cache: {self.parse_cache.hits} unchanged, "
+                f"{total_files - self.parse_cache.hits} parsed"
+            )
+
         parse_errors: list[dict] = []
         all_symbols: list[ParsedSymbol] = []
         parsed_files: list[ParsedFile] = []
         file_imports: dict[str, list[str]] = {}
 
-        for idx, file_path in enumerate(files):
-            full_path = self.repo.path / file_path
-            if not full_path.exists() or not full_path.is_file():
+        for file_path in files:
+            file_outcome = outcomes.get(file_path)
+            if file_outcome is None or file_outcome.missing:
                 continue
 
-            try:
-                content = full_path.read_text(encoding="utf-8", errors="ignore")
-                file_contents[file_path] = content
-
-                # Parse for symbols
-                result = self.parser_registry.parse_file(Path(file_path), content)
-
-                if result.ok and result.file:
-                    # Successful parse - use full symbol data
-                    file_imports[file_path] = result.file.imports
-                    parsed_files.append(result.file)
-                    for symbol in result.file.symbols:
-                        symbol.metadata["file"] = file_path
-                        all_symbols.append(symbol)
-                else:
-                    # Parse failed - try fallback for partial recovery
-                    parse_errors.append(
-                        {
-                            "file": file_path,
-                            "error": result.error or "Unknown parse error",
-                            "recovered": True,
-                        }
-                    )
-                    fallback_result = self._fallback_parser.parse(Path(file_path), content)
-                    if fallback_result.ok and fallback_result.file:
-                        file_imports[file_path] = fallback_result.file.imports
-                        parsed_files.append(fallback_result.file)
-                        for symbol in fallback_result.file.symbols:
-                            symbol.metadata["file"] = file_path
-                            all_symbols.append(symbol)
-
-            except Exception as e:
+            if file_outcome.error is not None:
                 # File read error - track but continue
                 parse_errors.append(
                     {
                         "file": file_path,
-                        "error": str(e),
+                        "error": file_outcome.error,
                         "recovered": False,
                     }
                 )
+                continue
 
-            # Emit progress (configurable interval)
-            try:
-                settings = load_settings()
-                progress_interval = settings.generation.progress_report_interval
-            except (ValueError, OSError, ConfigError):
-                # Settings not available
-                progress_interval = 1  # Default from CONFIG_SCHEMA
-            if (idx + 1) % progress_interval == 0 or idx == total_files - 1:
-                await self._emit_progress(
-                    progress_callback,
-                    GenerationProgress(
-                        phase=GenerationPhase.ANALYSIS,
-                        step=idx + 1,
-                        total_steps=total_files,
-                        message=f"Parsed {idx + 1}/{total_files} files...",
-                    ),
+            result = file_outcome.result
+            if result is not None and result.ok and result.file:
+                # Successful parse - use full symbol data
+                parsed_file: ParsedFile | None = result.file
+            else:
+                # Parse failed - fallback parser was used for partial recovery
+                parse_errors.append(
+                    {
+                        "file": file_path,
+                        "error": (result.error if result else None) or "Unknown parse error",
+                        "recovered": True,
+                    }
                 )
+                fallback = file_outcome.fallback
+                parsed_file = fallback.file if fallback and fallback.ok else None
+
+            if parsed_file is not None:
+                file_imports[file_path] = parsed_file.imports
+                parsed_files.append(parsed_file)
+                for symbol in parsed_file.symbols:
+                    symbol.file = file_path
+                    all_symbols.append(symbol)
 
         # Build the code graph from parsed files
         graph = build_graph(parsed_files)
@@ -806,6 +1487,7 @@ class GenerationOrchestrator:
             "parse_errors": parse_errors,
             "parsed_files": parsed_files,
             "graph": graph,
+            "index": build_analysis_index(files, all_symbols),
         }
 
     def _build_file_tree(self, files: list[str]) -> str:
@@ -869,7 +1551,7 @@ class GenerationOrchestrator:
             architecture_diagram=architecture_diagram,
         )
 
-    def _extract_package_info(self, file_contents: dict[str, str]) -> dict:
+    def _extract_package_info(self, file_contents: Mapping[str, str]) -> dict:
         """Extract package information from project files.
 
         Args:
@@ -1005,6 +1687,7 @@ class GenerationOrchestrator:
         )
 
         total_workflows = len(workflow_groups)
+        index = self._get_analysis_index(analysis)
 
         # Emit initial progress
         await self._emit_progress(
@@ -1017,34 +1700,49 @@ class GenerationOrchestrator:
             ),
         )
 
-        # Generate page for each workflow group
-        for idx, workflow_group in enumerate(workflow_groups):
-            page = await self.workflow_generator.generate(
-                workflow_group=workflow_group,
-                synthesis_map=synthesis_map,
-                symbols=analysis.get("symbols", []),
-                file_imports=analysis.get("file_imports", {}),
-            )
-            pages.append(page)
+        async def generate_workflow_page(item: tuple[int, WorkflowGroup]) -> GeneratedPage:
+            _, workflow_group = item
+            with llm_page(workflow_group.name):
+                return await self._budget.run(
+                    workflow_group.name,
+                    lambda: self.workflow_generator.generate(
+                        workflow_group=workflow_group,
+                        synthesis_map=synthesis_map,
+                        symbols=index.symbols_for(workflow_group.related_files),
+                        file_imports=analysis.get("file_imports", {}),
+                    ),
+                )
 
-            # Emit progress after each workflow
-            await self._emit_progress(
-                progress_callback,
-                GenerationProgress(
-                    phase=GenerationPhase.WORKFLOWS,
-                    step=idx + 1,
-                    total_steps=total_workflows,
-                    message=f"Generated {idx + 1}/{total_workflows} workflows...",
-                ),
-            )
+        # Generate the workflow groups concurrently; pages keep the group order
+        pages_by_index: dict[int, GeneratedPage] = {}
+        results = run_bounded(
+            enumerate(workflow_groups), generate_workflow_page, self._budget.max_limit
+        )
+        async with aclosing(results):
+            async for (idx, _), page in results:
+                pages_by_index[idx] = page
+
+                # Emit progress after each workflow
+                completed = len(pages_by_index)
+                await self._emit_progress(
+                    progress_callback,
+                    GenerationProgress(
+                        phase=GenerationPhase.WORKFLOWS,
+                        step=completed,
+                        total_steps=total_workflows,
+                        message=f"Generated {completed}/{total_workflows} workflows...",
+                    ),
+                )
 
+        pages.extend(pages_by_index[idx] for idx in sorted(pages_by_index))
         return pages
 
+    @in_llm_phase(GenerationPhase.SYNTHESIS)
     async def _run_synthesis(
         self,
         file_summaries: list[FileSummary],
         directory_summaries: list[DirectorySummary],
-        file_contents: dict[str, str] | None = None,
+        file_contents: Mapping[str, str] | None = None,
         all_symbols: list[ParsedSymbol] | None = None,
     ) -> SynthesisMap:
         """Run synthesis phase to combine summaries into a SynthesisMap.
@@ -1058,11 +1756,17 @@ class GenerationOrchestrator:
         Returns:
             SynthesisMap containing aggregated codebase understanding.
         """
-        # Generate the synthesis map
-        synthesis_map = await self.synthesis_generator.generate(
-            file_summaries=file_summaries,
-            directory_summaries=directory_summaries,
-        )
+        # Update the previous map when only some files changed, else generate it anew
+        previous_map, _ = load_synthesis_map(str(self.meta_path))
+        if previous_map is not None and self._regenerated_files is not None:
+            synthesis_map = await self.synthesis_generator.update(
+                previous_map, file_summaries, directory_summaries, self._regenerated_files
+            )
+        else:
+            synthesis_map = await self.synthesis_generator.generate(
+                file_summaries=file_summaries,
+                directory_summaries=directory_summaries,
+            )
 
         # Populate tech_stack from file summaries
         synthesis_map.tech_stack = detect_tech_stack(file_summaries)
@@ -1073,22 +1777,53 @@ class GenerationOrchestrator:
 
         # Discover and populate entry points if symbols available
         if all_symbols:
-            entry_point_symbols = find_entry_points(all_symbols)
-            synthesis_map.entry_points = [
-                EntryPointInfo(
-                    name=ep.name,
-                    entry_type=ep.symbol_type.value,
-                    file=ep.metadata.get("file", ""),
-                    description=extract_entry_point_description(ep),
-                )
-                for ep in entry_point_symbols
-            ]
+            synthesis_map.entry_points = self._discover_entry_points(all_symbols)
 
         # Save to synthesis.json
         save_synthesis_map(synthesis_map, str(self.meta_path))
 
         return synthesis_map
 
+    def _discover_entry_points(self, all_symbols: list[ParsedSymbol]) -> list[EntryPointInfo]:
+        """Find entry points (routes, CLI commands, main functions) among symbols.
+
+        Args:
+            all_symbols: All parsed symbols.
+
+        Returns:
+            Entry points with their descriptions.
+        """
+        return [
+            EntryPointInfo(
+                name=ep.name,
+                entry_type=ep.symbol_type.value,
+                file=ep.file or "",
+                description=extract_entry_point_description(ep),
+            )
+            for ep in find_entry_points(all_symbols)
+        ]
+
+    def _analysis_symbols(self, analysis: dict) -> list[dict]:
+        """Convert parsed symbols to the dicts used for search indexing.
+
+        Args:
+            analysis: Analysis results.
+
+        Returns:
+            Symbol dicts with name, type, file, line and decorators.
+        """
+        return [
+            {
+                "name": s.name,
+                "type": s.symbol_type.value,
+                "file": s.file or "",
+                "line": s.start_line,
+                "decorators": s.decorators,
+            }
+            for s in analysis.get("symbols", [])
+        ]
+
+    @in_llm_phase(GenerationPhase.DIRECTORIES)
     async def _run_directories(
         self,
         analysis: dict,
@@ -1096,10 +1831,15 @@ class GenerationOrchestrator:
         progress_callback: ProgressCallback | None = None,
         file_summaries: list[FileSummary] | None = None,
     ) -> tuple[list[GeneratedPage], list[DirectorySummary]]:
-        """Run directory generation phase with depth-first processing and incremental support.
+        """Run directory generation phase with bottom-up processing and incremental support.
 
-        Directories are processed in depth-first order (deepest first, root last) so that
+        A directory is generated once all of its child directories are done, so that
         child directory summaries are available when generating parent directories.
+        Directories whose children are complete run concurrently within parallel_limit.
+
+        When run alongside the file phase (see run()), file hashes and summaries are
+        read from the file phase's published results instead of the arguments, and
+        each directory also waits until its own files are done.
 
         Args:
             analysis: Analysis results.
@@ -1112,32 +1852,16 @@ class GenerationOrchestrator:
         """
         pages: list[GeneratedPage] = []
         directory_summaries: list[DirectorySummary] = []
-        file_summaries = file_summaries or []
+        file_results = self._file_results or FileResults.finished(file_hashes, file_summaries or [])
 
         # Track all generated summaries for parent access
         all_summaries: dict[str, DirectorySummary] = {}
+        # Purposes that parent signatures are computed from when damping is enabled
+        signature_purposes: dict[str, str] = {}
 
-        # Build a lookup of file summaries by file path for quick access
-        file_summary_lookup: dict[str, FileSummary] = {
-            fs.file_path: fs for fs in file_summaries if isinstance(fs, FileSummary)
-        }
-
-        # Get unique directories using the shared utility function
-        all_directories = extract_directories_from_files(analysis["files"])
-
-        # Build directories dict with their direct files
-        directories: dict[str, list[str]] = {d: [] for d in all_directories}
-
-        # Compute direct files for each directory
-        for file_path in analysis["files"]:
-            parts = file_path.split("/")
-            if len(parts) == 1:
-                # Root-level file (e.g., README.md)
-                directories[""].append(file_path)
-            else:
-                parent_dir = "/".join(parts[:-1])
-                if parent_dir in directories:
-                    directories[parent_dir].append(file_path)
+        # Direct files and child directories for every directory, including root
+        index = self._get_analysis_index(analysis)
+        all_directories = list(index.files_by_dir)
 
         # Get processing order: depth-first (deepest directories first, root last)
         processing_order = get_processing_order(all_directories)
@@ -1157,24 +1881,45 @@ class GenerationOrchestrator:
             ),
         )
 
-        # Process directories sequentially in depth-first order
-        # (children must complete before parents to provide child summaries)
+        # A directory only depends on its direct children, so any directory whose
+        # children are done can run; independent subtrees proceed concurrently
         completed = 0
         skipped_count = 0
 
-        for dir_path in processing_order:
-            dir_files = directories[dir_path]
+        async def process_directory(dir_path: str) -> GeneratedPage | None:
+            """Generate one directory page, or return None if it is unchanged."""
+            dir_files = index.files_by_dir[dir_path]
+
+            # Hashes and summaries of this directory's files must be final
+            await file_results.pending.wait(dir_files)
+            file_hashes = file_results.hashes
 
             # Get child summaries for this directory
-            child_summaries = self._get_direct_child_summaries(dir_path, all_summaries)
+            child_summaries = self._get_direct_child_summaries(
+                index.child_dirs[dir_path], all_summaries
+            )
 
             # Compute signature including child purposes
             file_hash_pairs = [
                 (f.split("/")[-1], file_hashes.get(f, "")) for f in dir_files if f in file_hashes
             ]
-            signature_hash = compute_directory_signature_with_children(
-                file_hash_pairs, child_summaries
-            )
+            if self.directory_damping > 0:
+                # Children contribute their file names and the purpose this directory
+                # was last generated from, so rewordings don't regenerate it
+                children = [
+                    (
+                        child,
+                        [f.split("/")[-1] for f in index.files_by_dir[child]],
+                        signature_purposes[child],
+                    )
+                    for child in index.child_dirs[dir_path]
+                    if child in signature_purposes
+                ]
+                signature_hash = compute_damped_directory_signature(file_hash_pairs, children)
+            else:
+                signature_hash = compute_directory_signature_with_children(
+                    file_hash_pairs, child_summaries
+                )
 
             # Check if regeneration is needed
             existing = self._get_existing_page_info(dir_path, "directory")
@@ -1186,8 +1931,18 @@ class GenerationOrchestrator:
                         should_regenerate = False
 
             if not should_regenerate:
-                skipped_count += 1
-                completed += 1
+                signature_purposes[dir_path] = self._stored_signature_purpose(existing)
+                checkpoint = self._get_page_snapshot().checkpoint(
+                    "directory", dir_path, signature_hash
+                )
+                if checkpoint is not None:
+                    # Completed by an interrupted generation; reuse its full summary
+                    resumed_summary = DirectorySummary.from_dict(checkpoint)
+                    directory_summaries.append(resumed_summary)
+                    all_summaries[dir_path] = resumed_summary
+                    self._resumed["directory"] += 1
+                    return None
+
                 # For skipped directories, we need a placeholder summary for parent access
                 # Use the stored purpose from the database to maintain signature consistency
                 stored_purpose = existing.get("purpose", "") if existing else ""
@@ -1198,79 +1953,85 @@ class GenerationOrchestrator:
                     role_in_system="",
                 )
                 all_summaries[dir_path] = placeholder_summary
-                continue
+                return None
 
-            # Get direct files for this directory
-            if dir_path == "":
-                # Root directory: files without "/" are root-level
-                direct_files = [f for f in analysis["files"] if "/" not in f]
-            else:
-                direct_files = [
-                    f
-                    for f in analysis["files"]
-                    if f.startswith(dir_path + "/") and "/" not in f[len(dir_path) + 1 :]
-                ]
-
-            # Filter symbols by file path and convert to dicts for generator
-            if dir_path == "":
-                # Root: symbols from root-level files
-                dir_symbols = [
-                    self._symbol_to_dict(s)
-                    for s in analysis["symbols"]
-                    if "/" not in s.metadata.get("file", "")
-                ]
-            else:
-                dir_symbols = [
-                    self._symbol_to_dict(s)
-                    for s in analysis["symbols"]
-                    if s.metadata.get("file", "").startswith(dir_path + "/")
-                ]
+            # Root covers symbols from root-level files; other directories cover
+            # their whole subtree. Convert to dicts for the generator.
+            symbol_files = dir_files if dir_path == "" else index.files_under(dir_path)
+            dir_symbols = [self._symbol_to_dict(s) for s in index.symbols_for(symbol_files)]
 
             # Get file summaries for files in this directory
             dir_file_summaries = [
-                file_summary_lookup[f] for f in direct_files if f in file_summary_lookup
+                file_results.summaries[f] for f in dir_files if f in file_results.summaries
             ]
 
             # Load notes for this directory
             notes = get_notes_for_target(self.db, "directory", dir_path)
 
             # Generate directory page with child summaries
-            page, directory_summary = await self.directory_generator.generate(
-                directory_path=dir_path,
-                file_list=direct_files,
-                symbols=dir_symbols,
-                architecture_context="",
-                file_summaries=dir_file_summaries,
-                child_summaries=child_summaries,
-                project_name=project_name,
-                notes=notes,
-            )
+            with llm_page(dir_path):
+                page, directory_summary = await self._budget.run(
+                    dir_path,
+                    lambda: self.directory_generator.generate(
+                        directory_path=dir_path,
+                        file_list=dir_files,
+                        symbols=dir_symbols,
+                        architecture_context="",
+                        file_summaries=dir_file_summaries,
+                        child_summaries=child_summaries,
+                        project_name=project_name,
+                        notes=notes,
+                    ),
+                )
 
             # Add signature hash and purpose to the page for storage
             page.source_hash = signature_hash
             page.purpose = directory_summary.purpose
+            signature_purposes[dir_path] = self._signature_purpose(
+                existing, directory_summary.purpose
+            )
+            if self.directory_damping > 0:
+                page.signature_purpose = signature_purposes[dir_path]
 
-            pages.append(page)
+            # Record before returning so the parent can start with this summary
             directory_summaries.append(directory_summary)
             all_summaries[dir_path] = directory_summary
+            return page
+
+        # Every ready directory may start: directories waiting for their files hold
+        # no LLM slot, and the shared budget bounds the generation calls themselves
+        results = run_dependency_graph(
+            {dir_path: index.child_dirs[dir_path] for dir_path in processing_order},
+            process_directory,
+            max(1, total_dirs),
+        )
+        async with aclosing(results):
+            async for dir_path, page in results:
+                completed += 1
+                if page is None:
+                    skipped_count += 1
+                    continue
 
-            completed += 1
-            generated_so_far = completed - skipped_count
-            await self._emit_progress(
-                progress_callback,
-                GenerationProgress(
-                    phase=GenerationPhase.DIRECTORIES,
-                    step=completed,
-                    total_steps=total_dirs,
-                    message=(
-                        f"Generated {generated_so_far}/{total_dirs - skipped_count} "
-                        f"directories ({skipped_count} unchanged)..."
+                pages.append(page)
+                # Save as soon as it completes, checkpointed for resuming
+                await self._save_page_with_frontmatter(page, checkpoint=all_summaries[dir_path])
+                generated_so_far = completed - skipped_count
+                await self._emit_progress(
+                    progress_callback,
+                    GenerationProgress(
+                        phase=GenerationPhase.DIRECTORIES,
+                        step=completed,
+                        total_steps=total_dirs,
+                        message=(
+                            f"Generated {generated_so_far}/{total_dirs - skipped_count} "
+                            f"directories ({skipped_count} unchanged)..."
+                        ),
                     ),
-                ),
-            )
+                )
 
         return pages, directory_summaries
 
+    @in_llm_phase(GenerationPhase.FILES)
     async def _run_files(
         self,
         analysis: dict,
@@ -1278,6 +2039,9 @@ class GenerationOrchestrator:
     ) -> tuple[list[GeneratedPage], dict[str, str], list[FileSummary], dict[str, str | None]]:
         """Run file generation phase with parallel processing and incremental support.
 
+        When run alongside the directory phase (see run()), content hashes and
+        summaries are also published to the shared file results as they become known.
+
         Args:
             analysis: Analysis results.
             progress_callback: Optional async callback for progress updates.
@@ -1386,19 +2150,27 @@ class GenerationOrchestrator:
             if ext in non_code_extensions or filename in non_code_names:
                 continue
 
-            # Process all other text files as source code
-            content = analysis["file_contents"].get(file_path, "")
-            if content:
+            # Process all other text files as source code, hashed during analysis
+            info = content_info(analysis["file_contents"], file_path)
+            if info is not None and info.size:
                 should_regen, content_hash, existing_info = self._should_regenerate_file(
-                    file_path, content, file_hashes
+                    file_path, "", file_hashes, content_hash=info.content_hash
                 )
                 if should_regen:
                     files_to_generate.append((file_path, content_hash))
                 else:
                     skipped_files.append((file_path, existing_info or {}))
 
-        # Create placeholder FileSummaries for skipped files
+        # Create placeholder FileSummaries for skipped files. Files completed by an
+        # interrupted generation were checkpointed with their full summary instead.
+        snapshot = self._get_page_snapshot()
         for file_path, existing_info in skipped_files:
+            checkpoint = snapshot.checkpoint("file", file_path, file_hashes[file_path])
+            if checkpoint is not None:
+                file_summaries.append(FileSummary.from_dict(checkpoint))
+                self._resumed["file"] += 1
+                continue
+
             stored_purpose = existing_info.get("purpose") or ""
             stored_layer = existing_info.get("layer") or "utility"  # Default to utility
             placeholder_summary = FileSummary(
@@ -1414,6 +2186,13 @@ class GenerationOrchestrator:
 
         skipped_count = len(skipped_files)
 
+        # Let the directory phase start on directories whose files are all unchanged
+        file_results = self._file_results
+        if file_results is not None:
+            file_results.hashes.update(file_hashes)
+            file_results.summaries.update((s.file_path, s) for s in file_summaries)
+            file_results.pending.expect(file_path for file_path, _ in files_to_generate)
+
         # Total includes both generated and skipped for accurate progress display
         total_files = len(files_to_generate) + skipped_count
 
@@ -1434,8 +2213,8 @@ class GenerationOrchestrator:
         # Get all imports for dependency diagram
         all_file_imports = analysis.get("file_imports", {})
 
-        # Get all parsed symbols from analysis (these are ParsedSymbol objects)
-        all_parsed_symbols: list[ParsedSymbol] = analysis.get("symbols", [])
+        # Per-file symbol lookup built once during analysis
+        index = self._get_analysis_index(analysis)
 
         # Build lookup of parsed files by path for synopsis extraction
         all_parsed_files: list[ParsedFile] = analysis.get("parsed_files", [])
@@ -1454,20 +2233,12 @@ class GenerationOrchestrator:
             file_path: str, content_hash: str
         ) -> tuple[GeneratedPage, FileSummary]:
             content = analysis["file_contents"].get(file_path, "")
-            # Filter symbols by file path and convert to dicts for generator
-            file_symbols = [
-                self._symbol_to_dict(s)
-                for s in all_parsed_symbols
-                if s.metadata.get("file") == file_path
-            ]
+            # Parsed symbols for this file (for class diagrams), plus dicts for the prompt
+            file_parsed_symbols = index.symbols_by_file.get(file_path, [])
+            file_symbols = [self._symbol_to_dict(s) for s in file_parsed_symbols]
             # Use imports collected during parsing (Task 4)
             imports = all_file_imports.get(file_path, [])
 
-            # Filter parsed symbols for this specific file (for class diagrams)
-            file_parsed_symbols = [
-                s for s in all_parsed_symbols if s.metadata.get("file") == file_path
-            ]
-
             # Load notes for this file
             notes = get_notes_for_target(self.db, "file", file_path)
 
@@ -1514,43 +2285,60 @@ class GenerationOrchestrator:
                                 )
 
             # FileGenerator.generate() returns (GeneratedPage, FileSummary)
-            page, file_summary = await self.file_generator.generate(
-                file_path=file_path,
-                content=content,
-                symbols=file_symbols,
-                imports=imports,
-                architecture_summary="",
-                parsed_symbols=file_parsed_symbols,
-                file_imports=all_file_imports,
-                notes=notes,
-                synopsis=synopsis,
-                call_site_synopsis=call_site_synopsis,
-            )
+            def generate(budget: ConcurrencyBudget | None = None):
+                return self.file_generator.generate(
+                    file_path=file_path,
+                    content=content,
+                    symbols=file_symbols,
+                    imports=imports,
+                    architecture_summary="",
+                    parsed_symbols=file_parsed_symbols,
+                    file_imports=all_file_imports,
+                    notes=notes,
+                    synopsis=synopsis,
+                    call_site_synopsis=call_site_synopsis,
+                    budget=budget,
+                )
+
+            with llm_page(file_path):
+                if self.file_generator.is_large(content):
+                    # Map-reduce: each chunk call of a large file takes its own slot
+                    page, file_summary = await generate(self._budget)
+                else:
+                    page, file_summary = await self._budget.run(file_path, generate)
             # Add source hash to the page for storage
             page.source_hash = content_hash
             return page, file_summary
 
-        # Process files in parallel batches, report as each completes
+        # Keep up to the budget's limit of files in flight; a new file starts as soon
+        # as any slot frees up, so one slow LLM call never stalls the rest of the window
         completed = skipped_count
-        for batch in batched(files_to_generate, self.parallel_limit):
-            tasks = [
-                asyncio.create_task(generate_file_page(file_path, content_hash))
-                for file_path, content_hash in batch
-            ]
-
-            for coro in asyncio.as_completed(tasks):
-                page, summary = await coro
+        results = run_bounded(
+            files_to_generate,
+            lambda item: generate_file_page(*item),
+            self._budget.max_limit,
+        )
+        async with aclosing(results):
+            async for (file_path, _), (page, summary) in results:
                 # Store summary data on page for incremental regeneration
                 page.purpose = summary.purpose
                 page.layer = summary.layer
                 pages.append(page)
                 file_summaries.append(summary)
                 file_layers[page.path] = summary.layer
+                # Save as soon as it completes, checkpointed for resuming
+                await self._save_page_with_frontmatter(
+                    page, layer=summary.layer, checkpoint=summary
+                )
 
                 # Index issues to IssuesStore
                 if summary.issues and self._issues_store:
                     self._issues_store.add_issues(summary.file_path, summary.issues)
 
+                if file_results is not None:
+                    file_results.summaries[file_path] = summary
+                    file_results.pending.complete(file_path)
+
                 completed += 1
                 generated_so_far = completed - skipped_count
                 await self._emit_progress(
@@ -1580,7 +2368,7 @@ class GenerationOrchestrator:
         return {
             "name": symbol.name,
             "type": symbol.symbol_type.value,
-            "file": symbol.metadata.get("file", ""),
+            "file": symbol.file or "",
             "line": symbol.start_line,
             "decorators": symbol.decorators,
         }
@@ -1616,67 +2404,47 @@ class GenerationOrchestrator:
         builder.compute_called_by()
 
     async def _save_page(self, page: GeneratedPage) -> None:
-        """Save a generated page to the wiki directory.
+        """Queue a generated page for saving to the wiki directory.
+
+        Pages are written and recorded in batches; call _flush_pages to persist
+        everything queued so far.
 
         Args:
             page: Generated page to save.
         """
-        # Determine full path
-        page_path = self.wiki_path / page.path
-
-        # Ensure parent directory exists
-        page_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write content
-        page_path.write_text(page.content, encoding="utf-8")
-
         # Build metadata JSON with source hash for incremental regeneration
         metadata = {}
         if page.source_hash:
             metadata["source_hash"] = page.source_hash
 
-        # Record in database (if method exists)
-        if hasattr(self.db, "execute"):
-            try:
-                self.db.execute(
-                    """
-                    INSERT OR REPLACE INTO wiki_pages
-                    (path, type, word_count, target, metadata, generated_at)
-                    VALUES (?, ?, ?, ?, ?, datetime('now'))
-                    """,
-                    (
-                        page.path,
-                        page.page_type,
-                        page.word_count,
-                        page.target,
-                        json.dumps(metadata) if metadata else None,
-                    ),
-                )
-                self.db.commit()
-            except sqlite3.OperationalError as e:
-                if "no such table" in str(e):
-                    logger.debug("Page tracking table not yet created, skipping record")
-                else:
-                    logger.error(f"Failed to record generated page: {e}")
-                    raise
+        await self._page_writer.add(
+            PendingPage(
+                path=page.path,
+                content=page.content,
+                page_type=page.page_type,
+                word_count=page.word_count,
+                target=page.target,
+                metadata=metadata,
+            )
+        )
 
     async def _save_page_with_frontmatter(
         self,
         page: GeneratedPage,
         layer: str | None = None,
+        checkpoint: FileSummary | DirectorySummary | None = None,
     ) -> None:
-        """Save a generated page with frontmatter metadata.
+        """Queue a generated page for saving with frontmatter metadata.
+
+        Pages are written and recorded in batches; call _flush_pages to persist
+        everything queued so far.
 
         Args:
             page: Generated page to save.
             layer: Architectural layer (for file pages).
+            checkpoint: Summary the page was generated with, checkpointed with the
+                page so an interrupted generation can resume without regenerating it.
         """
-        # Determine full path
-        page_path = self.wiki_path / page.path
-
-        # Ensure parent directory exists
-        page_path.parent.mkdir(parents=True, exist_ok=True)
-
         # Get current commit hash (short form for readability)
         commit = self.repo.get_head_commit()[:12]
 
@@ -1689,39 +2457,29 @@ class GenerationOrchestrator:
             layer=layer,
         )
 
-        # Write content with frontmatter
-        page_path.write_text(frontmatter + page.content, encoding="utf-8")
-
         # Build metadata JSON with source hash for incremental regeneration
         metadata = {}
         if page.source_hash:
             metadata["source_hash"] = page.source_hash
         if page.purpose:
             metadata["purpose"] = page.purpose
+        if page.signature_purpose:
+            metadata["signature_purpose"] = page.signature_purpose
         if page.layer:
             metadata["layer"] = page.layer
 
-        # Record in database (if method exists)
-        if hasattr(self.db, "execute"):
-            try:
-                self.db.execute(
-                    """
-                    INSERT OR REPLACE INTO wiki_pages
-                    (path, type, word_count, target, metadata, generated_at)
-                    VALUES (?, ?, ?, ?, ?, datetime('now'))
-                    """,
-                    (
-                        page.path,
-                        page.page_type,
-                        page.word_count,
-                        page.target,
-                        json.dumps(metadata) if metadata else None,
-                    ),
-                )
-                self.db.commit()
-            except sqlite3.OperationalError as e:
-                if "no such table" in str(e):
-                    logger.debug("Page tracking table not yet created, skipping record")
-                else:
-                    logger.error(f"Failed to record generated page: {e}")
-                    raise
+        await self._page_writer.add(
+            PendingPage(
+                path=page.path,
+                content=frontmatter + page.content,
+                page_type=page.page_type,
+                word_count=page.word_count,
+                target=page.target,
+                metadata=metadata,
+                checkpoint=json.dumps(checkpoint.to_dict()) if checkpoint else None,
+            )
+        )
+
+    async def _flush_pages(self) -> None:
+        """Write and record all queued pages in one batch."""
+        await self._page_writer.flush()
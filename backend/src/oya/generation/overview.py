@@ -24,6 +24,8 @@ class GeneratedPage:
         target: Optional target (file/directory path).
         source_hash: Hash of source content (for incremental regeneration).
         purpose: Purpose of directory/file (used in incremental regen).
+        signature_purpose: Purpose that parent directory signatures were computed
+            from, when directory damping is enabled.
         layer: Architectural layer for file pages (used in incremental regen).
     """
 
@@ -34,6 +36,7 @@ class GeneratedPage:
     target: str | None = None
     source_hash: str | None = None
     purpose: str | None = None
+    signature_purpose: str | None = None
     layer: str | None = None
 
 
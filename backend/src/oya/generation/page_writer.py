@@ -0,0 +1,156 @@
+"""Batched persistence of generated wiki pages.
+
+Saving pages one at a time costs a file write on the event loop plus an
+INSERT and a commit (one fsync) per page. PageWriter buffers pages and
+flushes them in batches: the markdown files are written in a worker thread,
+then the batch is recorded in wiki_pages with a single executemany and one
+commit. Pages can carry a checkpoint (the summary they were generated with),
+which is recorded in generation_checkpoints in the same transaction. Each
+persisted batch can be handed to a listener, e.g. to index it for search.
+
+Files are always written before their rows are committed, so after a crash
+the database never records a page whose file is missing. Pages from an
+unfinished batch have no row and are regenerated on the next run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from oya.fileio import replace_text
+
+logger = logging.getLogger(__name__)
+
+# Pages buffered before they are written and committed together
+PAGE_BATCH_SIZE = 100
+
+_INSERT_PAGE_SQL = """
+    INSERT OR REPLACE INTO wiki_pages
+    (path, type, word_count, target, metadata, generated_at)
+    VALUES (?, ?, ?, ?, ?, datetime('now'))
+"""
+
+_INSERT_CHECKPOINT_SQL = """
+    INSERT OR REPLACE INTO generation_checkpoints (kind, target, source_hash, summary)
+    VALUES (?, ?, ?, ?)
+"""
+
+
+@dataclass
+class PendingPage:
+    """A page waiting to be written to disk and recorded in the database.
+
+    Attributes:
+        path: Page path relative to the wiki directory.
+        content: Full file content, including any frontmatter.
+        page_type: Type of page (file, directory, overview, ...).
+        word_count: Word count of the page.
+        target: Target path for file/directory pages.
+        metadata: Metadata stored as JSON in wiki_pages (source hash, purpose, ...).
+        checkpoint: Optional JSON summary to checkpoint alongside the page.
+    """
+
+    path: str
+    content: str
+    page_type: str
+    word_count: int
+    target: str | None
+    metadata: dict
+    checkpoint: str | None = None
+
+
+class PageWriter:
+    """Buffers generated pages and persists them in batched transactions."""
+
+    def __init__(
+        self,
+        wiki_path: Path,
+        db,
+        batch_size: int = PAGE_BATCH_SIZE,
+        on_flush: Callable[[list[PendingPage]], None] | None = None,
+    ):
+        """Initialize the writer.
+
+        Args:
+            wiki_path: Directory the page files are written to.
+            db: Database for recording pages (skipped if it has no executemany).
+            batch_size: Number of buffered pages that triggers a flush.
+            on_flush: Optional callback receiving each batch once it is persisted.
+        """
+        self.wiki_path = Path(wiki_path)
+        self.db = db
+        self.batch_size = max(1, batch_size)
+        self.on_flush = on_flush
+        self._pending: list[PendingPage] = []
+
+    @property
+    def pending_count(self) -> int:
+        """Number of pages buffered but not yet flushed."""
+        return len(self._pending)
+
+    async def add(self, page: PendingPage) -> None:
+        """Buffer a page, flushing if the batch is full.
+
+        Args:
+            page: Page to persist.
+        """
+        self._pending.append(page)
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all buffered pages to disk and record them in one transaction."""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+
+        await asyncio.to_thread(self._write_files, batch)
+        self._record(batch)
+        if self.on_flush is not None:
+            self.on_flush(batch)
+
+    def _write_files(self, batch: list[PendingPage]) -> None:
+        """Write page files; runs in a worker thread."""
+        for page in batch:
+            page_path = self.wiki_path / page.path
+            page_path.parent.mkdir(parents=True, exist_ok=True)
+            replace_text(page_path, page.content)
+
+    def _record(self, batch: list[PendingPage]) -> None:
+        """Record a batch of pages and their checkpoints, and commit once."""
+        if not hasattr(self.db, "executemany"):
+            return
+
+        rows = [
+            (
+                page.path,
+                page.page_type,
+                page.word_count,
+                page.target,
+                json.dumps(page.metadata) if page.metadata else None,
+            )
+            for page in batch
+        ]
+        checkpoints = [
+            (page.page_type, page.target, page.metadata.get("source_hash"), page.checkpoint)
+            for page in batch
+            if page.checkpoint is not None and page.target and page.metadata.get("source_hash")
+        ]
+        try:
+            self.db.executemany(_INSERT_PAGE_SQL, rows)
+            if checkpoints:
+                self.db.executemany(_INSERT_CHECKPOINT_SQL, checkpoints)
+            self.db.commit()
+        except sqlite3.OperationalError as e:
+            if "no such table" in str(e):
+                logger.debug("Page tracking table not yet created, skipping record")
+            else:
+                logger.error(f"Failed to record generated pages: {e}")
+                self.db.rollback()
+                raise
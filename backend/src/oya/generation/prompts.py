@@ -104,6 +104,45 @@ Respond with valid JSON only, no additional text."""
 )
 
 
+SYNTHESIS_MERGE_TEMPLATE = PromptTemplate(
+    """Merge the following partial syntheses into one coherent understanding of the codebase.
+
+The codebase was too large to synthesize at once, so each partial synthesis below covers a different part of it.
+
+{partial_syntheses}
+
+---
+
+Combine the partial syntheses above and produce a JSON response with the following structure:
+
+```json
+{{
+  "key_components": [
+    {{
+      "name": "ComponentName",
+      "file": "path/to/file.py",
+      "role": "Description of what this component does and why it's important",
+      "layer": "api|domain|infrastructure|utility|config|test"
+    }}
+  ],
+  "dependency_graph": {{
+    "layer_name": ["dependent_layer1", "dependent_layer2"]
+  }},
+  "project_summary": "A comprehensive 2-3 sentence summary of what this project does, its main purpose, and key technologies used.",
+  "layer_interactions": "A 2-4 sentence description of how the architectural layers communicate with each other."
+}}
+```
+
+Guidelines:
+1. **key_components**: Keep the 5-15 most important components across ALL parts, not just the first one. Drop duplicates.
+2. **dependency_graph**: Union the layer dependencies of all parts.
+3. **project_summary**: Describe the project as a whole, drawing on every part.
+4. **layer_interactions**: Describe how the layers communicate across the whole codebase.
+
+Only use components and files that appear in the partial syntheses. Respond with valid JSON only, no additional text."""
+)
+
+
 # =============================================================================
 # Overview Template
 # =============================================================================
@@ -456,10 +495,7 @@ AUDIENCE: You are writing for developers who will maintain, debug, and extend th
 
 REQUIREMENT: You MUST always produce documentation. Every file has value to developers - explain what it does, why it exists, and how it works. Never skip documentation because a file seems "internal" or "trivial".
 
-## File Content
-```{language}
-{content}
-```
+{content_section}
 
 ## Symbols
 {symbols}
@@ -538,6 +574,48 @@ You MAY add additional sections after these if there's important information tha
 Format the output as clean Markdown suitable for a wiki page."""
 )
 
+
+# =============================================================================
+# File Chunk Template
+# =============================================================================
+
+FILE_CHUNK_TEMPLATE = PromptTemplate(
+    """Summarize part {part} of {total_parts} of the file "{file_path}" (lines {start_line}-{end_line}).
+
+The file is too large to document in one request. Your notes on each part will be combined into the file's documentation page, so be thorough but concise.
+
+## Symbols in This Part
+{symbols}
+
+## Content
+```{language}
+{content}
+```
+
+---
+
+Describe, in Markdown:
+1. Each class, function and constant in this part: what it does, its parameters and return values, and how it relates to other code
+2. Notable implementation details: control flow, error handling, state, concurrency
+3. Potential security, reliability or maintainability issues, with their line numbers
+
+Only describe what is in this part. Do NOT write a page title, an introduction or a YAML block."""
+)
+
+FILE_SECTIONS_MERGE_TEMPLATE = PromptTemplate(
+    """Combine your notes on consecutive parts of the file "{file_path}" into notes on lines {start_line}-{end_line}.
+
+The file is too large to document in one request, and there are too many notes on its parts to combine at once. Your combined notes will be merged with notes on the rest of the file into its documentation page.
+
+{sections}
+
+---
+
+Rewrite these notes as one set of notes, in Markdown. Keep every class, function and constant, what it does, and every potential issue with its line numbers; drop repetition and filler.
+
+Do NOT write a page title, an introduction or a YAML block."""
+)
+
 SYNOPSIS_INSTRUCTIONS_WITH_EXTRACTED = """
 An extracted synopsis from the source file's documentation is provided above.
 
@@ -1268,6 +1346,7 @@ def get_file_prompt(
     notes: list[dict[str, Any]] | None = None,
     synopsis: str | None = None,
     call_site_synopsis: str | None = None,
+    section_summaries: list[tuple[int, int, str]] | None = None,
 ) -> str:
     """Generate a prompt for creating a file documentation page.
 
@@ -1281,6 +1360,8 @@ def get_file_prompt(
         notes: Optional list of correction notes affecting this file.
         synopsis: Optional extracted synopsis code example from source file documentation.
         call_site_synopsis: Optional real usage example extracted from call sites in codebase.
+        section_summaries: Optional (start_line, end_line, summary) tuples for the parts
+            of a file too large to include; they replace the file content.
 
     Returns:
         The rendered prompt string.
@@ -1297,9 +1378,14 @@ def get_file_prompt(
         synopsis_instructions = SYNOPSIS_INSTRUCTIONS_WITHOUT_EXTRACTED
         extracted_synopsis = "No synopsis found in source file documentation."
 
+    if section_summaries:
+        content_section = _format_section_summaries(section_summaries)
+    else:
+        content_section = f"## File Content\n```{language}\n{content}\n```"
+
     prompt = FILE_TEMPLATE.render(
         file_path=file_path,
-        content=content,
+        content_section=content_section,
         symbols=_format_symbols(symbols),
         imports=_format_imports(imports),
         architecture_summary=architecture_summary or "No architecture context provided.",
@@ -1314,6 +1400,87 @@ def get_file_prompt(
     return prompt
 
 
+def get_file_chunk_prompt(
+    file_path: str,
+    content: str,
+    start_line: int,
+    end_line: int,
+    part: int,
+    total_parts: int,
+    symbols: list[dict[str, Any]],
+    language: str = "",
+) -> str:
+    """Generate a prompt for summarizing one part of a large file.
+
+    Args:
+        file_path: Path to the file.
+        content: Content of this part of the file.
+        start_line: First line of the part (1-indexed).
+        end_line: Last line of the part (1-indexed).
+        part: Position of the part within the file (1-indexed).
+        total_parts: Number of parts the file is split into.
+        symbols: List of symbol dictionaries defined in this part.
+        language: Programming language for syntax highlighting.
+
+    Returns:
+        The rendered prompt string.
+    """
+    return FILE_CHUNK_TEMPLATE.render(
+        file_path=file_path,
+        content=content,
+        start_line=start_line,
+        end_line=end_line,
+        part=part,
+        total_parts=total_parts,
+        symbols=_format_symbols(symbols),
+        language=language,
+    )
+
+
+def get_file_sections_merge_prompt(
+    file_path: str,
+    section_summaries: list[tuple[int, int, str]],
+) -> str:
+    """Generate a prompt for combining the summaries of consecutive parts of a large file.
+
+    Args:
+        file_path: Path to the file.
+        section_summaries: (start_line, end_line, summary) tuples in file order.
+
+    Returns:
+        The rendered prompt string.
+    """
+    sections = []
+    for start_line, end_line, summary in section_summaries:
+        sections.append(f"### Lines {start_line}-{end_line}\n\n{summary.strip()}")
+    return FILE_SECTIONS_MERGE_TEMPLATE.render(
+        file_path=file_path,
+        start_line=section_summaries[0][0],
+        end_line=section_summaries[-1][1],
+        sections="\n\n".join(sections),
+    )
+
+
+def _format_section_summaries(section_summaries: list[tuple[int, int, str]]) -> str:
+    """Format summaries of a large file's parts in place of its content.
+
+    Args:
+        section_summaries: (start_line, end_line, summary) tuples in file order.
+
+    Returns:
+        Formatted string with a heading per part.
+    """
+    lines = [
+        "## File Content (Summarized)",
+        "The file is too large to include in full. These are detailed notes on each "
+        "part of it, in order. Base the documentation on them.",
+    ]
+    for start_line, end_line, summary in section_summaries:
+        lines.append(f"\n### Lines {start_line}-{end_line}\n")
+        lines.append(summary.strip())
+    return "\n".join(lines)
+
+
 def _format_notes(notes: list[dict[str, Any]]) -> str:
     """Format notes for inclusion in a prompt.
 
@@ -1431,6 +1598,30 @@ def get_synthesis_prompt(
     )
 
 
+def get_synthesis_merge_prompt(partial_maps: list[Any]) -> str:
+    """Generate a prompt for merging partial syntheses of a large codebase.
+
+    Args:
+        partial_maps: SynthesisMap objects, each covering part of the codebase.
+
+    Returns:
+        The rendered prompt string.
+    """
+    sections = []
+    for idx, partial in enumerate(partial_maps, start=1):
+        dependencies = "\n".join(
+            f"- {layer} -> {', '.join(deps)}" for layer, deps in partial.dependency_graph.items()
+        )
+        sections.append(
+            f"## Partial Synthesis {idx}\n\n"
+            f"### Project Summary\n{partial.project_summary or 'No summary.'}\n\n"
+            f"### Layer Interactions\n{partial.layer_interactions or 'Not described.'}\n\n"
+            f"### Dependency Graph\n{dependencies or 'No dependencies.'}\n\n"
+            f"### Key Components\n{_format_synthesis_key_components(partial)}"
+        )
+    return SYNTHESIS_MERGE_TEMPLATE.render(partial_syntheses="\n\n".join(sections))
+
+
 # =============================================================================
 # Graph-Augmented Q&A (Phase 4)
 # =============================================================================
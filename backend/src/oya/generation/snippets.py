@@ -1,5 +1,6 @@
 """Call-site snippet extraction for synopsis generation."""
 
+from collections.abc import Mapping
 from pathlib import Path
 
 from oya.graph.models import CallSite
@@ -51,7 +52,7 @@ def is_test_file(file_path: str) -> bool:
 def extract_call_snippet(
     file_path: str,
     call_line: int,
-    file_contents: dict[str, str],
+    file_contents: Mapping[str, str],
     context_before: int = 10,
     context_after: int = 10,
 ) -> str:
@@ -101,7 +102,7 @@ def extract_call_snippet(
 
 def select_best_call_site(
     call_sites: list[CallSite],
-    file_contents: dict[str, str],
+    file_contents: Mapping[str, str],
     target_file: str | None = None,
 ) -> tuple[CallSite | None, list[CallSite]]:
     """Select the best call site for synopsis, return others for reference.
@@ -3,57 +3,195 @@
 Wiki generation builds in .oyawiki-building and only promotes to .oyawiki
 on successful completion. This ensures that:
 1. Interrupted builds don't corrupt the existing wiki
-2. Failed builds are preserved for debugging
+2. Failed builds are preserved for debugging, and resumed by the next build
 3. The wiki is always in a consistent state
+
+Staging starts from the production wiki without copying it: files are cloned
+with reflinks where the filesystem supports them, and otherwise hardlinked.
+Files in the wiki are written by replacement (see oya.fileio), so a rebuilt
+page never changes the production copy it was linked to. Databases and vector
+stores, which are modified in place, are cloned or copied instead.
 """
 
+import ctypes
+import os
 import shutil
+import sys
 from pathlib import Path
 
 from oya.config import ConfigError, load_settings
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+# Marks a fully prepared staging directory that an interrupted build may resume;
+# contains the generation mode it was prepared for
+RESUME_MARKER = ".resume"
+
+# Directories of stores that write their files in place; never hardlinked
+IN_PLACE_DIRS = frozenset({"chroma", "vectorstore"})
+
+# SQLite databases and their journals, also written in place
+IN_PLACE_SUFFIXES = (".db", ".db-wal", ".db-shm", ".db-journal", ".sqlite3")
 
-def prepare_staging_directory(staging_path: Path, production_path: Path) -> None:
+# Linux ioctl that clones a file's extents (btrfs, XFS, ...), so both copies
+# share storage until either is written
+FICLONE = 0x40049409
+
+# renameat2() arguments for swapping two directories in one step on Linux
+AT_FDCWD = -100
+RENAME_EXCHANGE = 2
+
+
+def _reflink(src: str, dst: str) -> bool:
+    """Clone a file with a reflink; returns False if the filesystem can't."""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        with open(src, "rb") as source, open(dst, "wb") as target:
+            fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+    except OSError:
+        Path(dst).unlink(missing_ok=True)
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def _written_in_place(relative: Path) -> bool:
+    """Check if a wiki file is modified in place, so must not be hardlinked."""
+    return relative.name.endswith(IN_PLACE_SUFFIXES) or any(
+        part in IN_PLACE_DIRS for part in relative.parts[:-1]
+    )
+
+
+def share_tree(source: Path, destination: Path) -> None:
+    """Recreate a directory tree, sharing file storage with the original.
+
+    Files are cloned with reflinks where supported. Otherwise files that are
+    only ever replaced are hardlinked, and files written in place are copied.
+
+    Args:
+        source: Directory to share.
+        destination: New directory; must not exist.
+    """
+
+    def share_file(src: str, dst: str) -> None:
+        if _reflink(src, dst):
+            return
+        if not _written_in_place(Path(src).relative_to(source)):
+            try:
+                os.link(src, dst)
+                return
+            except OSError:
+                pass  # Across filesystems, or links unsupported
+        shutil.copy2(src, dst)
+
+    shutil.copytree(source, destination, copy_function=share_file)
+
+
+def _exchange(first: Path, second: Path) -> bool:
+    """Atomically swap two directories, if the platform supports it."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return False  # C library without renameat2
+    renameat2.argtypes = [
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_uint,
+    ]
+    renameat2.restype = ctypes.c_int
+    result: int = renameat2(
+        AT_FDCWD, os.fsencode(first), AT_FDCWD, os.fsencode(second), RENAME_EXCHANGE
+    )
+    return result == 0
+
+
+def prepare_staging_directory(
+    staging_path: Path, production_path: Path, mode: str | None = None
+) -> bool:
     """Prepare the staging directory for a new build.
 
     If a production directory exists (from a successful previous build),
-    copies it to staging for incremental regeneration. Otherwise creates
-    an empty staging directory.
+    staging starts as a copy of it for incremental regeneration, built with
+    share_tree so unchanged files are not duplicated. Otherwise creates an
+    empty staging directory.
 
-    Always removes any existing staging directory first to avoid corruption
-    from a previous incomplete build.
+    Any existing staging directory is removed first to avoid corruption from
+    a previous incomplete build, unless it can be resumed: when `mode` is
+    given and the staging directory was fully prepared by an interrupted
+    build of the same mode, it is kept so the build continues from the pages
+    it already checkpointed.
 
     Args:
         staging_path: Path to the staging directory (.oyawiki-building).
         production_path: Path to the production directory (.oyawiki).
+        mode: Generation mode ('full' or 'incremental') to allow resuming.
+
+    Returns:
+        True if an interrupted build was resumed, False if staging was rebuilt.
     """
-    # Always wipe staging first to avoid corruption from incomplete builds
+    marker = staging_path / RESUME_MARKER
+    if mode is not None and marker.exists():
+        try:
+            if marker.read_text(encoding="utf-8").strip() == mode:
+                return True
+        except OSError:
+            pass
+
+    # Wipe staging to avoid corruption from incomplete builds
     if staging_path.exists():
         shutil.rmtree(staging_path)
 
-    # Copy production to staging for incremental regeneration, or create empty
+    # Share production with staging for incremental regeneration, or create empty
     if production_path.exists():
-        shutil.copytree(production_path, staging_path)
+        share_tree(production_path, staging_path)
     else:
         staging_path.mkdir(parents=True, exist_ok=True)
 
+    # Written last, so a staging directory is only resumed if it was fully prepared
+    if mode is not None:
+        marker.write_text(mode, encoding="utf-8")
+    return False
+
 
 def promote_staging_to_production(staging_path: Path, production_path: Path) -> None:
     """Promote staging directory to production.
 
-    Replaces the production directory with the staging directory contents.
-    This is an atomic-ish operation that ensures the wiki is always consistent.
+    Replaces the production directory with the staging directory by renaming.
+    On Linux the two directories are swapped in one atomic step, so readers
+    never find the wiki missing; elsewhere production is absent only between
+    two renames. The previous build is deleted afterwards.
 
     Args:
         staging_path: Path to the staging directory (.oyawiki-building).
         production_path: Path to the production directory (.oyawiki).
     """
-    # Remove existing production if it exists
-    if production_path.exists():
-        shutil.rmtree(production_path)
+    # A promoted build is complete; it must not be resumed from production copies
+    (staging_path / RESUME_MARKER).unlink(missing_ok=True)
+
+    if not production_path.exists():
+        shutil.move(str(staging_path), str(production_path))
+        return
+
+    previous_path = production_path.with_name(f"{production_path.name}-previous")
+    if previous_path.exists():
+        shutil.rmtree(previous_path)
+
+    if _exchange(staging_path, production_path):
+        # Staging now holds the previous build
+        os.rename(staging_path, previous_path)
+    else:
+        os.rename(production_path, previous_path)
+        os.rename(staging_path, production_path)
 
-    # Move staging to production
-    shutil.move(str(staging_path), str(production_path))
+    shutil.rmtree(previous_path)
 
 
 def has_incomplete_build(workspace_path: Path) -> bool:
@@ -7,10 +7,13 @@ directory summaries into a coherent codebase understanding map (SynthesisMap).
 import hashlib
 import json
 import logging
+from collections.abc import Awaitable
 from datetime import datetime, timezone
 from pathlib import Path
 
 from oya.config import ConfigError, load_settings
+from oya.fileio import replace_text
+from oya.generation.concurrency import ConcurrencyBudget, run_concurrently
 from oya.generation.summaries import (
     ComponentInfo,
     DirectorySummary,
@@ -18,10 +21,28 @@ from oya.generation.summaries import (
     LayerInfo,
     SynthesisMap,
 )
-from oya.generation.prompts import get_synthesis_prompt, SYSTEM_PROMPT
+from oya.generation.prompts import (
+    SYSTEM_PROMPT,
+    get_synthesis_merge_prompt,
+    get_synthesis_prompt,
+)
 
 logger = logging.getLogger(__name__)
 
+# Number of partial synthesis maps merged by one LLM call. Batch maps are merged
+# in tiers of this fan-in, so the number of sequential LLM rounds grows with the
+# logarithm of the number of batches.
+SYNTHESIS_MERGE_FAN_IN = 8
+
+# Largest share of files that may change for synthesis to update the previous
+# map in place; beyond it the whole codebase is synthesized again.
+INCREMENTAL_SYNTHESIS_MAX_SHARE = 0.25
+
+# Share of synthesis facts (layer membership, components, dependencies, entry
+# points, tech stack, summaries) that must change before the pages built from
+# the map are regenerated.
+SYNTHESIS_CHANGE_THRESHOLD = 0.05
+
 
 class SynthesisGenerator:
     """Generates Synthesis_Map from collected file and directory summaries.
@@ -35,17 +56,25 @@ class SynthesisGenerator:
         llm_client: The LLM client for generating project summaries and
                    identifying patterns (can be None for layer grouping only).
         context_limit: Maximum tokens allowed in a single LLM call.
+        budget: Optional concurrency budget that every LLM call takes a slot from.
     """
 
-    def __init__(self, llm_client, context_limit: int | None = None):
+    def __init__(
+        self,
+        llm_client,
+        context_limit: int | None = None,
+        budget: ConcurrencyBudget | None = None,
+    ):
         """Initialize the SynthesisGenerator.
 
         Args:
             llm_client: The LLM client for generating summaries. Can be None
                        if only using layer grouping functionality.
             context_limit: Maximum tokens allowed in a single LLM call.
+            budget: Optional concurrency budget shared with other generation phases.
         """
         self.llm_client = llm_client
+        self.budget = budget
         if context_limit is None:
             try:
                 settings = load_settings()
@@ -85,27 +114,135 @@ class SynthesisGenerator:
             total_tokens = self.estimate_token_count(file_summaries, directory_summaries)
 
             if total_tokens > self.context_limit:
-                # Process in batches
+                # Process in batches, all at once (bounded by the budget)
                 batches = self.create_batches(
                     file_summaries, directory_summaries, self.context_limit
                 )
-
-                # Process each batch and collect results
-                batch_results = []
-                for batch_file_summaries, batch_dir_summaries in batches:
-                    batch_result = await self._process_batch(
-                        batch_file_summaries, batch_dir_summaries
+                batch_results = await run_concurrently(
+                    *(
+                        self._process_batch(batch_file_summaries, batch_dir_summaries)
+                        for batch_file_summaries, batch_dir_summaries in batches
                     )
-                    batch_results.append(batch_result)
+                )
 
-                # Merge batch results
-                synthesis_map = self.merge_batch_results(batch_results)
+                # Merge batch results in tiers
+                synthesis_map = await self.reduce_batch_results(batch_results)
             else:
                 # Process all at once
                 synthesis_map = await self._process_batch(file_summaries, directory_summaries)
 
         return synthesis_map
 
+    async def update(
+        self,
+        previous: SynthesisMap,
+        file_summaries: list[FileSummary],
+        directory_summaries: list[DirectorySummary],
+        changed_files: set[str],
+    ) -> SynthesisMap:
+        """Update a previous SynthesisMap after some files changed.
+
+        Layers are regrouped from all summaries, but only the layers affected
+        by the changed files are synthesized again with the LLM. Components and
+        dependencies of other layers, and the project summary and layer
+        interactions, are kept from the previous map. Falls back to a full
+        generate() when too many files changed or the set of layers changed.
+
+        Args:
+            previous: SynthesisMap from the last generation.
+            file_summaries: FileSummary objects of all current files.
+            directory_summaries: DirectorySummary objects of all directories.
+            changed_files: Paths of the files regenerated since the previous map.
+
+        Returns:
+            The updated SynthesisMap.
+        """
+        synthesis_map = self.group_files_by_layer(file_summaries)
+        if self.llm_client is None:
+            return synthesis_map
+
+        if (
+            not previous.project_summary
+            or set(previous.layers) != set(synthesis_map.layers)
+            or len(changed_files) > INCREMENTAL_SYNTHESIS_MAX_SHARE * len(file_summaries)
+        ):
+            return await self.generate(file_summaries, directory_summaries)
+
+        affected_layers = self.affected_layers(previous, synthesis_map, changed_files)
+        logger.info(
+            f"Updating synthesis for {len(changed_files)} changed files "
+            f"in layers: {', '.join(sorted(affected_layers)) or 'none'}"
+        )
+
+        synthesis_map.project_summary = previous.project_summary
+        synthesis_map.layer_interactions = previous.layer_interactions
+        current_files = {fs.file_path for fs in file_summaries}
+        kept_components = [
+            comp
+            for comp in previous.key_components
+            if comp.layer not in affected_layers and comp.file in current_files
+        ]
+        synthesis_map.dependency_graph = {
+            layer: list(deps) for layer, deps in previous.dependency_graph.items()
+        }
+
+        if not affected_layers:
+            synthesis_map.key_components = kept_components
+            return synthesis_map
+
+        affected_summaries = [fs for fs in file_summaries if fs.layer in affected_layers]
+        affected_dirs = {str(Path(fs.file_path).parent) for fs in affected_summaries}
+        partial = await self.generate(
+            affected_summaries,
+            [ds for ds in directory_summaries if (ds.directory_path or ".") in affected_dirs],
+        )
+
+        new_components = [comp for comp in partial.key_components if comp.layer in affected_layers]
+        if not new_components:
+            # The LLM call failed or found nothing; keep what was known about these layers
+            new_components = [
+                comp
+                for comp in previous.key_components
+                if comp.layer in affected_layers and comp.file in current_files
+            ]
+        synthesis_map.key_components = kept_components + new_components
+
+        for layer, deps in partial.dependency_graph.items():
+            if layer not in affected_layers:
+                continue
+            merged_deps = synthesis_map.dependency_graph.setdefault(layer, [])
+            merged_deps.extend(dep for dep in deps if dep not in merged_deps)
+
+        return synthesis_map
+
+    def affected_layers(
+        self,
+        previous: SynthesisMap,
+        current: SynthesisMap,
+        changed_files: set[str],
+    ) -> set[str]:
+        """Find the layers whose synthesis is affected by changed files.
+
+        Args:
+            previous: SynthesisMap from the last generation.
+            current: SynthesisMap with the current layer grouping.
+            changed_files: Paths of the files regenerated since the previous map.
+
+        Returns:
+            Layers containing a changed file, or whose set of files changed.
+        """
+        affected = {
+            name
+            for name, layer in current.layers.items()
+            if any(f in changed_files for f in layer.files)
+        }
+        for name in set(previous.layers) | set(current.layers):
+            before = previous.layers.get(name)
+            after = current.layers.get(name)
+            if set(before.files if before else []) != set(after.files if after else []):
+                affected.add(name)
+        return affected
+
     async def _process_batch(
         self,
         file_summaries: list[FileSummary],
@@ -131,27 +268,14 @@ class SynthesisGenerator:
 
         try:
             # Call LLM
-            try:
-                settings = load_settings()
-                temperature = settings.generation.temperature
-            except (ValueError, OSError, ConfigError):
-                # Settings not available
-                temperature = 0.3  # Default from CONFIG_SCHEMA
-            response = await self.llm_client.generate(
-                prompt=prompt,
-                system_prompt=SYSTEM_PROMPT,
-                temperature=temperature,
-            )
+            response = await self._generate("synthesis", prompt)
 
             # Parse JSON response
             llm_result = self._parse_llm_response(response)
 
             # Merge LLM results into synthesis map
             if llm_result:
-                synthesis_map.key_components = llm_result.get("key_components", [])
-                synthesis_map.dependency_graph = llm_result.get("dependency_graph", {})
-                synthesis_map.project_summary = llm_result.get("project_summary", "")
-                synthesis_map.layer_interactions = llm_result.get("layer_interactions", "")
+                self._apply_llm_result(synthesis_map, llm_result)
         except Exception as e:
             logger.error(
                 "LLM call failed during synthesis, falling back to basic layer grouping. "
@@ -160,6 +284,99 @@ class SynthesisGenerator:
 
         return synthesis_map
 
+    async def reduce_batch_results(self, batch_results: list[SynthesisMap]) -> SynthesisMap:
+        """Merge batch results with the LLM in a tree of concurrent merges.
+
+        Each tier merges groups of SYNTHESIS_MERGE_FAN_IN maps concurrently,
+        until a single map remains.
+
+        Args:
+            batch_results: List of SynthesisMap objects from batch processing.
+
+        Returns:
+            A merged SynthesisMap covering all batches.
+        """
+        results = batch_results
+        while len(results) > 1:
+            groups = [
+                results[i : i + SYNTHESIS_MERGE_FAN_IN]
+                for i in range(0, len(results), SYNTHESIS_MERGE_FAN_IN)
+            ]
+            results = await run_concurrently(*(self._merge_group(group) for group in groups))
+        return results[0] if results else SynthesisMap()
+
+    async def _merge_group(self, group: list[SynthesisMap]) -> SynthesisMap:
+        """Merge one group of partial maps using the LLM.
+
+        Layers are merged directly; key components, dependencies and summaries
+        are combined by the LLM, falling back to merge_batch_results on failure.
+
+        Args:
+            group: Partial SynthesisMap objects to merge.
+
+        Returns:
+            The merged SynthesisMap.
+        """
+        merged = self.merge_batch_results(group)
+        if len(group) == 1 or self.llm_client is None:
+            return merged
+
+        prompt = get_synthesis_merge_prompt(group)
+
+        try:
+            response = await self._generate("synthesis merge", prompt)
+            llm_result = self._parse_llm_response(response)
+            if llm_result:
+                self._apply_llm_result(merged, llm_result)
+        except Exception as e:
+            logger.error(
+                "LLM call failed while merging synthesis batches, falling back to basic merge. "
+                f"Error: {type(e).__name__}: {e}"
+            )
+
+        return merged
+
+    async def _generate(self, item: str, prompt: str) -> str:
+        """Make one synthesis LLM call, in a budget slot if a budget is set.
+
+        Args:
+            item: The unit of work, reported if the call times out.
+            prompt: Prompt to send.
+
+        Returns:
+            Raw LLM response.
+        """
+        try:
+            settings = load_settings()
+            temperature = settings.generation.temperature
+        except (ValueError, OSError, ConfigError):
+            # Settings not available
+            temperature = 0.3  # Default from CONFIG_SCHEMA
+
+        def call() -> Awaitable[str]:
+            response: Awaitable[str] = self.llm_client.generate(
+                prompt=prompt,
+                system_prompt=SYSTEM_PROMPT,
+                temperature=temperature,
+            )
+            return response
+
+        if self.budget is None:
+            return await call()
+        return await self.budget.run(item, call)
+
+    def _apply_llm_result(self, synthesis_map: SynthesisMap, llm_result: dict) -> None:
+        """Copy parsed LLM synthesis fields onto a synthesis map.
+
+        Args:
+            synthesis_map: Map to update in place.
+            llm_result: Result of _parse_llm_response.
+        """
+        synthesis_map.key_components = llm_result.get("key_components", [])
+        synthesis_map.dependency_graph = llm_result.get("dependency_graph", {})
+        synthesis_map.project_summary = llm_result.get("project_summary", "")
+        synthesis_map.layer_interactions = llm_result.get("layer_interactions", "")
+
     def _parse_llm_response(self, response: str) -> dict | None:
         """Parse the LLM JSON response.
 
@@ -448,12 +665,57 @@ class SynthesisGenerator:
         return layer_purposes.get(layer_name, f"Files classified as {layer_name}")
 
 
-def save_synthesis_map(synthesis_map: SynthesisMap, meta_path: str) -> str:
+def synthesis_change_ratio(previous: SynthesisMap, current: SynthesisMap) -> float:
+    """Measure how much a SynthesisMap changed.
+
+    Both maps are reduced to sets of facts (layer membership, key components,
+    dependency edges, entry points, tech stack entries and summary texts);
+    the ratio is the share of all facts that appear in only one of them.
+    Code metrics are left out, since they drift with every edit.
+
+    Args:
+        previous: Earlier SynthesisMap.
+        current: New SynthesisMap.
+
+    Returns:
+        Change ratio between 0.0 (identical) and 1.0 (nothing in common).
+    """
+    before = _synthesis_facts(previous)
+    after = _synthesis_facts(current)
+    union = before | after
+    if not union:
+        return 0.0
+    return len(before ^ after) / len(union)
+
+
+def _synthesis_facts(synthesis_map: SynthesisMap) -> set[tuple[str, ...]]:
+    """Reduce a SynthesisMap to a set of comparable facts."""
+    facts: set[tuple[str, ...]] = set()
+    for name, layer in synthesis_map.layers.items():
+        facts.update(("layer", name, f) for f in layer.files)
+    for comp in synthesis_map.key_components:
+        facts.add(("component", comp.name, comp.file, comp.layer))
+    for layer_name, deps in synthesis_map.dependency_graph.items():
+        facts.update(("dependency", layer_name, dep) for dep in deps)
+    for ep in synthesis_map.entry_points:
+        facts.add(("entry_point", ep.name, ep.file, ep.entry_type))
+    for language, categories in synthesis_map.tech_stack.items():
+        for category, libraries in categories.items():
+            facts.update(("tech", language, category, lib) for lib in libraries)
+    facts.add(("project_summary", synthesis_map.project_summary))
+    facts.add(("layer_interactions", synthesis_map.layer_interactions))
+    return facts
+
+
+def save_synthesis_map(
+    synthesis_map: SynthesisMap, meta_path: str, filename: str = "synthesis.json"
+) -> str:
     """Save a SynthesisMap to synthesis.json in the meta directory.
 
     Args:
         synthesis_map: The SynthesisMap to save.
         meta_path: Path to the .oyawiki/meta directory.
+        filename: Name of the file to save to.
 
     Returns:
         Path to the saved synthesis.json file.
@@ -461,7 +723,7 @@ def save_synthesis_map(synthesis_map: SynthesisMap, meta_path: str) -> str:
     meta_dir = Path(meta_path)
     meta_dir.mkdir(parents=True, exist_ok=True)
 
-    synthesis_path = meta_dir / "synthesis.json"
+    synthesis_path = meta_dir / filename
 
     # Get the JSON representation
     json_content = synthesis_map.to_json()
@@ -475,22 +737,24 @@ def save_synthesis_map(synthesis_map: SynthesisMap, meta_path: str) -> str:
     data["synthesis_hash"] = synthesis_hash
 
     # Write to file
-    with open(synthesis_path, "w") as f:
-        json.dump(data, f, indent=2)
+    replace_text(synthesis_path, json.dumps(data, indent=2))
 
     return str(synthesis_path)
 
 
-def load_synthesis_map(meta_path: str) -> tuple[SynthesisMap | None, str | None]:
+def load_synthesis_map(
+    meta_path: str, filename: str = "synthesis.json"
+) -> tuple[SynthesisMap | None, str | None]:
     """Load a SynthesisMap from synthesis.json in the meta directory.
 
     Args:
         meta_path: Path to the .oyawiki/meta directory.
+        filename: Name of the file to load from.
 
     Returns:
         Tuple of (SynthesisMap, synthesis_hash) or (None, None) if not found.
     """
-    synthesis_path = Path(meta_path) / "synthesis.json"
+    synthesis_path = Path(meta_path) / filename
 
     if not synthesis_path.exists():
         return None, None
@@ -556,14 +556,12 @@ class WorkflowGenerator:
             Dictionary with context for the prompt.
         """
         # Filter symbols to related files
-        related_symbols = [
-            s for s in symbols if s.metadata.get("file") in workflow_group.related_files
-        ]
+        related_symbols = [s for s in symbols if s.file in workflow_group.related_files]
 
         # Format code context from symbols
         code_context = ""
         for symbol in related_symbols[:20]:  # Limit to avoid huge prompts
-            file = symbol.metadata.get("file", "")
+            file = symbol.file or ""
             code_context += f"- {symbol.name} ({symbol.symbol_type.value}) in {file}\n"
 
         return {
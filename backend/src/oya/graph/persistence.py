@@ -6,6 +6,8 @@ from pathlib import Path
 
 import networkx as nx
 
+from oya.fileio import replace_text
+
 
 def save_graph(graph: nx.DiGraph, output_dir: Path) -> None:
     """Save graph to JSON files.
@@ -42,8 +44,7 @@ def save_graph(graph: nx.DiGraph, output_dir: Path) -> None:
     # Sort for determinism
     nodes.sort(key=lambda n: n["id"])
 
-    with open(output_dir / "nodes.json", "w") as f:
-        json.dump(nodes, f, indent=2)
+    replace_text(output_dir / "nodes.json", json.dumps(nodes, indent=2))
 
     # Serialize edges
     edges = []
@@ -61,8 +62,7 @@ def save_graph(graph: nx.DiGraph, output_dir: Path) -> None:
     # Sort for determinism
     edges.sort(key=lambda e: (e["source"], e["target"]))
 
-    with open(output_dir / "edges.json", "w") as f:
-        json.dump(edges, f, indent=2)
+    replace_text(output_dir / "edges.json", json.dumps(edges, indent=2))
 
     # Write metadata
     metadata = {
@@ -71,8 +71,7 @@ def save_graph(graph: nx.DiGraph, output_dir: Path) -> None:
         "edge_count": graph.number_of_edges(),
     }
 
-    with open(output_dir / "metadata.json", "w") as f:
-        json.dump(metadata, f, indent=2)
+    replace_text(output_dir / "metadata.json", json.dumps(metadata, indent=2))
 
 
 def load_graph(input_dir: Path) -> nx.DiGraph:
@@ -1,5 +1,6 @@
 """Indexing module for wiki content search."""
 
 from oya.indexing.service import IndexingService
+from oya.indexing.streaming import StreamingIndexer
 
-__all__ = ["IndexingService"]
+__all__ = ["IndexingService", "StreamingIndexer"]
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from oya.generation.summaries import SynthesisMap
+from oya.generation.summaries import EntryPointInfo, SynthesisMap
 
 
 class MetadataExtractor:
@@ -13,10 +13,15 @@ class MetadataExtractor:
         synthesis_map: SynthesisMap | None = None,
         symbols: list[dict[str, Any]] | None = None,
         file_imports: dict[str, list[str]] | None = None,
+        entry_points: list[EntryPointInfo] | None = None,
     ) -> None:
         self._synthesis_map = synthesis_map
         self._symbols = symbols or []
         self._file_imports = file_imports or {}
+        # Entry points can be given before a synthesis map exists
+        if entry_points is None and synthesis_map:
+            entry_points = synthesis_map.entry_points
+        self._entry_points = entry_points or []
 
         # Build file-to-layer index
         self._file_to_layer: dict[str, str] = {}
@@ -54,11 +59,8 @@ class MetadataExtractor:
 
     def get_entry_points_for_file(self, source_file: str) -> list[str]:
         """Get entry points defined in a source file."""
-        if not self._synthesis_map or not self._synthesis_map.entry_points:
-            return []
-
         entry_points: list[str] = []
-        for ep in self._synthesis_map.entry_points:
+        for ep in self._entry_points:
             if ep.file == source_file:
                 if ep.description:
                     entry_points.append(f"{ep.entry_type.upper()} {ep.description}")
@@ -1,5 +1,6 @@
 """Indexing service for wiki content into vector store and FTS."""
 
+import asyncio
 import json
 import re
 from datetime import datetime, timezone
@@ -7,6 +8,7 @@ from pathlib import Path
 from typing import Any, Callable, Coroutine
 
 from oya.db.connection import Database
+from oya.fileio import replace_text
 from oya.generation.summaries import SynthesisMap
 from oya.indexing.chunking import Chunk, ChunkingService, ChunkMetadata
 from oya.indexing.metadata import MetadataExtractor
@@ -58,6 +60,7 @@ class IndexingService:
         synthesis_map: SynthesisMap | None = None,
         analysis_symbols: list[dict[str, Any]] | None = None,
         file_imports: dict[str, list[str]] | None = None,
+        exclude: set[str] | None = None,
     ) -> int:
         """Index all wiki pages into vector store and FTS.
 
@@ -68,6 +71,7 @@ class IndexingService:
             synthesis_map: Optional SynthesisMap for enriching chunk metadata with layers.
             analysis_symbols: Optional list of symbol dicts from code analysis.
             file_imports: Optional mapping of file paths to their imports.
+            exclude: Optional wiki-relative paths of pages that are already indexed.
 
         Returns:
             Number of pages indexed.
@@ -76,10 +80,15 @@ class IndexingService:
             return 0
 
         # First, collect all markdown files to get total count
-        md_files = list(self._wiki_path.rglob("*.md"))
+        md_files = [
+            md_file
+            for md_file in self._wiki_path.rglob("*.md")
+            if not exclude or str(md_file.relative_to(self._wiki_path)) not in exclude
+        ]
         total_files = len(md_files)
 
-        if total_files == 0:
+        # Pages indexed elsewhere still need the embedding metadata saved below
+        if total_files == 0 and not exclude:
             return 0
 
         # Initialize metadata extractor if analysis data provided
@@ -103,48 +112,7 @@ class IndexingService:
             content = md_file.read_text(encoding="utf-8")
             rel_path = str(md_file.relative_to(self._wiki_path))
 
-            # Extract title from first H1 header
-            title = self._extract_title(content, rel_path)
-
-            # Determine page type from path
-            page_type = self._determine_type(rel_path)
-
-            # Extract source file path from title (for file pages)
-            source_file = self._extract_source_file(title, page_type)
-
-            # Get base metadata from analysis data if available
-            base_metadata: ChunkMetadata | None = None
-            if metadata_extractor and source_file:
-                base_metadata = ChunkMetadata(
-                    path=rel_path,
-                    title=title,
-                    type=page_type,
-                    section_header="",
-                    chunk_index=0,
-                    token_count=0,
-                    layer=metadata_extractor.get_layer_for_file(source_file),
-                    symbols=metadata_extractor.get_symbols_for_file(source_file),
-                    imports=metadata_extractor.get_imports_for_file(source_file),
-                    entry_points=metadata_extractor.get_entry_points_for_file(source_file),
-                )
-
-            # Chunk the document
-            chunks = self._chunking_service.chunk_document(
-                content=content,
-                document_path=rel_path,
-                document_title=title,
-                page_type=page_type,
-                base_metadata=base_metadata,
-            )
-
-            # If metadata extractor is available, filter symbols to those in each chunk
-            if metadata_extractor and source_file:
-                for chunk in chunks:
-                    chunk.metadata.symbols = metadata_extractor.get_symbols_in_content(
-                        source_file, chunk.content
-                    )
-
-            all_chunks.extend(chunks)
+            all_chunks.extend(self.chunk_page(rel_path, content, metadata_extractor))
             indexed_count += 1
 
             # Emit progress every 10 files or on last file
@@ -153,12 +121,92 @@ class IndexingService:
                     idx + 1, total_files, f"Indexed {idx + 1}/{total_files} pages..."
                 )
 
-        # Insert chunks into FTS
-        for chunk in all_chunks:
-            self._db.execute(
-                """INSERT INTO fts_content
-                (content, title, path, type, section_header, chunk_id, chunk_index)
-                VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        await self.store_chunks(all_chunks)
+
+        # Save embedding metadata if provider/model specified
+        if embedding_provider and embedding_model and self._meta_path:
+            self._save_embedding_metadata(embedding_provider, embedding_model)
+
+        return indexed_count
+
+    def chunk_page(
+        self,
+        rel_path: str,
+        content: str,
+        metadata_extractor: MetadataExtractor | None = None,
+        layer: str | None = None,
+    ) -> list[Chunk]:
+        """Split one wiki page into chunks with search metadata.
+
+        Args:
+            rel_path: Page path relative to the wiki directory.
+            content: Page content.
+            metadata_extractor: Optional extractor for enriching file page chunks.
+            layer: Architectural layer of a file page, overriding the extractor's.
+
+        Returns:
+            Chunks of the page.
+        """
+        # Extract title from first H1 header
+        title = self._extract_title(content, rel_path)
+
+        # Determine page type from path
+        page_type = self._determine_type(rel_path)
+
+        # Extract source file path from title (for file pages)
+        source_file = self._extract_source_file(title, page_type)
+
+        # Get base metadata from analysis data if available
+        base_metadata: ChunkMetadata | None = None
+        if metadata_extractor and source_file:
+            base_metadata = ChunkMetadata(
+                path=rel_path,
+                title=title,
+                type=page_type,
+                section_header="",
+                chunk_index=0,
+                token_count=0,
+                layer=layer or metadata_extractor.get_layer_for_file(source_file),
+                symbols=metadata_extractor.get_symbols_for_file(source_file),
+                imports=metadata_extractor.get_imports_for_file(source_file),
+                entry_points=metadata_extractor.get_entry_points_for_file(source_file),
+            )
+
+        # Chunk the document
+        chunks = self._chunking_service.chunk_document(
+            content=content,
+            document_path=rel_path,
+            document_title=title,
+            page_type=page_type,
+            base_metadata=base_metadata,
+        )
+
+        # If metadata extractor is available, filter symbols to those in each chunk
+        if metadata_extractor and source_file:
+            for chunk in chunks:
+                chunk.metadata.symbols = metadata_extractor.get_symbols_in_content(
+                    source_file, chunk.content
+                )
+
+        return chunks
+
+    async def store_chunks(self, chunks: list[Chunk]) -> None:
+        """Insert chunks into FTS and the vector store.
+
+        Embedding happens in a worker thread, so other work on the event loop
+        (such as page generation) continues meanwhile.
+
+        Args:
+            chunks: Chunks to store.
+        """
+        if not chunks:
+            return
+
+        self._db.executemany(
+            """INSERT INTO fts_content
+            (content, title, path, type, section_header, chunk_id, chunk_index)
+            VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            [
                 (
                     chunk.content,
                     chunk.metadata.title,
@@ -167,38 +215,43 @@ class IndexingService:
                     chunk.metadata.section_header,
                     chunk.id,
                     chunk.metadata.chunk_index,
-                ),
-            )
-
-        # Commit FTS inserts
+                )
+                for chunk in chunks
+            ],
+        )
         self._db.commit()
 
-        # Add to vector store in batch
-        if all_chunks:
-            self._vectorstore.add_documents(
-                ids=[chunk.id for chunk in all_chunks],
-                documents=[chunk.content for chunk in all_chunks],
-                metadatas=[
-                    {
-                        "path": chunk.metadata.path,
-                        "title": chunk.metadata.title,
-                        "type": chunk.metadata.type,
-                        "section_header": chunk.metadata.section_header,
-                        "chunk_index": chunk.metadata.chunk_index,
-                        "layer": chunk.metadata.layer,
-                        "symbols": json.dumps(chunk.metadata.symbols),
-                        "imports": json.dumps(chunk.metadata.imports),
-                        "entry_points": json.dumps(chunk.metadata.entry_points),
-                    }
-                    for chunk in all_chunks
-                ],
-            )
-
-        # Save embedding metadata if provider/model specified
-        if embedding_provider and embedding_model and self._meta_path:
-            self._save_embedding_metadata(embedding_provider, embedding_model)
+        await asyncio.to_thread(
+            self._vectorstore.add_documents,
+            ids=[chunk.id for chunk in chunks],
+            documents=[chunk.content for chunk in chunks],
+            metadatas=[
+                {
+                    "path": chunk.metadata.path,
+                    "title": chunk.metadata.title,
+                    "type": chunk.metadata.type,
+                    "section_header": chunk.metadata.section_header,
+                    "chunk_index": chunk.metadata.chunk_index,
+                    "layer": chunk.metadata.layer,
+                    "symbols": json.dumps(chunk.metadata.symbols),
+                    "imports": json.dumps(chunk.metadata.imports),
+                    "entry_points": json.dumps(chunk.metadata.entry_points),
+                }
+                for chunk in chunks
+            ],
+        )
+
+    def remove_chunks(self, paths: list[str], chunk_ids: list[str]) -> None:
+        """Remove previously stored chunks of some pages.
 
-        return indexed_count
+        Args:
+            paths: Wiki-relative paths of the pages.
+            chunk_ids: IDs of the pages' chunks in the vector store.
+        """
+        if chunk_ids:
+            self._vectorstore.delete(chunk_ids)
+        self._db.executemany("DELETE FROM fts_content WHERE path = ?", [(p,) for p in paths])
+        self._db.commit()
 
     def clear_index(self) -> None:
         """Clear all indexed content from vector store and FTS."""
@@ -249,7 +302,7 @@ class IndexingService:
             "indexed_at": datetime.now(timezone.utc).isoformat(),
         }
         metadata_file = self._meta_path / EMBEDDING_METADATA_FILE
-        metadata_file.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+        replace_text(metadata_file, json.dumps(metadata, indent=2))
 
     def _remove_embedding_metadata(self) -> None:
         """Remove embedding metadata file."""
@@ -0,0 +1,176 @@
+"""Indexing of wiki pages while generation is still running.
+
+Indexing used to start only once every page had been generated, re-reading
+the whole wiki from disk. StreamingIndexer instead receives pages as the
+generator saves them and indexes them in a background task: chunking, FTS
+inserts and embedding overlap with the LLM-bound generation work. When
+generation finishes, only the pages that were not saved during the run
+(unchanged pages of an incremental build) are read from disk and indexed.
+If background indexing fails, the error is logged and later pages are left to
+that final pass, which then covers every page not indexed in the background.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from oya.generation.page_writer import PendingPage
+from oya.generation.summaries import EntryPointInfo, SynthesisMap
+from oya.indexing.chunking import Chunk
+from oya.indexing.metadata import MetadataExtractor
+from oya.indexing.service import IndexingProgressCallback, IndexingService
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingIndexer:
+    """Indexes saved wiki pages in the background during generation.
+
+    Pages are handed over with submit(), which never blocks; a single worker
+    task indexes them in submission order. finish() waits for that work and
+    then indexes the pages that were never submitted. After the first failure
+    no more pages are accepted; finish() indexes them instead.
+    """
+
+    def __init__(self, service: IndexingService) -> None:
+        """Initialize the indexer.
+
+        Args:
+            service: Indexing service that chunks and stores the pages.
+        """
+        self._service = service
+        self._queue: asyncio.Queue[list[PendingPage] | None] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+        self._metadata_extractor: MetadataExtractor | None = None
+        # Chunk IDs of every page indexed so far, by wiki-relative path
+        self._indexed: dict[str, list[str]] = {}
+        self._failed = False
+
+    @property
+    def indexed_count(self) -> int:
+        """Number of pages indexed from submissions so far."""
+        return len(self._indexed)
+
+    def set_analysis(
+        self,
+        symbols: list[dict[str, Any]] | None = None,
+        file_imports: dict[str, list[str]] | None = None,
+        entry_points: list[EntryPointInfo] | None = None,
+    ) -> None:
+        """Provide the analysis data used to enrich file page chunks.
+
+        Args:
+            symbols: Symbol dicts from code analysis.
+            file_imports: Mapping of file paths to their imports.
+            entry_points: Entry points discovered from the symbols.
+        """
+        self._metadata_extractor = MetadataExtractor(
+            symbols=symbols, file_imports=file_imports, entry_points=entry_points
+        )
+
+    def submit(self, pages: list[PendingPage]) -> None:
+        """Queue saved pages for indexing.
+
+        Args:
+            pages: Pages that have been written to the wiki directory.
+        """
+        if self._failed:
+            # Left to the final pass in finish(), which reads them from disk
+            return
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+        self._queue.put_nowait(list(pages))
+
+    async def finish(
+        self,
+        embedding_provider: str | None = None,
+        embedding_model: str | None = None,
+        progress_callback: IndexingProgressCallback | None = None,
+        synthesis_map: SynthesisMap | None = None,
+        analysis_symbols: list[dict[str, Any]] | None = None,
+        file_imports: dict[str, list[str]] | None = None,
+    ) -> int:
+        """Wait for submitted pages, then index every page not yet indexed.
+
+        Arguments are passed on to IndexingService.index_wiki_pages for the
+        remaining pages, which include any submitted pages that background
+        indexing failed on or no longer accepted.
+
+        Returns:
+            Total number of pages indexed.
+
+        Raises:
+            Exception: Any error raised while indexing the remaining pages.
+        """
+        if self._worker is not None:
+            self._queue.put_nowait(None)
+            await self._worker
+            self._worker = None
+
+        remaining = await self._service.index_wiki_pages(
+            embedding_provider=embedding_provider,
+            embedding_model=embedding_model,
+            progress_callback=progress_callback,
+            synthesis_map=synthesis_map,
+            analysis_symbols=analysis_symbols,
+            file_imports=file_imports,
+            exclude=set(self._indexed),
+        )
+        return self.indexed_count + remaining
+
+    def cancel(self) -> None:
+        """Stop indexing submitted pages, e.g. after generation failed."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    async def _run(self) -> None:
+        """Index queued batches until finish() queues the end marker."""
+        while (pages := await self._queue.get()) is not None:
+            try:
+                await self._index(pages)
+            except Exception:
+                logger.exception(
+                    "Background indexing failed; remaining pages will be indexed after generation"
+                )
+                self._failed = True
+                return
+
+    async def _index(self, pages: list[PendingPage]) -> None:
+        """Index one batch of pages, replacing any earlier version of them."""
+        chunks_by_page = await asyncio.to_thread(self._chunk, pages)
+
+        # A page saved twice in one run is re-indexed rather than duplicated
+        replaced = [path for path in chunks_by_page if path in self._indexed]
+        if replaced:
+            self._service.remove_chunks(
+                replaced, [chunk_id for path in replaced for chunk_id in self._indexed[path]]
+            )
+
+        chunks = [chunk for page_chunks in chunks_by_page.values() for chunk in page_chunks]
+        try:
+            await self._service.store_chunks(chunks)
+        except Exception:
+            # Drop whatever part of the batch was stored so that the final pass
+            # in finish() indexes these pages from scratch
+            for path in chunks_by_page:
+                self._indexed.pop(path, None)
+            self._service.remove_chunks(list(chunks_by_page), [chunk.id for chunk in chunks])
+            raise
+        for path, page_chunks in chunks_by_page.items():
+            self._indexed[path] = [chunk.id for chunk in page_chunks]
+        logger.debug(f"Indexed {len(chunks_by_page)} pages ({len(chunks)} chunks)")
+
+    def _chunk(self, pages: list[PendingPage]) -> dict[str, list[Chunk]]:
+        """Chunk a batch of pages; runs in a worker thread."""
+        return {
+            page.path: self._service.chunk_page(
+                page.path,
+                page.content,
+                self._metadata_extractor,
+                layer=page.metadata.get("layer"),
+            )
+            for page in pages
+        }
@@ -1,13 +1,18 @@
 # backend/src/oya/llm/__init__.py
 """LLM client abstraction."""
 
+from oya.llm.cache import ResponseCache
 from oya.llm.client import (
     LLMAuthenticationError,
     LLMClient,
     LLMConnectionError,
     LLMError,
     LLMRateLimitError,
+    llm_page,
+    llm_phase,
 )
+from oya.llm.ratelimit import RetryPolicy, TokenBucket
+from oya.llm.usage import TokenUsage, UsageTracker
 
 __all__ = [
     "LLMAuthenticationError",
@@ -15,4 +20,11 @@ __all__ = [
     "LLMConnectionError",
     "LLMError",
     "LLMRateLimitError",
+    "ResponseCache",
+    "RetryPolicy",
+    "TokenBucket",
+    "TokenUsage",
+    "UsageTracker",
+    "llm_page",
+    "llm_phase",
 ]
@@ -0,0 +1,283 @@
+"""Content-addressed on-disk cache of LLM responses.
+
+A full rebuild after a wipe, a "regenerate all" and a retried call all send
+requests that have been answered before. ResponseCache stores each response
+under a hash of the normalized request (model, system prompt, prompt,
+temperature and max tokens), so an unchanged request is answered from disk
+instead of the provider. The cache is a SQLite database bounded in size;
+the least recently used responses are evicted first. All database access
+runs on one background thread, so lookups and stores never block the event
+loop on disk I/O.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every cached response, e.g. when request normalization changes
+CACHE_VERSION = "llm-cache.1"
+
+# Fraction of max_bytes eviction shrinks the cache to, so that a full cache
+# does not evict on every store
+_EVICT_TO = 0.9
+
+# Least recently used responses deleted by one eviction statement
+_EVICT_BATCH = 64
+
+# Cache hits whose last-used time is recorded in one update, at most
+_TOUCH_BATCH = 64
+
+
+def _normalize_text(text: str | None) -> str:
+    """Normalize prompt text so that insignificant differences share a key."""
+    if not text:
+        return ""
+    return text.replace("\r\n", "\n").strip()
+
+
+def request_key(
+    model: str,
+    system_prompt: str | None,
+    prompt: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Compute the cache key of a completion request.
+
+    Args:
+        model: LiteLLM model string.
+        system_prompt: Optional system prompt.
+        prompt: User prompt.
+        temperature: Sampling temperature.
+        max_tokens: Maximum response tokens.
+
+    Returns:
+        SHA-256 hex digest of the normalized request.
+    """
+    request = {
+        "version": CACHE_VERSION,
+        "model": model,
+        "system": _normalize_text(system_prompt),
+        "prompt": _normalize_text(prompt),
+        "temperature": round(float(temperature), 4),
+        "max_tokens": int(max_tokens),
+    }
+    encoded = json.dumps(request, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of LLM responses in a SQLite database.
+
+    Calls made during a phase listed in skip_phases bypass the cache
+    entirely (see oya.llm.client.llm_phase). Failures to read or write the
+    database are logged and treated as misses; the cache never fails a call.
+
+    get() and put() hand their work to a single background thread, which
+    owns the connection, so they run in the order they were called. The
+    last-used times of hits are recorded in batches, before any eviction.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int,
+        skip_phases: Iterable[str] = (),
+    ):
+        """Open or create the cache.
+
+        Args:
+            path: SQLite database file.
+            max_bytes: Total size of cached responses to keep, in bytes.
+            skip_phases: Generation phases whose calls are not cached.
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.skip_phases = frozenset(skip_phases)
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._touched: dict[str, float] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm-cache")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used)"
+        )
+        self._conn.commit()
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        self._size = int(row[0])
+
+    def applies(self, phase: str | None) -> bool:
+        """Whether calls made during a phase use the cache."""
+        return phase not in self.skip_phases
+
+    @property
+    def size(self) -> int:
+        """Total size of cached responses, in bytes."""
+        return self._size
+
+    async def get(self, key: str) -> str | None:
+        """Look up a response, marking it as recently used.
+
+        Args:
+            key: Request key from request_key().
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._get, key, time.time())
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response in the background, evicting the least recently used over budget.
+
+        Args:
+            key: Request key from request_key().
+            response: Response text.
+        """
+        if len(response.encode("utf-8")) > self.max_bytes:
+            return
+        self._executor.submit(self._put, key, response, time.time())
+
+    def _get(self, key: str, now: float) -> str | None:
+        """Look up a response on the cache thread."""
+        try:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._touched[key] = now
+                if len(self._touched) >= _TOUCH_BATCH:
+                    self._flush_touched()
+                    self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache lookup failed: {e}")
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return str(row[0])
+
+    def _put(self, key: str, response: str, now: float) -> None:
+        """Store a response on the cache thread."""
+        size = len(response.encode("utf-8"))
+        try:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses (key, response, size, last_used)
+                VALUES (?, ?, ?, ?)
+                """,
+                (key, response, size, now),
+            )
+            self._touched.pop(key, None)
+            self._size += size - (previous[0] if previous else 0)
+            self.stores += 1
+            if self._size > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache store failed: {e}")
+
+    def _flush_touched(self) -> None:
+        """Record the last-used times of recent hits."""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE responses SET last_used = ? WHERE key = ?",
+                [(used, key) for key, used in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _evict(self) -> None:
+        """Delete least recently used responses until under the eviction target."""
+        self._flush_touched()
+        target = int(self.max_bytes * _EVICT_TO)
+        while self._size > target:
+            freed = self._conn.execute(
+                """
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM responses ORDER BY last_used ASC LIMIT ?
+                )
+                RETURNING size
+                """,
+                (self._batch_to_evict(target),),
+            ).fetchall()
+            if not freed:
+                break
+            self._size -= sum(size for (size,) in freed)
+            self.evictions += len(freed)
+
+    def _batch_to_evict(self, target: int) -> int:
+        """Count the least recently used responses that bring the size to target."""
+        excess = self._size - target
+        rows = self._conn.execute(
+            "SELECT size FROM responses ORDER BY last_used ASC LIMIT ?", (_EVICT_BATCH,)
+        ).fetchall()
+        count = 0
+        for (size,) in rows:
+            count += 1
+            excess -= size
+            if excess <= 0:
+                break
+        return max(count, 1)
+
+    def _count(self) -> int:
+        """Count cached responses on the cache thread."""
+        return int(self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0])
+
+    def stats(self) -> dict[str, int]:
+        """Hit, miss, store and eviction counts since the cache was opened.
+
+        Waits for queued stores to finish first.
+        """
+        entries = self._executor.submit(self._count).result()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": self._size,
+        }
+
+    def close(self) -> None:
+        """Finish queued stores, record pending hits and close the database."""
+        self._executor.submit(self._close).result()
+        self._executor.shutdown()
+
+    def _close(self) -> None:
+        """Close the database on the cache thread."""
+        try:
+            self._flush_touched()
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache update failed: {e}")
+        self._conn.close()
@@ -1,15 +1,23 @@
 # backend/src/oya/llm/client.py
 """LiteLLM-based LLM client."""
 
-import json
+import asyncio
+import logging
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Iterator
+from typing import Any
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from pathlib import Path
 
-from litellm import acompletion
+from litellm import acompletion, cost_per_token, token_counter
 
 from oya.config import ConfigError, load_settings
+from oya.llm.cache import ResponseCache, request_key
+from oya.llm.querylog import QueryLog, get_query_log
+from oya.llm.ratelimit import RetryPolicy, TokenBucket, rate_limit_wait
+from oya.llm.usage import UsageTracker
 from litellm.exceptions import (
     APIConnectionError,
     APIError,
@@ -17,6 +25,8 @@ from litellm.exceptions import (
     RateLimitError,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class LLMError(Exception):
     """Base exception for LLM client errors."""
@@ -42,6 +52,54 @@ class LLMRateLimitError(LLMError):
     pass
 
 
+# Generation phase the current call belongs to, set by the orchestrator so that
+# calls can be attributed to a phase without threading it through every generator
+_llm_phase: ContextVar[str | None] = ContextVar("llm_phase", default=None)
+
+
+@contextmanager
+def llm_phase(phase: str) -> Iterator[None]:
+    """Attribute LLM calls made in this context (and tasks it starts) to a phase.
+
+    Args:
+        phase: Phase name, e.g. a GenerationPhase value.
+    """
+    token = _llm_phase.set(phase)
+    try:
+        yield
+    finally:
+        _llm_phase.reset(token)
+
+
+def current_llm_phase() -> str | None:
+    """Get the phase LLM calls in this context are attributed to."""
+    return _llm_phase.get()
+
+
+# Page (file, directory or workflow) the current call is generating
+_llm_page: ContextVar[str | None] = ContextVar("llm_page", default=None)
+
+
+@contextmanager
+def llm_page(page: str) -> Iterator[None]:
+    """Attribute LLM calls made in this context (and tasks it starts) to a page.
+
+    Args:
+        page: Target of the page, e.g. a file or directory path.
+    """
+    token = _llm_page.set(page)
+    try:
+        yield
+    finally:
+        _llm_page.reset(token)
+
+
+def _token_count(usage: Any, field: str) -> int:
+    """Read a token count from a LiteLLM usage object, 0 if missing."""
+    value = getattr(usage, field, None)
+    return value if isinstance(value, int) else 0
+
+
 class LLMClient:
     """Unified LLM client supporting multiple providers via LiteLLM."""
 
@@ -52,6 +110,12 @@ class LLMClient:
         api_key: str | None = None,
         endpoint: str | None = None,
         log_path: Path | None = None,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: TokenBucket | None = None,
+        on_rate_limit: Callable[[float], None] | None = None,
+        on_response: Callable[[float, float], None] | None = None,
+        usage: UsageTracker | None = None,
     ):
         """Initialize LLM client.
 
@@ -61,12 +125,29 @@ class LLMClient:
             api_key: Optional API key (uses env var if not provided).
             endpoint: Optional custom endpoint (for Ollama).
             log_path: Optional path to JSONL log file for query logging.
+            cache: Optional response cache for generate() and generate_with_json().
+            retry_policy: How to retry rate-limited calls (default: never retry).
+            rate_limiter: Optional limiter pacing every call of this client.
+            on_rate_limit: Optional callback told the time.monotonic() start of
+                every attempt the provider rate-limits, e.g. to lower concurrency.
+            on_response: Optional callback told the time.monotonic() start and
+                the latency in seconds of every attempt the provider answers.
+                Cached responses, rate limiter waits and retry backoff are not
+                included, so the latency reflects the provider alone.
+            usage: Optional tracker adding up the tokens used by every call.
         """
         self.provider = provider
         self.model = model
         self.api_key = api_key
         self.endpoint = endpoint
         self.log_path = log_path
+        self._query_log: QueryLog | None = None
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        self.rate_limiter = rate_limiter
+        self.on_rate_limit = on_rate_limit
+        self.on_response = on_response
+        self.usage = usage
 
     def _log_query(
         self,
@@ -78,6 +159,7 @@ class LLMClient:
         duration_ms: int,
         error: str | None,
         error_details: dict | None = None,
+        usage: dict | None = None,
     ) -> None:
         """Log a query to the JSONL log file.
 
@@ -90,6 +172,7 @@ class LLMClient:
             duration_ms: Request duration in milliseconds.
             error: Error message (None if success).
             error_details: Optional dict with status_code, headers, etc.
+            usage: Optional dict with prompt_tokens, completion_tokens and cost.
         """
         if not self.log_path:
             return
@@ -112,13 +195,18 @@ class LLMClient:
         if error_details:
             entry["error_details"] = error_details
 
-        try:
-            self.log_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry) + "\n")
-        except Exception:
-            # Don't let logging failures break the application
-            pass
+        if usage:
+            entry["usage"] = usage
+
+        # Queued for the background writer, so logging never waits on disk
+        if self._query_log is None:
+            self._query_log = get_query_log(self.log_path)
+        self._query_log.write(entry)
+
+    def flush_log(self) -> None:
+        """Block until every query logged so far has been written to the log file."""
+        if self._query_log is not None:
+            self._query_log.flush()
 
     def _extract_error_details(self, e: Exception) -> dict | None:
         """Extract HTTP details from LiteLLM exceptions.
@@ -157,6 +245,7 @@ class LLMClient:
                             "x-ratelimit-reset-requests",
                             "x-ratelimit-reset-tokens",
                             "retry-after",
+                            "retry-after-ms",
                             "x-request-id",
                             "openai-organization",
                             "openai-processing-ms",
@@ -192,12 +281,105 @@ class LLMClient:
         else:
             return f"{self.provider}/{self.model}"
 
+    def _record_usage(
+        self, prompt_tokens: int, completion_tokens: int, cached: bool = False
+    ) -> dict[str, Any]:
+        """Record the tokens of one call with the usage tracker.
+
+        The call is attributed to the phase and page of the current context.
+
+        Args:
+            prompt_tokens: Tokens sent to the provider.
+            completion_tokens: Tokens generated by the provider.
+            cached: Whether the response came from the response cache.
+
+        Returns:
+            The call's usage, for the query log.
+        """
+        cost = 0.0
+        if prompt_tokens or completion_tokens:
+            try:
+                prompt_cost, completion_cost = cost_per_token(
+                    model=self._get_model_string(),
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                )
+                cost = float(prompt_cost + completion_cost)
+            except Exception:
+                # Pricing unknown for this model (e.g. local models)
+                pass
+        if self.usage is not None:
+            self.usage.record(
+                prompt_tokens,
+                completion_tokens,
+                cost,
+                cached=cached,
+                phase=current_llm_phase(),
+                page=_llm_page.get(),
+            )
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "cost": round(cost, 6),
+        }
+
+    async def _complete(self, kwargs: dict[str, Any]) -> Any:
+        """Call the provider, waiting out rate limits as the retry policy allows.
+
+        A rate-limited call is retried after the wait the provider asks for in
+        its headers, or after a jittered exponential backoff. The rate limiter
+        is paused for the same time, so other calls of this client back off too.
+        A call whose requested wait exceeds the policy's max_delay fails at once.
+
+        Args:
+            kwargs: Arguments for litellm.acompletion.
+
+        Returns:
+            The LiteLLM response.
+
+        Raises:
+            RateLimitError: If the call is still rate limited after the last retry,
+                or the provider asks for a wait longer than max_delay.
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            started = time.monotonic()
+            try:
+                response = await acompletion(**kwargs)
+            except RateLimitError as e:
+                if self.on_rate_limit is not None:
+                    self.on_rate_limit(started)
+                if attempt >= self.retry_policy.max_retries:
+                    raise
+                details = self._extract_error_details(e) or {}
+                delay = self.retry_policy.delay(
+                    attempt, rate_limit_wait(details.get("response_headers", {}))
+                )
+                if delay is None:
+                    # The provider asked for longer than we are willing to wait
+                    raise
+                attempt += 1
+                logger.warning(
+                    f"Rate limited by {self.provider}; retry {attempt} of "
+                    f"{self.retry_policy.max_retries} in {delay:.1f}s"
+                )
+                if self.rate_limiter is not None:
+                    self.rate_limiter.pause(delay)
+                await asyncio.sleep(delay)
+                continue
+            if self.on_response is not None:
+                self.on_response(started, time.monotonic() - started)
+            return response
+
     async def generate(
         self,
         prompt: str,
         system_prompt: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
+        refresh_cache: bool = False,
     ) -> str:
         """Generate completion from prompt.
 
@@ -206,6 +388,8 @@ class LLMClient:
             system_prompt: Optional system prompt.
             temperature: Sampling temperature.
             max_tokens: Maximum response tokens.
+            refresh_cache: Skip the cache lookup and replace the cached response,
+                e.g. when retrying because the cached response was unusable.
 
         Returns:
             Generated text response.
@@ -231,6 +415,17 @@ class LLMClient:
 
         messages.append({"role": "user", "content": prompt})
 
+        cache_key = None
+        if self.cache is not None and self.cache.applies(current_llm_phase()):
+            cache_key = request_key(
+                self._get_model_string(), system_prompt, prompt, temperature, max_tokens
+            )
+            if not refresh_cache:
+                cached = await self.cache.get(cache_key)
+                if cached is not None:
+                    self._record_usage(0, 0, cached=True)
+                    return cached
+
         kwargs = {
             "model": self._get_model_string(),
             "messages": messages,
@@ -246,9 +441,10 @@ class LLMClient:
 
         start_time = time.perf_counter()
         try:
-            response = await acompletion(**kwargs)
+            response = await self._complete(kwargs)
             result: str = str(response.choices[0].message.content or "")
             duration_ms = int((time.perf_counter() - start_time) * 1000)
+            usage = getattr(response, "usage", None)
             self._log_query(
                 system_prompt,
                 prompt,
@@ -257,7 +453,13 @@ class LLMClient:
                 response=result,
                 duration_ms=duration_ms,
                 error=None,
+                usage=self._record_usage(
+                    _token_count(usage, "prompt_tokens"),
+                    _token_count(usage, "completion_tokens"),
+                ),
             )
+            if self.cache is not None and cache_key is not None and result:
+                self.cache.put(cache_key, result)
             return result
         except AuthenticationError as e:
             duration_ms = int((time.perf_counter() - start_time) * 1000)
@@ -357,6 +559,8 @@ class LLMClient:
             "temperature": temperature,
             "max_tokens": max_tokens,
             "stream": True,
+            # Ask for a final chunk with the token usage of the whole response
+            "stream_options": {"include_usage": True},
         }
 
         if self.api_key:
@@ -369,10 +573,15 @@ class LLMClient:
         accumulated_tokens: list[str] = []
         error_msg: str | None = None
         error_details: dict | None = None
+        stream_usage: Any = None
 
         try:
-            response = await acompletion(**kwargs)
+            response = await self._complete(kwargs)
             async for chunk in response:
+                if getattr(chunk, "usage", None) is not None:
+                    stream_usage = chunk.usage
+                if not chunk.choices:
+                    continue
                 content = chunk.choices[0].delta.content
                 if content:
                     accumulated_tokens.append(content)
@@ -395,27 +604,60 @@ class LLMClient:
             raise LLMError(f"LLM API error: {e}") from e
         finally:
             duration_ms = int((time.perf_counter() - start_time) * 1000)
+            completion = "".join(accumulated_tokens)
             self._log_query(
                 system_prompt,
                 prompt,
                 temperature,
                 max_tokens,
-                response="".join(accumulated_tokens) if accumulated_tokens else None,
+                response=completion or None,
                 duration_ms=duration_ms,
                 error=error_msg,
                 error_details=error_details,
+                usage=self._stream_usage(stream_usage, messages, completion),
             )
 
+    def _stream_usage(
+        self, usage: Any, messages: list[dict[str, str]], completion: str
+    ) -> dict[str, Any] | None:
+        """Record the usage of a streamed response.
+
+        Providers that do not report usage for streams are estimated by
+        counting the tokens of the messages and the streamed text.
+
+        Args:
+            usage: Usage object of the final chunk, if the provider sent one.
+            messages: Messages sent to the provider.
+            completion: Text streamed back.
+
+        Returns:
+            The call's usage for the query log, or None if nothing was streamed.
+        """
+        prompt_tokens = _token_count(usage, "prompt_tokens")
+        completion_tokens = _token_count(usage, "completion_tokens")
+        if not prompt_tokens and not completion_tokens:
+            if not completion:
+                return None
+            try:
+                model = self._get_model_string()
+                prompt_tokens = token_counter(model=model, messages=messages)
+                completion_tokens = token_counter(model=model, text=completion)
+            except Exception:
+                return None
+        return self._record_usage(prompt_tokens, completion_tokens)
+
     async def generate_with_json(
         self,
         prompt: str,
         system_prompt: str | None = None,
+        refresh_cache: bool = False,
     ) -> str:
         """Generate completion expecting JSON response.
 
         Args:
             prompt: User prompt.
             system_prompt: Optional system prompt.
+            refresh_cache: Skip the cache lookup (see generate()).
 
         Returns:
             Generated JSON string.
@@ -431,4 +673,5 @@ class LLMClient:
             prompt,
             system_prompt=full_system.strip(),
             temperature=json_temperature,
+            refresh_cache=refresh_cache,
         )
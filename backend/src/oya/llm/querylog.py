@@ -0,0 +1,263 @@
+"""Non-blocking, rotating writer for the LLM query log.
+
+Every LLM call is logged as one JSON line with its full prompt and response,
+which can be tens of KB. Writing that on the event loop thread adds disk
+latency to each call, and an unbounded file eventually fills the disk.
+QueryLog hands entries to a background thread that appends them in batches,
+rotates the file by size and age, optionally gzips rotated files, and keeps
+a fixed number of them. Entries can be sampled and long fields truncated.
+
+One QueryLog is shared by every client logging to the same file (see
+get_query_log), so their writes and rotations never interleave.
+"""
+
+from __future__ import annotations
+
+import atexit
+import gzip
+import json
+import logging
+import os
+import queue
+import random
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from oya.config import ConfigError, load_settings
+
+logger = logging.getLogger(__name__)
+
+# Entries written to the file in one go, at most
+_BATCH_SIZE = 256
+
+# Request fields that truncation applies to, besides the response
+_TEXT_FIELDS = ("system_prompt", "prompt")
+
+
+@dataclass(frozen=True)
+class QueryLogOptions:
+    """Rotation, sampling and truncation settings of a query log.
+
+    Attributes:
+        max_bytes: Rotate the file before it grows past this size (0 = never).
+        max_age: Rotate the file once this process has been appending to it
+            for this many seconds (0 = never).
+        backups: Rotated files to keep; older ones are deleted.
+        compress: Gzip rotated files.
+        sample_rate: Fraction of successful calls to log (errors are always logged).
+        max_chars: Truncate prompts and responses to this many characters (0 = never).
+    """
+
+    max_bytes: int = 50 * 1024 * 1024
+    max_age: float = 0.0
+    backups: int = 5
+    compress: bool = True
+    sample_rate: float = 1.0
+    max_chars: int = 0
+
+    @classmethod
+    def from_settings(cls) -> QueryLogOptions:
+        """Load options from the [llm] query_log_* settings, or use defaults."""
+        try:
+            llm = load_settings().llm
+        except (ValueError, OSError, ConfigError):
+            # Settings not available
+            return cls()
+        return cls(
+            max_bytes=llm.query_log_max_mb * 1024 * 1024,
+            max_age=llm.query_log_max_age_hours * 3600.0,
+            backups=llm.query_log_backups,
+            compress=llm.query_log_compress,
+            sample_rate=llm.query_log_sample_rate,
+            max_chars=llm.query_log_max_chars,
+        )
+
+
+def rotated_log_files(path: Path) -> list[Path]:
+    """List the rotated files of a log, newest first.
+
+    Args:
+        path: Path of the live log file.
+
+    Returns:
+        Existing rotated files (path.1, path.2.gz, ...).
+    """
+    files = []
+    for candidate in path.parent.glob(f"{path.name}.*"):
+        suffix = candidate.name[len(path.name) + 1 :].removesuffix(".gz")
+        if suffix.isdigit():
+            files.append((int(suffix), candidate))
+    return [file for _, file in sorted(files)]
+
+
+class QueryLog:
+    """Appends JSON lines to a log file on a background thread.
+
+    write() never blocks on disk: it serializes the entry and queues it. The
+    writer thread appends queued entries in batches, opening the file for
+    each batch so that a log deleted through the API is simply started anew.
+    """
+
+    def __init__(self, path: Path, options: QueryLogOptions | None = None):
+        """Start the writer thread.
+
+        Args:
+            path: Log file to append to.
+            options: Rotation, sampling and truncation settings.
+        """
+        self.path = Path(path)
+        self.options = options or QueryLogOptions()
+        self.dropped = 0
+        self._queue: queue.Queue[str | None] = queue.Queue()
+        self._started_at: float | None = None
+        self._thread = threading.Thread(
+            target=self._run, name=f"query-log-{self.path.name}", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, entry: dict[str, Any]) -> None:
+        """Queue an entry, subject to sampling and truncation.
+
+        Args:
+            entry: JSON-serializable log entry. Entries with an "error" are
+                always written; others are sampled at options.sample_rate.
+        """
+        if not entry.get("error") and random.random() >= self.options.sample_rate:
+            self.dropped += 1
+            return
+        if self.options.max_chars:
+            entry = self._truncate(entry)
+        self._queue.put(json.dumps(entry) + "\n")
+
+    def flush(self) -> None:
+        """Block until every queued entry has been written."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write queued entries and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _truncate(self, entry: dict[str, Any]) -> dict[str, Any]:
+        """Shorten prompts and the response to options.max_chars characters."""
+        limit = self.options.max_chars
+
+        def cut(text: Any) -> Any:
+            if isinstance(text, str) and len(text) > limit:
+                return f"{text[:limit]}... [truncated {len(text) - limit} chars]"
+            return text
+
+        entry = dict(entry)
+        if isinstance(entry.get("request"), dict):
+            entry["request"] = {
+                key: cut(value) if key in _TEXT_FIELDS else value
+                for key, value in entry["request"].items()
+            }
+        entry["response"] = cut(entry.get("response"))
+        return entry
+
+    def _run(self) -> None:
+        """Writer thread: append queued lines in batches until closed."""
+        while True:
+            line = self._queue.get()
+            batch = [line]
+            while line is not None and len(batch) < _BATCH_SIZE:
+                try:
+                    line = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(line)
+            lines = [entry for entry in batch if entry is not None]
+            try:
+                if lines:
+                    self._append("".join(lines))
+            except Exception as e:
+                # Don't let logging failures break the application
+                logger.warning(f"Failed to write LLM query log {self.path}: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if None in batch:
+                return
+
+    def _append(self, text: str) -> None:
+        """Append text to the log, rotating it first if it is full or old."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+            self._started_at = None
+        if size and self._should_rotate(size + len(text.encode("utf-8")), now):
+            self._rotate()
+            self._started_at = None
+        if self._started_at is None:
+            self._started_at = now
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(text)
+
+    def _should_rotate(self, new_size: int, now: float) -> bool:
+        options = self.options
+        if options.max_bytes and new_size > options.max_bytes:
+            return True
+        if options.max_age and self._started_at is not None:
+            return now - self._started_at >= options.max_age
+        return False
+
+    def _rotate(self) -> None:
+        """Shift rotated files up by one and move the live file to path.1."""
+        keep = self.options.backups
+        for rotated in rotated_log_files(self.path)[::-1]:
+            suffix = rotated.name[len(self.path.name) + 1 :]
+            index = int(suffix.removesuffix(".gz"))
+            if index >= keep:
+                rotated.unlink()
+            else:
+                gz = ".gz" if suffix.endswith(".gz") else ""
+                rotated.rename(self.path.with_name(f"{self.path.name}.{index + 1}{gz}"))
+        if keep == 0:
+            self.path.unlink()
+            return
+        first = self.path.with_name(f"{self.path.name}.1")
+        os.replace(self.path, first)
+        if self.options.compress:
+            with open(first, "rb") as src, gzip.open(f"{first}.gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            first.unlink()
+
+
+_logs: dict[Path, QueryLog] = {}
+_logs_lock = threading.Lock()
+
+
+def get_query_log(path: Path, options: QueryLogOptions | None = None) -> QueryLog:
+    """Get the shared query log writing to a file, starting it if needed.
+
+    Args:
+        path: Log file.
+        options: Settings for a newly started log (default: from settings).
+            Ignored if the log is already running.
+    """
+    key = Path(path).resolve()
+    with _logs_lock:
+        log = _logs.get(key)
+        if log is None:
+            log = QueryLog(Path(path), options or QueryLogOptions.from_settings())
+            _logs[key] = log
+        return log
+
+
+@atexit.register
+def close_query_logs() -> None:
+    """Write out and stop every query log, e.g. at interpreter exit."""
+    with _logs_lock:
+        logs = list(_logs.values())
+        _logs.clear()
+    for log in logs:
+        log.close()
@@ -0,0 +1,187 @@
+"""Rate limiting and retry backoff for LLM provider calls.
+
+Providers answer a burst of requests over their limit with 429 responses,
+usually saying when to try again in a retry-after header or in the
+x-ratelimit-* headers. LLMClient retries those calls after the wait the
+provider asks for, or after a jittered exponential backoff when it does not
+say. A TokenBucket shared by every call of a client paces requests to a
+configured rate, and pausing it after a 429 holds back the other calls too,
+so generation on a shared API key slows down instead of failing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# Units of the durations in x-ratelimit-reset-* headers, e.g. "1m30s" or "20ms"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how long to wait before retrying a rate-limited call.
+
+    Attributes:
+        max_retries: Retries after the first attempt (0 = never retry).
+        base_delay: Backoff before the first retry, in seconds, when the
+            provider does not say how long to wait.
+        max_delay: Upper bound of the exponential backoff, in seconds. A
+            provider asking for a longer wait (e.g. a daily quota) fails the
+            call instead of holding up every call behind it.
+    """
+
+    max_retries: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+
+    def delay(self, attempt: int, wait: float | None = None) -> float | None:
+        """Seconds to wait before the next attempt.
+
+        Args:
+            attempt: Number of attempts that have failed so far, minus one.
+            wait: Wait requested by the provider, if any.
+
+        Returns:
+            The requested wait plus a little jitter, so that calls limited at
+            the same moment do not all retry at once; otherwise an exponential
+            backoff, randomized between half and all of the current step.
+            None if the requested wait exceeds max_delay, so the call should
+            not be retried.
+        """
+        if wait is not None:
+            if wait > self.max_delay:
+                return None
+            return min(self.max_delay, wait + random.uniform(0, self.base_delay))
+        ceiling = min(self.max_delay, self.base_delay * 2**attempt)
+        return random.uniform(ceiling / 2, ceiling)
+
+
+def parse_duration(value: str) -> float | None:
+    """Parse a rate limit duration such as "20", "1.5s", "6m0s" or "20ms".
+
+    Returns:
+        The duration in seconds, or None if the value is not a duration.
+    """
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(a + u for a, u in parts) != value:
+        return None
+    return sum(float(amount) * _DURATION_SECONDS[unit] for amount, unit in parts)
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Parse a retry-after header: delay in seconds or an HTTP date."""
+    seconds = parse_duration(value)
+    if seconds is not None:
+        return seconds
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def rate_limit_wait(headers: Mapping[str, str]) -> float | None:
+    """Work out how long a provider asked us to wait from its response headers.
+
+    Args:
+        headers: Response headers of a rate-limited call.
+
+    Returns:
+        Seconds to wait, or None if the headers do not say.
+    """
+    headers = {k.lower(): str(v) for k, v in headers.items()}
+    if "retry-after-ms" in headers:
+        ms = parse_duration(headers["retry-after-ms"])
+        if ms is not None:
+            return ms / 1000
+    if "retry-after" in headers:
+        wait = _parse_retry_after(headers["retry-after"])
+        if wait is not None:
+            return wait
+    # An exhausted request or token allowance says when it resets
+    waits = []
+    for limit in ("requests", "tokens"):
+        remaining = headers.get(f"x-ratelimit-remaining-{limit}")
+        reset = headers.get(f"x-ratelimit-reset-{limit}")
+        if remaining is None or reset is None:
+            continue
+        try:
+            exhausted = float(remaining) <= 0
+        except ValueError:
+            continue
+        if exhausted:
+            wait = parse_duration(reset)
+            if wait is not None:
+                waits.append(wait)
+    return max(waits) if waits else None
+
+
+class TokenBucket:
+    """Client-wide limiter admitting calls at a steady rate with small bursts.
+
+    The bucket holds up to capacity tokens and refills at rate tokens per
+    second; each call takes one token, waiting for it if the bucket is empty.
+    pause() empties the bucket until a deadline, so that every caller backs
+    off when the provider rate-limits any one of them.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Calls admitted per second on average.
+            capacity: Largest burst admitted at once (defaults to one
+                second's worth of calls, and at least one call).
+        """
+        self.rate = rate
+        self.capacity = max(1.0, capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float) -> TokenBucket:
+        """Create a bucket admitting the given number of calls per minute."""
+        return cls(rate=requests_per_minute / 60)
+
+    def _refill(self, now: float) -> None:
+        start = max(self._updated, self._paused_until)
+        if now > start:
+            self._tokens = min(self.capacity, self._tokens + (now - start) * self.rate)
+        self._updated = max(now, self._updated)
+
+    async def acquire(self) -> None:
+        """Wait until a call may start, then take its token."""
+        # The lock queues callers, so they are admitted in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+                await asyncio.sleep(max(wait, 0.001))
+
+    def pause(self, seconds: float) -> None:
+        """Admit no calls for the given time, and start refilling from empty."""
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens = 0.0
+        self._paused_until = max(self._paused_until, now + seconds)
@@ -0,0 +1,118 @@
+"""Token and cost accounting for LLM calls.
+
+LLMClient reports the prompt and completion tokens of every call to a
+UsageTracker, which adds them up by the generation phase and page the call
+was made for (see oya.llm.client.llm_phase and llm_page). A generation
+stores the totals with its job, along with the most expensive pages of each
+phase, so budgets can be sized from real usage and the phases worth
+optimising are easy to spot.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any
+
+# Phase recorded for calls made outside any generation phase, e.g. Q&A
+OTHER_PHASE = "other"
+
+# Pages per phase kept when serializing; a large repository has thousands
+TOP_PAGES = 10
+
+
+@dataclass
+class TokenUsage:
+    """Tokens and cost of a group of LLM calls.
+
+    Attributes:
+        calls: Calls made, including those answered from the response cache.
+        cached_calls: Calls answered from the response cache, which use no tokens.
+        prompt_tokens: Tokens sent to the provider.
+        completion_tokens: Tokens generated by the provider.
+        cost: Estimated cost in USD, 0.0 if the model's pricing is unknown.
+    """
+
+    calls: int = 0
+    cached_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0
+
+    def add(self, prompt_tokens: int, completion_tokens: int, cost: float, cached: bool) -> None:
+        """Add one call."""
+        self.calls += 1
+        self.cached_calls += int(cached)
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.cost += cost
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        data = asdict(self)
+        data["cost"] = round(self.cost, 6)
+        return data
+
+
+class UsageTracker:
+    """Adds up the token usage of LLM calls by phase and by page."""
+
+    def __init__(self) -> None:
+        self.total = TokenUsage()
+        self.phases: dict[str, TokenUsage] = {}
+        # Usage per page target within each phase
+        self.pages: dict[str, dict[str, TokenUsage]] = {}
+
+    def record(
+        self,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cost: float = 0.0,
+        cached: bool = False,
+        phase: str | None = None,
+        page: str | None = None,
+    ) -> None:
+        """Record one LLM call.
+
+        Args:
+            prompt_tokens: Tokens sent to the provider.
+            completion_tokens: Tokens generated by the provider.
+            cost: Estimated cost in USD.
+            cached: Whether the call was answered from the response cache.
+            phase: Generation phase the call was made for, if any.
+            page: Page target (file, directory, workflow) the call was made for, if any.
+        """
+        phase = phase or OTHER_PHASE
+        usages = [self.total, self.phases.setdefault(phase, TokenUsage())]
+        if page is not None:
+            usages.append(self.pages.setdefault(phase, {}).setdefault(page, TokenUsage()))
+        for usage in usages:
+            usage.add(prompt_tokens, completion_tokens, cost, cached)
+
+    def to_dict(self, top_pages: int = TOP_PAGES) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict.
+
+        Args:
+            top_pages: Pages kept per phase, the most expensive first. The
+                phase totals still include every page.
+
+        Returns:
+            Dict with the total, the usage of each phase and the top pages
+            of each phase.
+        """
+        return {
+            "total": self.total.to_dict(),
+            "phases": {phase: usage.to_dict() for phase, usage in self.phases.items()},
+            "pages": {
+                phase: {page: usage.to_dict() for page, usage in _top(pages, top_pages)}
+                for phase, pages in self.pages.items()
+            },
+        }
+
+
+def _top(pages: dict[str, TokenUsage], count: int) -> list[tuple[str, TokenUsage]]:
+    """Return the `count` most expensive pages, by cost and then by tokens."""
+    return sorted(
+        pages.items(),
+        key=lambda item: (item[1].cost, item[1].prompt_tokens + item[1].completion_tokens),
+        reverse=True,
+    )[:count]
@@ -11,6 +11,7 @@ from typing import Optional
 import yaml
 
 from oya.db.connection import Database
+from oya.fileio import replace_text
 from oya.notes.schemas import Note, NoteScope
 
 logger = logging.getLogger(__name__)
@@ -150,7 +151,7 @@ class NotesService:
 
         note_file = self._notes_path / filepath
         note_file.parent.mkdir(parents=True, exist_ok=True)
-        note_file.write_text(full_content)
+        replace_text(note_file, full_content)
 
     def _get_stored_filepath(self, scope: NoteScope, target: str) -> Optional[str]:
         """Get the stored filepath from the database for an existing note.
@@ -0,0 +1,234 @@
+"""On-disk cache of parse results, persisted across generations.
+
+Most files are unchanged between two generations of the same repository, so
+their parse results are kept in a single pickle file under the wiki's meta
+directory. Each entry is keyed by file path and validated against a hash of
+the file content; the whole cache is discarded when the parser version
+changes. Only files whose content changed are parsed again.
+
+A cache saved from a clean git working tree records its commit. Files git
+reports unchanged since that commit can be served from it without reading
+or hashing them at all.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from oya import __version__
+from oya.parsing.models import ParseResult
+
+logger = logging.getLogger(__name__)
+
+# Bump when any parser's output changes, to invalidate existing caches
+PARSER_VERSION = f"{__version__}+parse.3"
+
+
+def hash_content(content: str) -> str:
+    """Compute the hash used to validate cache entries.
+
+    Args:
+        content: File content.
+
+    Returns:
+        SHA-256 hex digest of the content.
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ParseCacheEntry:
+    """Cached parse results for one file version.
+
+    Raw content is not stored; it is restored from the file on a cache hit.
+    The content's size and line count are kept so that an entry trusted
+    without reading the file still describes it.
+    """
+
+    content_hash: str
+    result: ParseResult | None
+    fallback: ParseResult | None
+    size: int = 0
+    lines: int = 0
+
+
+class ParseCache:
+    """Parse results keyed by file path and content hash.
+
+    The cache is loaded lazily on first use and written back with save().
+    A missing, unreadable or outdated cache file yields an empty cache.
+    """
+
+    def __init__(self, path: Path, version: str = PARSER_VERSION):
+        """Initialize the cache.
+
+        Args:
+            path: Path of the cache file.
+            version: Parser version; entries written by another version are ignored.
+        """
+        self.path = Path(path)
+        self.version = version
+        self._entries: dict[str, ParseCacheEntry] | None = None
+        self._commit: str | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def commit(self) -> str | None:
+        """Commit of the clean working tree the cache was saved from, if any."""
+        if self._entries is None:
+            self._entries = self._load()
+        return self._commit
+
+    @property
+    def entries(self) -> dict[str, ParseCacheEntry]:
+        """Cache entries by file path, loading them from disk on first access."""
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+
+    def _load(self) -> dict[str, ParseCacheEntry]:
+        if not self.path.exists():
+            return {}
+        try:
+            with self.path.open("rb") as f:
+                data = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable parse cache {self.path}: {e}")
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.version:
+            return {}
+        entries = data.get("entries")
+        if not isinstance(entries, dict):
+            return {}
+        commit = data.get("commit")
+        self._commit = commit if isinstance(commit, str) else None
+        return {
+            path: entry
+            for path, entry in entries.items()
+            if isinstance(path, str) and isinstance(entry, ParseCacheEntry)
+        }
+
+    def known_hashes(self, files: list[str]) -> dict[str, str]:
+        """Get the cached content hash of each file that has an entry.
+
+        Args:
+            files: File paths to look up.
+
+        Returns:
+            Mapping of file path to cached content hash.
+        """
+        entries = self.entries
+        return {f: entries[f].content_hash for f in files if f in entries}
+
+    def get(self, file_path: str, content_hash: str, content: str) -> ParseCacheEntry | None:
+        """Get the cached results for a file, if its content is unchanged.
+
+        Args:
+            file_path: File path relative to the repository root.
+            content_hash: Hash of the file's current content.
+            content: The file's current content, restored onto the results.
+
+        Returns:
+            Cache entry with raw content restored, or None on a miss.
+        """
+        entry = self.entries.get(file_path)
+        if entry is None or entry.content_hash != content_hash:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return replace(
+            entry,
+            result=_with_raw_content(entry.result, content),
+            fallback=_with_raw_content(entry.fallback, content),
+        )
+
+    def get_unchanged(self, file_path: str) -> ParseCacheEntry | None:
+        """Get the cached results for a file known not to have changed.
+
+        The content is neither read nor checked, so callers must know the file
+        is unchanged since the cache was saved (see commit). Raw content is
+        not restored.
+
+        Args:
+            file_path: File path relative to the repository root.
+
+        Returns:
+            Cache entry, or None if the file has none.
+        """
+        entry = self.entries.get(file_path)
+        if entry is None:
+            return None
+        self.hits += 1
+        return entry
+
+    def put(
+        self,
+        file_path: str,
+        content_hash: str,
+        result: ParseResult | None,
+        fallback: ParseResult | None,
+        size: int = 0,
+        lines: int = 0,
+    ) -> None:
+        """Store the parse results for a file version.
+
+        Args:
+            file_path: File path relative to the repository root.
+            content_hash: Hash of the parsed content.
+            result: Result from the language parser.
+            fallback: Result from the fallback parser, if it was used.
+            size: Length of the parsed content in characters.
+            lines: Number of lines in the parsed content.
+        """
+        self.entries[file_path] = ParseCacheEntry(
+            content_hash=content_hash,
+            result=_with_raw_content(result, None),
+            fallback=_with_raw_content(fallback, None),
+            size=size,
+            lines=lines,
+        )
+
+    def save(self, keep: list[str] | None = None, commit: str | None = None) -> None:
+        """Write the cache to disk.
+
+        The file is written to a temporary path and renamed into place, so an
+        interrupted save never leaves a truncated cache behind.
+
+        Args:
+            keep: If given, drop entries for files not in this list first.
+            commit: Commit of the working tree the entries were read from, only
+                if the tree had no uncommitted changes; None otherwise.
+        """
+        entries = self.entries
+        if keep is not None:
+            keep_set = set(keep)
+            entries = {path: entry for path, entry in entries.items() if path in keep_set}
+            self._entries = entries
+        self._commit = commit
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with tmp_path.open("wb") as f:
+                pickle.dump(
+                    {"version": self.version, "commit": commit, "entries": entries},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            # The cache is an optimization; failing to write it must not fail generation
+            logger.warning(f"Failed to save parse cache {self.path}: {e}")
+
+
+def _with_raw_content(result: ParseResult | None, content: str | None) -> ParseResult | None:
+    """Copy a parse result with its file's raw content replaced."""
+    if result is None or result.file is None:
+        return result
+    return replace(result, file=replace(result.file, raw_content=content))
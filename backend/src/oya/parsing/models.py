@@ -1,7 +1,16 @@
-"""Data models for code parsing."""
+"""Data models for code parsing.
 
+Large repositories produce millions of symbols and references, so the models
+are slotted dataclasses. A symbol's parser-specific metadata is only allocated
+when a parser records some, and the path of the file a symbol belongs to is a
+field of its own rather than a metadata entry.
+"""
+
+import sys
+from collections.abc import Iterator, MutableMapping
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import Any
 
 
 class ReferenceType(Enum):
@@ -31,22 +40,117 @@ class SymbolType(Enum):
     CLI_COMMAND = "cli_command"  # CLI entry points
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class ParsedSymbol:
-    """A parsed code symbol (function, class, etc.)."""
+    """A parsed code symbol (function, class, etc.).
+
+    Metadata passed to the constructor, and later reads and writes through
+    `metadata`, are split between the `file` field and the `extra` dict.
+    """
 
     name: str
     symbol_type: SymbolType
     start_line: int
     end_line: int
-    docstring: str | None = None
-    signature: str | None = None
-    decorators: list[str] = field(default_factory=list)
-    parent: str | None = None  # For methods, the class name
-    metadata: dict = field(default_factory=dict)
-
-
-@dataclass
+    docstring: str | None
+    signature: str | None
+    decorators: list[str]
+    parent: str | None  # For methods, the class name
+    file: str | None  # Path of the containing file, set during analysis
+    extra: dict | None = field(repr=False)  # None until metadata is added
+
+    def __init__(
+        self,
+        name: str,
+        symbol_type: SymbolType,
+        start_line: int,
+        end_line: int,
+        docstring: str | None = None,
+        signature: str | None = None,
+        decorators: list[str] | None = None,
+        parent: str | None = None,
+        metadata: dict | None = None,
+        file: str | None = None,
+    ):
+        self.name = name
+        self.symbol_type = symbol_type
+        self.start_line = start_line
+        self.end_line = end_line
+        self.docstring = docstring
+        self.signature = signature
+        self.decorators = decorators if decorators is not None else []
+        self.parent = parent
+        self.file = file
+        self.extra = None
+        if metadata:
+            self.metadata.update(metadata)
+
+    @property
+    def metadata(self) -> "SymbolMetadata":
+        """Mapping view of the file path and extra metadata."""
+        return SymbolMetadata(self)
+
+    @metadata.setter
+    def metadata(self, metadata: dict) -> None:
+        self.file = None
+        self.extra = None
+        self.metadata.update(metadata)
+
+
+class SymbolMetadata(MutableMapping[str, Any]):
+    """Dict-like view of a ParsedSymbol's file path and extra metadata.
+
+    Views are created on access and hold no data of their own, so symbols
+    without parser metadata carry no dict at all.
+    """
+
+    __slots__ = ("_symbol",)
+
+    def __init__(self, symbol: ParsedSymbol):
+        self._symbol = symbol
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "file":
+            if self._symbol.file is None:
+                raise KeyError(key)
+            return self._symbol.file
+        if self._symbol.extra is None:
+            raise KeyError(key)
+        return self._symbol.extra[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == "file" and isinstance(value, str):
+            # Shared by every symbol of the file
+            self._symbol.file = sys.intern(value)
+            return
+        if self._symbol.extra is None:
+            self._symbol.extra = {}
+        self._symbol.extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key == "file" and self._symbol.file is not None:
+            self._symbol.file = None
+            return
+        if self._symbol.extra is None:
+            raise KeyError(key)
+        del self._symbol.extra[key]
+        if not self._symbol.extra:
+            self._symbol.extra = None
+
+    def __iter__(self) -> Iterator[str]:
+        if self._symbol.file is not None:
+            yield "file"
+        if self._symbol.extra:
+            yield from self._symbol.extra
+
+    def __len__(self) -> int:
+        return (self._symbol.file is not None) + len(self._symbol.extra or ())
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+@dataclass(slots=True)
 class ParsedFile:
     """Result of parsing a single file."""
 
@@ -62,7 +166,7 @@ class ParsedFile:
     synopsis: str | None = None  # Extracted synopsis code
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     """Result of a parse operation (success or failure)."""
 
@@ -82,7 +186,7 @@ class ParseResult:
         return cls(ok=False, file=None, error=error, path=path)
 
 
-@dataclass
+@dataclass(slots=True)
 class Reference:
     """A reference from one code entity to another."""
 
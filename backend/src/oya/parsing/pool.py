@@ -0,0 +1,270 @@
+"""Multi-process file parsing for the analysis phase.
+
+Parsing (ast, tree-sitter and the regex fallback) is CPU-bound. For large
+repositories the files are read and parsed in a pool of worker processes so
+the work spreads across cores and the server's event loop stays responsive.
+Small repositories, or a configured worker count of 1, parse in-process.
+With a ParseCache, files whose content is unchanged since the last generation
+are served from the cache and only the rest are parsed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from collections.abc import AsyncGenerator, Collection
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import aclosing
+from dataclasses import dataclass
+from pathlib import Path
+
+from oya.parsing.base import BaseParser
+from oya.parsing.cache import ParseCache, ParseCacheEntry, hash_content
+from oya.parsing.fallback_parser import FallbackParser
+from oya.parsing.models import ParseResult
+from oya.parsing.registry import ParserRegistry
+
+logger = logging.getLogger(__name__)
+
+# Below this many files the cost of starting worker processes outweighs the gain
+PROCESS_POOL_MIN_FILES = 64
+
+# Files sent to a worker per task, to amortize inter-process overhead
+PARSE_CHUNK_SIZE = 32
+
+
+@dataclass
+class FileParseOutcome:
+    """Outcome of reading and parsing a single file.
+
+    Attributes:
+        path: File path relative to the repository root.
+        content: File content, or None if the file was missing or unreadable.
+        result: Result from the language parser, if the file was read.
+        fallback: Result from the fallback parser when the language parser failed.
+        error: Read error message, if the file could not be read.
+        cached: Cache entry the results were served from without reading the
+            file, for files known to be unchanged.
+    """
+
+    path: str
+    content: str | None = None
+    result: ParseResult | None = None
+    fallback: ParseResult | None = None
+    error: str | None = None
+    cached: ParseCacheEntry | None = None
+
+    @property
+    def missing(self) -> bool:
+        """True if the file no longer exists (nothing was read or attempted)."""
+        return self.content is None and self.error is None and self.cached is None
+
+
+def read_and_parse(
+    repo_path: Path,
+    file_path: str,
+    registry: ParserRegistry,
+    fallback_parser: BaseParser,
+) -> FileParseOutcome:
+    """Read a file and parse it, falling back to the regex parser on failure.
+
+    Args:
+        repo_path: Repository root.
+        file_path: File path relative to repo_path.
+        registry: Parser registry used for the primary parse.
+        fallback_parser: Parser used when the primary parse fails.
+
+    Returns:
+        FileParseOutcome for the file.
+    """
+    outcome = FileParseOutcome(path=file_path)
+    full_path = repo_path / file_path
+    if not full_path.exists() or not full_path.is_file():
+        return outcome
+
+    try:
+        content = full_path.read_text(encoding="utf-8", errors="ignore")
+        outcome.content = content
+        outcome.result = registry.parse_file(Path(file_path), content)
+        if not (outcome.result.ok and outcome.result.file):
+            outcome.fallback = fallback_parser.parse(Path(file_path), content)
+    except Exception as e:
+        outcome.error = str(e)
+    return outcome
+
+
+def resolve_parse_workers(configured: int) -> int:
+    """Resolve the configured parse worker count.
+
+    Args:
+        configured: Configured worker count; 0 means one per CPU core.
+
+    Returns:
+        Number of parse workers to use (at least 1).
+    """
+    if configured > 0:
+        return configured
+    return os.cpu_count() or 1
+
+
+# Per-process parser instances, created once by _init_worker
+_worker_registry: ParserRegistry | None = None
+_worker_fallback: FallbackParser | None = None
+
+
+def _init_worker() -> None:
+    """Create parser instances once per worker process."""
+    global _worker_registry, _worker_fallback
+    _worker_registry = ParserRegistry()
+    _worker_fallback = FallbackParser()
+
+
+def _parse_chunk(repo_path: str, file_paths: list[str]) -> list[FileParseOutcome]:
+    """Parse a chunk of files inside a worker process."""
+    assert _worker_registry is not None and _worker_fallback is not None
+    root = Path(repo_path)
+    return [read_and_parse(root, f, _worker_registry, _worker_fallback) for f in file_paths]
+
+
+async def parse_files(
+    repo_path: Path,
+    files: list[str],
+    workers: int,
+    registry: ParserRegistry,
+    fallback_parser: BaseParser,
+    cache: ParseCache | None = None,
+    unchanged: Collection[str] | None = None,
+) -> AsyncGenerator[FileParseOutcome, None]:
+    """Read and parse files, across a process pool when worthwhile.
+
+    Outcomes are yielded as they become available, so callers can report
+    progress. With a process pool they arrive in completion order, not in the
+    order of `files`. Worker processes use their own default ParserRegistry;
+    `registry` and `fallback_parser` are only used for in-process parsing.
+
+    With a cache, unchanged files are served from it first, and the pool is
+    only used if enough files remain to be parsed. New parse results are
+    added to the cache; saving it is left to the caller. Files in `unchanged`
+    that have a cache entry are served from it without being read at all.
+
+    If the pool cannot be started or breaks part way through, the remaining
+    files are parsed in-process.
+
+    Args:
+        repo_path: Repository root.
+        files: File paths relative to repo_path.
+        workers: Number of worker processes; 1 parses in-process.
+        registry: Parser registry for in-process parsing.
+        fallback_parser: Fallback parser for in-process parsing.
+        cache: Optional parse cache to read from and update.
+        unchanged: Files known to be unchanged since the cache was saved.
+
+    Yields:
+        FileParseOutcome for every file in `files`.
+    """
+    remaining = list(files)
+
+    if cache is not None:
+        # Loading the cache and hashing unchanged files is blocking I/O; run it
+        # in a thread, a chunk at a time, so the event loop keeps serving requests
+        loop = asyncio.get_running_loop()
+        known = await loop.run_in_executor(None, cache.known_hashes, files)
+        remaining = [f for f in files if f not in known]
+        candidates = []
+        for file_path in files:
+            if file_path not in known:
+                continue
+            entry = cache.get_unchanged(file_path) if unchanged and file_path in unchanged else None
+            if entry is None:
+                candidates.append(file_path)
+            else:
+                yield FileParseOutcome(
+                    path=file_path, result=entry.result, fallback=entry.fallback, cached=entry
+                )
+        for i in range(0, len(candidates), PARSE_CHUNK_SIZE):
+            chunk = candidates[i : i + PARSE_CHUNK_SIZE]
+            cached_chunk = await loop.run_in_executor(
+                None, _read_cached_chunk, repo_path, chunk, cache
+            )
+            for file_path, cached in zip(chunk, cached_chunk):
+                if cached is None:
+                    remaining.append(file_path)
+                else:
+                    yield cached
+
+    def record(outcome: FileParseOutcome) -> FileParseOutcome:
+        if cache is not None and outcome.content is not None and outcome.error is None:
+            cache.put(
+                outcome.path,
+                hash_content(outcome.content),
+                outcome.result,
+                outcome.fallback,
+                size=len(outcome.content),
+                lines=len(outcome.content.splitlines()),
+            )
+        return outcome
+
+    if workers > 1 and len(remaining) >= PROCESS_POOL_MIN_FILES:
+        done: set[str] = set()
+        try:
+            async with aclosing(_parse_in_pool(repo_path, remaining, workers)) as pooled:
+                async for outcome in pooled:
+                    done.add(outcome.path)
+                    yield record(outcome)
+            return
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"Parse pool failed, parsing remaining files in-process: {e}")
+            remaining = [f for f in remaining if f not in done]
+
+    for file_path in remaining:
+        yield record(read_and_parse(repo_path, file_path, registry, fallback_parser))
+
+
+def _read_cached_chunk(
+    repo_path: Path, files: list[str], cache: ParseCache
+) -> list[FileParseOutcome | None]:
+    """Look up a chunk of files in the cache; runs in a worker thread."""
+    return [_read_cached(repo_path, file_path, cache) for file_path in files]
+
+
+def _read_cached(repo_path: Path, file_path: str, cache: ParseCache) -> FileParseOutcome | None:
+    """Read a file and return its cached parse results if its content is unchanged."""
+    full_path = repo_path / file_path
+    try:
+        content = full_path.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        # Missing or unreadable; let the normal path report it
+        return None
+    entry = cache.get(file_path, hash_content(content), content)
+    if entry is None:
+        return None
+    return FileParseOutcome(
+        path=file_path, content=content, result=entry.result, fallback=entry.fallback
+    )
+
+
+async def _parse_in_pool(
+    repo_path: Path, files: list[str], workers: int
+) -> AsyncGenerator[FileParseOutcome, None]:
+    """Parse files in chunks across a pool of worker processes."""
+    loop = asyncio.get_running_loop()
+    chunks = [files[i : i + PARSE_CHUNK_SIZE] for i in range(0, len(files), PARSE_CHUNK_SIZE)]
+    # Spawn rather than fork: the server process runs threads (uvicorn, chroma)
+    executor = ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    )
+    try:
+        futures: list[Future] = [
+            executor.submit(_parse_chunk, str(repo_path), chunk) for chunk in chunks
+        ]
+        for next_done in asyncio.as_completed([asyncio.wrap_future(f) for f in futures]):
+            for outcome in await next_done:
+                yield outcome
+    finally:
+        # Don't block the event loop waiting for workers to exit
+        await loop.run_in_executor(None, lambda: executor.shutdown(wait=True, cancel_futures=True))
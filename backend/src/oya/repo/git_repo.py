@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from git import Repo
+from git import GitCommandError, Repo
 
 
 class GitRepo:
@@ -57,6 +57,38 @@ class GitRepo:
         blob = commit.tree / file_path
         return str(blob.data_stream.read().decode("utf-8"))
 
+    def get_changed_paths(self, since_commit: str) -> set[str] | None:
+        """Get the paths changed between a commit and HEAD.
+
+        Uses `git diff --name-status` with rename detection. A renamed or
+        copied file contributes both its old and new path.
+
+        Args:
+            since_commit: Commit SHA to compare HEAD against.
+
+        Returns:
+            Set of relative paths added, modified, deleted or renamed since
+            since_commit, or None if the commit is not known to git.
+        """
+        try:
+            output = self._repo.git.diff("--name-status", "-M", "-z", f"{since_commit}..HEAD")
+        except GitCommandError:
+            return None
+
+        changed: set[str] = set()
+        tokens = output.split("\0")
+        i = 0
+        while i < len(tokens):
+            status = tokens[i]
+            if not status:
+                i += 1
+                continue
+            # Renames and copies (R100, C075, ...) list the old and the new path
+            path_count = 2 if status[0] in "RC" else 1
+            changed.update(p for p in tokens[i + 1 : i + 1 + path_count] if p)
+            i += 1 + path_count
+        return changed
+
     def list_files(self) -> list[str]:
         """List all tracked files in repository.
 
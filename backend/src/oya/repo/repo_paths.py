@@ -63,6 +63,7 @@ class RepoPaths:
         self.oyawiki = self.meta / ".oyawiki"
         self.oyaignore = self.meta / ".oyaignore"
         self.oya_logs = self.meta / ".oya-logs"
+        self.oya_cache = self.meta / ".oya-cache"
 
         # .oyawiki subdirectories (mirrors current structure)
         self.wiki_dir = self.oyawiki / "wiki"
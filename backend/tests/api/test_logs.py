@@ -123,6 +123,21 @@ async def test_delete_logs_removes_file(data_dir):
     assert not log_path.exists()
 
 
+@pytest.mark.asyncio
+async def test_delete_logs_removes_rotated_files(data_dir):
+    """DELETE /api/v2/repos/{repo_id}/logs/llm-queries also removes rotated logs."""
+    repo_id = _create_repo_with_logs(data_dir, '{"timestamp": "2024-01-01"}\n')
+    log_dir = data_dir / "wikis" / "github.com" / "test" / "repo" / "meta" / ".oya-logs"
+    (log_dir / "llm-queries.jsonl.1.gz").write_bytes(b"")
+    (log_dir / "llm-queries.jsonl.2").write_text("")
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.delete(f"/api/v2/repos/{repo_id}/logs/llm-queries")
+
+    assert response.status_code == 200
+    assert list(log_dir.iterdir()) == []
+
+
 @pytest.mark.asyncio
 async def test_delete_logs_not_found_when_no_file(data_dir):
     """DELETE /api/v2/repos/{repo_id}/logs/llm-queries returns 404 when no log file exists."""
@@ -0,0 +1,80 @@
+"""Tests for memory-bounded file contents."""
+
+from oya.generation.contents import FileContents, content_info
+from oya.generation.metrics import compute_code_metrics
+from oya.generation.summaries import FileSummary
+from oya.parsing.cache import hash_content
+
+
+def _store(tmp_path, files, max_chars):
+    """Write files to a repository and record them as analysis would."""
+    contents = FileContents(tmp_path, max_chars=max_chars)
+    for name, text in files.items():
+        (tmp_path / name).write_text(text)
+        contents.add(name, text)
+    return contents
+
+
+class TestFileContents:
+    """Tests for FileContents."""
+
+    def test_behaves_like_a_mapping(self, tmp_path):
+        """Recorded files can be looked up, iterated and tested for membership."""
+        contents = _store(tmp_path, {"a.py": "x = 1\n", "b.py": "y = 2\n"}, max_chars=100)
+
+        assert contents["a.py"] == "x = 1\n"
+        assert contents.get("missing.py", "") == ""
+        assert "b.py" in contents and "missing.py" not in contents
+        assert sorted(contents) == ["a.py", "b.py"]
+        assert len(contents) == 2
+
+    def test_evicts_least_recently_used_and_reloads(self, tmp_path):
+        """Contents over budget are dropped and read back from disk when needed."""
+        contents = _store(
+            tmp_path, {"a.py": "a" * 40, "b.py": "b" * 40, "c.py": "c" * 40}, max_chars=90
+        )
+
+        # a.py was evicted when c.py arrived
+        assert contents.reloads == 0
+        assert contents["b.py"] == "b" * 40
+        assert contents.reloads == 0
+        assert contents["a.py"] == "a" * 40
+        assert contents.reloads == 1
+        # Reloading a.py evicted c.py, the least recently used
+        assert contents["c.py"] == "c" * 40
+        assert contents.reloads == 2
+
+    def test_info_does_not_load_content(self, tmp_path):
+        """Hash, size and line count are available without reading the file."""
+        contents = _store(tmp_path, {"a.py": "one\ntwo\n"}, max_chars=0)
+        (tmp_path / "a.py").unlink()
+
+        info = contents.info("a.py")
+
+        assert info.content_hash == hash_content("one\ntwo\n")
+        assert (info.size, info.lines) == (8, 2)
+        assert contents.reloads == 0
+
+    def test_unreadable_file_returns_empty(self, tmp_path):
+        """A file deleted after analysis reads as empty instead of failing."""
+        contents = _store(tmp_path, {"a.py": "x"}, max_chars=0)
+        (tmp_path / "a.py").unlink()
+
+        assert contents["a.py"] == ""
+
+    def test_content_info_of_plain_mapping(self):
+        """Plain dicts are described from their content."""
+        info = content_info({"a.py": "x\ny"}, "a.py")
+
+        assert (info.size, info.lines) == (3, 2)
+        assert content_info({}, "a.py") is None
+
+    def test_metrics_use_recorded_line_counts(self, tmp_path):
+        """Code metrics count lines without loading evicted files."""
+        contents = _store(tmp_path, {"a.py": "1\n2\n3\n"}, max_chars=0)
+        summaries = [FileSummary(file_path="a.py", purpose="A", layer="api")]
+
+        metrics = compute_code_metrics(summaries, contents)
+
+        assert metrics.lines_by_layer == {"api": 3}
+        assert contents.reloads == 0
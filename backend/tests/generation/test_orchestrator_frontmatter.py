@@ -19,7 +19,7 @@ class TestSavePageWithFrontmatter:
         mock_repo.get_head_commit.return_value = "abc123def456789012"
         mock_repo.path = tmp_path / "repo"
         mock_db = MagicMock()
-        mock_db.execute = MagicMock()
+        mock_db.executemany = MagicMock()
         mock_db.commit = MagicMock()
 
         wiki_path = tmp_path / "wiki"
@@ -45,6 +45,7 @@ class TestSavePageWithFrontmatter:
         )
 
         await orchestrator._save_page_with_frontmatter(page, layer="api")
+        await orchestrator._flush_pages()
 
         saved_path = orchestrator.wiki_path / "files" / "test-py.md"
         content = saved_path.read_text()
@@ -69,6 +70,7 @@ class TestSavePageWithFrontmatter:
         )
 
         await orchestrator._save_page_with_frontmatter(page, layer=None)
+        await orchestrator._flush_pages()
 
         saved_path = orchestrator.wiki_path / "overview.md"
         content = saved_path.read_text()
@@ -80,7 +82,7 @@ class TestSavePageWithFrontmatter:
 
     @pytest.mark.asyncio
     async def test_save_page_records_to_database(self, orchestrator, tmp_path):
-        """Verify page is recorded in database."""
+        """Verify page is recorded in database once flushed."""
         page = GeneratedPage(
             content="# Test",
             page_type="file",
@@ -90,8 +92,9 @@ class TestSavePageWithFrontmatter:
         )
 
         await orchestrator._save_page_with_frontmatter(page, layer="api")
+        await orchestrator._flush_pages()
 
-        orchestrator.db.execute.assert_called_once()
+        orchestrator.db.executemany.assert_called_once()
         orchestrator.db.commit.assert_called_once()
 
     @pytest.mark.asyncio
@@ -107,12 +110,13 @@ class TestSavePageWithFrontmatter:
         )
 
         await orchestrator._save_page_with_frontmatter(page, layer="api")
+        await orchestrator._flush_pages()
 
-        # Check that the execute call included the source_hash in metadata
-        call_args = orchestrator.db.execute.call_args
+        # Check that the recorded row included the source_hash in metadata
+        call_args = orchestrator.db.executemany.call_args
         assert call_args is not None
         # The metadata JSON should contain source_hash
-        metadata_json = call_args[0][1][4]  # 5th parameter is metadata
+        metadata_json = call_args[0][1][0][4]  # 5th parameter of the only row is metadata
         assert "abcdef123456" in metadata_json
 
     @pytest.mark.asyncio
@@ -127,6 +131,7 @@ class TestSavePageWithFrontmatter:
         )
 
         await orchestrator._save_page_with_frontmatter(page, layer="domain")
+        await orchestrator._flush_pages()
 
         saved_path = orchestrator.wiki_path / "deep" / "nested" / "path" / "test.md"
         assert saved_path.exists()
@@ -146,6 +151,7 @@ class TestSavePageWithFrontmatter:
         )
 
         await orchestrator._save_page_with_frontmatter(page, layer=None)
+        await orchestrator._flush_pages()
 
         saved_path = orchestrator.wiki_path / "dirs" / "src-api.md"
         content = saved_path.read_text()
@@ -171,6 +177,7 @@ class TestSavePageWithFrontmatter:
         )
 
         await orchestrator._save_page_with_frontmatter(page, layer=None)
+        await orchestrator._flush_pages()
 
         saved_path = orchestrator.wiki_path / "workflows" / "authentication.md"
         content = saved_path.read_text()
@@ -0,0 +1,125 @@
+"""Tests for batched page persistence."""
+
+import json
+import sqlite3
+from unittest.mock import MagicMock
+
+import pytest
+
+from oya.db.connection import Database
+from oya.db.migrations import run_migrations
+from oya.generation.page_writer import PageWriter, PendingPage
+
+
+def _page(name: str, **metadata) -> PendingPage:
+    return PendingPage(
+        path=f"files/{name}.md",
+        content=f"# {name}",
+        page_type="file",
+        word_count=2,
+        target=f"{name}.py",
+        metadata=metadata,
+    )
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(tmp_path / "oya.db")
+    run_migrations(db)
+    yield db
+    db.close()
+
+
+class TestPageWriter:
+    """Tests for PageWriter."""
+
+    @pytest.mark.asyncio
+    async def test_buffers_until_flush(self, tmp_path, db):
+        """Pages are not written or recorded until the batch is flushed."""
+        writer = PageWriter(tmp_path / "wiki", db, batch_size=10)
+
+        await writer.add(_page("a", source_hash="h1"))
+
+        assert writer.pending_count == 1
+        assert not (tmp_path / "wiki" / "files" / "a.md").exists()
+
+        await writer.flush()
+
+        assert writer.pending_count == 0
+        assert (tmp_path / "wiki" / "files" / "a.md").read_text() == "# a"
+        row = db.execute("SELECT type, target, metadata FROM wiki_pages").fetchone()
+        assert (row[0], row[1], json.loads(row[2])) == ("file", "a.py", {"source_hash": "h1"})
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_in_one_transaction(self, tmp_path):
+        """A full batch is recorded with one executemany and one commit."""
+        db = MagicMock()
+        writer = PageWriter(tmp_path / "wiki", db, batch_size=3)
+
+        for name in ("a", "b", "c", "d"):
+            await writer.add(_page(name))
+
+        db.executemany.assert_called_once()
+        rows = db.executemany.call_args[0][1]
+        assert [row[0] for row in rows] == ["files/a.md", "files/b.md", "files/c.md"]
+        db.commit.assert_called_once()
+        assert writer.pending_count == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_replaces_existing_rows(self, tmp_path, db):
+        """Re-saving a page replaces its row rather than duplicating it."""
+        writer = PageWriter(tmp_path / "wiki", db)
+
+        await writer.add(_page("a", source_hash="old"))
+        await writer.flush()
+        await writer.add(_page("a", source_hash="new"))
+        await writer.flush()
+
+        rows = db.execute("SELECT metadata FROM wiki_pages").fetchall()
+        assert [json.loads(row[0]) for row in rows] == [{"source_hash": "new"}]
+
+    @pytest.mark.asyncio
+    async def test_database_error_rolls_back_batch(self, tmp_path):
+        """A failed insert rolls the batch back and propagates."""
+        db = MagicMock()
+        db.executemany.side_effect = sqlite3.OperationalError("database is locked")
+        writer = PageWriter(tmp_path / "wiki", db)
+
+        await writer.add(_page("a"))
+        with pytest.raises(sqlite3.OperationalError):
+            await writer.flush()
+
+        db.rollback.assert_called_once()
+        db.commit.assert_not_called()
+        # The file was written before the failed insert; no row points at a missing file
+        assert (tmp_path / "wiki" / "files" / "a.md").exists()
+
+    @pytest.mark.asyncio
+    async def test_missing_table_is_skipped(self, tmp_path):
+        """Without a wiki_pages table the files are still written."""
+        db = Database(tmp_path / "empty.db")
+        writer = PageWriter(tmp_path / "wiki", db)
+
+        await writer.add(_page("a"))
+        await writer.flush()
+
+        assert (tmp_path / "wiki" / "files" / "a.md").exists()
+        db.close()
+
+    @pytest.mark.asyncio
+    async def test_on_flush_receives_persisted_batch(self, tmp_path, db):
+        """The flush listener gets each batch after it is written and recorded."""
+        received = []
+
+        def on_flush(batch):
+            # Files and rows exist by the time the listener runs
+            assert all((tmp_path / "wiki" / page.path).exists() for page in batch)
+            count = db.execute("SELECT COUNT(*) FROM wiki_pages").fetchone()[0]
+            received.append(([page.path for page in batch], count))
+
+        writer = PageWriter(tmp_path / "wiki", db, batch_size=2, on_flush=on_flush)
+        for name in ("a", "b", "c"):
+            await writer.add(_page(name))
+        await writer.flush()
+
+        assert received == [(["files/a.md", "files/b.md"], 2), (["files/c.md"], 3)]
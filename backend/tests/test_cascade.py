@@ -113,16 +113,13 @@ class TestFileChangeCascade:
 
         def mock_execute(query, params=None):
             cursor = MagicMock()
-            if "SELECT metadata" in query and params:
-                target, page_type = params
-                key = f"{target}:{page_type}"
-                if key in db._page_info:
-                    info = db._page_info[key]
-                    cursor.fetchone.return_value = (info.get("metadata"), info.get("generated_at"))
-                else:
-                    cursor.fetchone.return_value = None
-            elif "SELECT COUNT" in query:
-                cursor.fetchone.return_value = (0,)  # No new notes
+            if "FROM wiki_pages" in query:
+                cursor.fetchall.return_value = [
+                    (*key.rsplit(":", 1), info.get("metadata"), info.get("generated_at"))
+                    for key, info in db._page_info.items()
+                ]
+            elif "FROM notes" in query:
+                cursor.fetchall.return_value = []  # No new notes
             return cursor
 
         db.execute = mock_execute
@@ -327,16 +324,13 @@ class TestFileChangeCascadeEndToEnd:
 
         def mock_execute(query, params=None):
             cursor = MagicMock()
-            if "SELECT metadata" in query and params:
-                target, page_type = params
-                key = f"{target}:{page_type}"
-                if key in db._page_info:
-                    info = db._page_info[key]
-                    cursor.fetchone.return_value = (info.get("metadata"), info.get("generated_at"))
-                else:
-                    cursor.fetchone.return_value = None
-            elif "SELECT COUNT" in query:
-                cursor.fetchone.return_value = (0,)
+            if "FROM wiki_pages" in query:
+                cursor.fetchall.return_value = [
+                    (*key.rsplit(":", 1), info.get("metadata"), info.get("generated_at"))
+                    for key, info in db._page_info.items()
+                ]
+            elif "FROM notes" in query:
+                cursor.fetchall.return_value = []
             elif "INSERT OR REPLACE" in query and params:
                 # Track which files are being saved (regenerated)
                 path = params[0]
@@ -593,16 +587,13 @@ class TestSynthesisCascade:
 
         def mock_execute(query, params=None):
             cursor = MagicMock()
-            if "SELECT metadata" in query and params:
-                target, page_type = params
-                key = f"{target}:{page_type}"
-                if key in db._page_info:
-                    info = db._page_info[key]
-                    cursor.fetchone.return_value = (info.get("metadata"), info.get("generated_at"))
-                else:
-                    cursor.fetchone.return_value = None
-            elif "SELECT COUNT" in query:
-                cursor.fetchone.return_value = (0,)
+            if "FROM wiki_pages" in query:
+                cursor.fetchall.return_value = [
+                    (*key.rsplit(":", 1), info.get("metadata"), info.get("generated_at"))
+                    for key, info in db._page_info.items()
+                ]
+            elif "FROM notes" in query:
+                cursor.fetchall.return_value = []
             return cursor
 
         db.execute = mock_execute
@@ -797,16 +788,13 @@ class TestHighLevelDocsCascade:
 
         def mock_execute(query, params=None):
             cursor = MagicMock()
-            if "SELECT metadata" in query and params:
-                target, page_type = params
-                key = f"{target}:{page_type}"
-                if key in db._page_info:
-                    info = db._page_info[key]
-                    cursor.fetchone.return_value = (info.get("metadata"), info.get("generated_at"))
-                else:
-                    cursor.fetchone.return_value = None
-            elif "SELECT COUNT" in query:
-                cursor.fetchone.return_value = (0,)
+            if "FROM wiki_pages" in query:
+                cursor.fetchall.return_value = [
+                    (*key.rsplit(":", 1), info.get("metadata"), info.get("generated_at"))
+                    for key, info in db._page_info.items()
+                ]
+            elif "FROM notes" in query:
+                cursor.fetchall.return_value = []
             return cursor
 
         db.execute = mock_execute
@@ -1034,16 +1022,13 @@ class TestHighLevelDocsCascadeEndToEnd:
 
         def mock_execute(query, params=None):
             cursor = MagicMock()
-            if "SELECT metadata" in query and params:
-                target, page_type = params
-                key = f"{target}:{page_type}"
-                if key in db._page_info:
-                    info = db._page_info[key]
-                    cursor.fetchone.return_value = (info.get("metadata"), info.get("generated_at"))
-                else:
-                    cursor.fetchone.return_value = None
-            elif "SELECT COUNT" in query:
-                cursor.fetchone.return_value = (0,)
+            if "FROM wiki_pages" in query:
+                cursor.fetchall.return_value = [
+                    (*key.rsplit(":", 1), info.get("metadata"), info.get("generated_at"))
+                    for key, info in db._page_info.items()
+                ]
+            elif "FROM notes" in query:
+                cursor.fetchall.return_value = []
             elif "INSERT OR REPLACE" in query and params:
                 # Track which pages are being saved
                 path = params[0]
@@ -1183,17 +1168,14 @@ class TestNoChangeSkip:
 
         def mock_execute(query, params=None):
             cursor = MagicMock()
-            if "SELECT metadata" in query and params:
-                target, page_type = params
-                key = f"{target}:{page_type}"
-                if key in db._page_info:
-                    info = db._page_info[key]
-                    cursor.fetchone.return_value = (info.get("metadata"), info.get("generated_at"))
-                else:
-                    cursor.fetchone.return_value = None
-            elif "SELECT COUNT" in query:
+            if "FROM wiki_pages" in query:
+                cursor.fetchall.return_value = [
+                    (*key.rsplit(":", 1), info.get("metadata"), info.get("generated_at"))
+                    for key, info in db._page_info.items()
+                ]
+            elif "FROM notes" in query:
                 # No new notes
-                cursor.fetchone.return_value = (0,)
+                cursor.fetchall.return_value = []
             elif "INSERT OR REPLACE" in query and params:
                 # Track which pages are being saved
                 path = params[0]
@@ -1467,17 +1449,16 @@ class TestNoChangeSkip:
 
         def mock_execute(query, params=None):
             cursor = MagicMock()
-            if "SELECT metadata" in query and params:
-                target, page_type = params
-                key = f"{target}:{page_type}"
-                if key in db._page_info:
-                    info = db._page_info[key]
-                    cursor.fetchone.return_value = (info.get("metadata"), info.get("generated_at"))
-                else:
-                    cursor.fetchone.return_value = None
-            elif "SELECT COUNT" in query:
-                # Simulate new notes exist
-                cursor.fetchone.return_value = (1,)
+            if "FROM wiki_pages" in query:
+                cursor.fetchall.return_value = [
+                    (*key.rsplit(":", 1), info.get("metadata"), info.get("generated_at"))
+                    for key, info in db._page_info.items()
+                ]
+            elif "FROM notes" in query:
+                # Simulate new notes exist, newer than any generated page
+                cursor.fetchall.return_value = [
+                    (key.rsplit(":", 1)[0], "9999-12-31T00:00:00") for key in db._page_info
+                ]
             return cursor
 
         db.execute = mock_execute
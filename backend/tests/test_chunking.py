@@ -4,6 +4,7 @@
 from oya.generation.chunking import (
     chunk_file_content,
     chunk_by_symbols,
+    chunk_large_file,
     estimate_tokens,
 )
 from oya.parsing.models import ParsedSymbol, SymbolType
@@ -72,3 +73,76 @@ def test_chunk_includes_overlap():
     if len(chunks) > 1:
         # Check that second chunk starts before first chunk ends
         assert chunks[1].start_line <= chunks[0].end_line + 5
+
+
+def _function_source(name: str, body_lines: int) -> list[str]:
+    return [f"def {name}():"] + [f"    value = {i}  # padding" for i in range(body_lines)]
+
+
+def test_chunk_large_file_covers_every_line():
+    """Large-file chunks tile the file, including lines outside symbols."""
+    lines = ["import os", "import sys", ""]
+    symbols = []
+    for name in ("first", "second", "third"):
+        start = len(lines) + 1
+        lines.extend(_function_source(name, 20))
+        symbols.append(
+            ParsedSymbol(
+                name=name,
+                symbol_type=SymbolType.FUNCTION,
+                start_line=start,
+                end_line=len(lines),
+            )
+        )
+        lines.append("")
+    content = "\n".join(lines)
+
+    chunks = chunk_large_file(content, "big.py", symbols, max_tokens=200)
+
+    assert len(chunks) > 1
+    assert chunks[0].start_line == 1
+    assert chunks[-1].end_line == len(lines)
+    for prev, nxt in zip(chunks, chunks[1:]):
+        assert nxt.start_line == prev.end_line + 1
+    assert "\n".join(chunk.content for chunk in chunks) == content
+    assert [chunk.chunk_index for chunk in chunks] == list(range(len(chunks)))
+
+
+def test_chunk_large_file_splits_large_class_by_methods():
+    """A class over the limit is chunked along its methods without duplication."""
+    lines = ["class Big:"]
+    symbols = []
+    for name in ("alpha", "beta", "gamma"):
+        start = len(lines) + 1
+        lines.extend("    " + line for line in _function_source(name, 20))
+        symbols.append(
+            ParsedSymbol(
+                name=name,
+                symbol_type=SymbolType.METHOD,
+                start_line=start,
+                end_line=len(lines),
+                parent="Big",
+            )
+        )
+    symbols.insert(
+        0,
+        ParsedSymbol(name="Big", symbol_type=SymbolType.CLASS, start_line=1, end_line=len(lines)),
+    )
+    content = "\n".join(lines)
+
+    chunks = chunk_large_file(content, "big.py", symbols, max_tokens=200)
+
+    assert len(chunks) > 1
+    assert "\n".join(chunk.content for chunk in chunks) == content
+    method_names = [s.name for chunk in chunks for s in chunk.symbols if s.parent]
+    assert method_names == ["alpha", "beta", "gamma"]
+
+
+def test_chunk_large_file_without_symbols_splits_by_lines():
+    """Without symbols, large files fall back to line-based chunks."""
+    content = "line\n" * 1000
+
+    chunks = chunk_large_file(content, "data.txt", [], max_tokens=100)
+
+    assert len(chunks) > 1
+    assert chunks[0].start_line == 1
@@ -0,0 +1,397 @@
+"""Tests for bounded concurrency helpers."""
+
+import asyncio
+import time
+
+import pytest
+
+from oya.generation.concurrency import (
+    AdaptiveConcurrency,
+    CompletionTracker,
+    ConcurrencyBudget,
+    TaskTimeoutError,
+    run_bounded,
+    run_concurrently,
+    run_dependency_graph,
+)
+
+
+async def _collect(results):
+    return [item async for item in results]
+
+
+class TestRunBounded:
+    """Tests for the sliding-window scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_yields_every_result(self):
+        """Every item is processed exactly once."""
+
+        async def double(x):
+            return x * 2
+
+        results = await _collect(run_bounded(range(10), double, limit=3))
+
+        assert sorted(results) == [(i, i * 2) for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_respects_limit(self):
+        """No more than `limit` workers run at once."""
+        running = 0
+        peak = 0
+
+        async def worker(x):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return x
+
+        await _collect(run_bounded(range(20), worker, limit=4))
+
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_slow_item_does_not_stall_window(self):
+        """Fast items keep flowing while one slow item holds a slot."""
+        slow_release = asyncio.Event()
+        order = []
+
+        async def worker(x):
+            if x == 0:
+                await slow_release.wait()
+            order.append(x)
+            return x
+
+        results = run_bounded(range(6), worker, limit=2)
+        seen = []
+        async for item, _ in results:
+            seen.append(item)
+            if len(seen) == 5:
+                slow_release.set()
+
+        # All fast items finished before the slow one, with only two slots
+        assert seen[:5] == [1, 2, 3, 4, 5]
+        assert seen[-1] == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_and_cancels_remaining(self):
+        """A timed-out item raises TaskTimeoutError and cancels outstanding work."""
+        cancelled = []
+
+        async def worker(x):
+            try:
+                await asyncio.sleep(10 if x in (0, 1) else 0)
+            except asyncio.CancelledError:
+                cancelled.append(x)
+                raise
+            return x
+
+        with pytest.raises(TaskTimeoutError) as exc_info:
+            await _collect(run_bounded(range(2), worker, limit=2, timeout=0.05))
+
+        assert exc_info.value.item in (0, 1)
+        assert len(cancelled) >= 1
+
+    @pytest.mark.asyncio
+    async def test_error_cancels_in_flight_work(self):
+        """A failing worker cancels the other in-flight workers."""
+        cancelled = []
+
+        async def worker(x):
+            if x == 0:
+                raise ValueError("boom")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(x)
+                raise
+            return x
+
+        with pytest.raises(ValueError, match="boom"):
+            await _collect(run_bounded(range(3), worker, limit=3))
+
+        assert sorted(cancelled) == [1, 2]
+
+
+class TestRunDependencyGraph:
+    """Tests for dependency-driven scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_nodes_start_after_prerequisites(self):
+        """A node only starts once every prerequisite has finished."""
+        finished: set[str] = set()
+        violations = []
+
+        async def worker(node):
+            for prerequisite in graph[node]:
+                if prerequisite not in finished:
+                    violations.append((node, prerequisite))
+            await asyncio.sleep(0)
+            finished.add(node)
+            return node
+
+        graph = {"leaf1": [], "leaf2": [], "mid": ["leaf1"], "root": ["mid", "leaf2"]}
+
+        results = await _collect(run_dependency_graph(graph, worker, limit=4))
+
+        assert violations == []
+        assert [node for node, _ in results][-1] == "root"
+        assert len(results) == 4
+
+    @pytest.mark.asyncio
+    async def test_independent_nodes_run_concurrently(self):
+        """Nodes without dependencies between them share the window."""
+        running = 0
+        peak = 0
+
+        async def worker(node):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return node
+
+        graph = {f"n{i}": [] for i in range(6)}
+        graph["root"] = list(graph)
+
+        await _collect(run_dependency_graph(graph, worker, limit=3))
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_ignores_unknown_prerequisites(self):
+        """Prerequisites outside the graph do not block a node."""
+
+        async def worker(node):
+            return node
+
+        results = await _collect(run_dependency_graph({"a": ["missing"]}, worker, limit=1))
+
+        assert results == [("a", "a")]
+
+    @pytest.mark.asyncio
+    async def test_cycle_raises(self):
+        """A dependency cycle is reported instead of hanging."""
+
+        async def worker(node):
+            return node
+
+        with pytest.raises(ValueError, match="cycle"):
+            await _collect(run_dependency_graph({"a": ["b"], "b": ["a"]}, worker, limit=2))
+
+
+class TestConcurrencyBudget:
+    """Tests for the shared concurrency budget."""
+
+    @pytest.mark.asyncio
+    async def test_limits_calls_from_independent_callers(self):
+        """Calls from separate groups of work share one limit."""
+        running = 0
+        peak = 0
+        budget = ConcurrencyBudget(3)
+
+        async def call():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        async def group(n):
+            await asyncio.gather(*(budget.run(i, call) for i in range(n)))
+
+        await asyncio.gather(group(5), group(5))
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_timeout_excludes_time_waiting_for_a_slot(self):
+        """Only the call itself counts towards the timeout."""
+        budget = ConcurrencyBudget(1, timeout=0.05)
+
+        async def call():
+            await asyncio.sleep(0.03)
+
+        # The second call waits ~0.03s for its slot but still finishes in time
+        await asyncio.gather(budget.run("a", call), budget.run("b", call))
+
+        async def slow():
+            await asyncio.sleep(1)
+
+        with pytest.raises(TaskTimeoutError) as exc_info:
+            await budget.run("slow", slow)
+        assert exc_info.value.item == "slow"
+
+    @pytest.mark.asyncio
+    async def test_follows_adaptive_controller(self):
+        """An adaptive budget admits as many calls as the controller's window."""
+        controller = AdaptiveConcurrency(initial=2, maximum=4)
+        budget = ConcurrencyBudget(2, controller=controller)
+        running = 0
+        peaks = []
+
+        async def call():
+            nonlocal running
+            running += 1
+            peaks.append(running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(*(budget.run(i, call) for i in range(20)))
+
+        assert max(peaks) == 4 == controller.limit
+        assert budget.max_limit == 4
+
+    @pytest.mark.asyncio
+    async def test_timeout_lowers_adaptive_limit(self):
+        """A timed out call counts as congestion."""
+        controller = AdaptiveConcurrency(initial=8, maximum=8)
+        budget = ConcurrencyBudget(8, timeout=0.01, controller=controller)
+
+        async def slow():
+            await asyncio.sleep(1)
+
+        with pytest.raises(TaskTimeoutError):
+            await budget.run("slow", slow)
+
+        assert controller.limit == 4
+
+
+class TestAdaptiveConcurrency:
+    """Tests for the AIMD concurrency controller."""
+
+    def test_additive_increase_up_to_maximum(self):
+        """The window grows by about one per window of successful calls."""
+        controller = AdaptiveConcurrency(initial=2, maximum=3)
+
+        controller.on_success(started=0.0)
+        controller.on_success(started=0.0)
+        assert controller.limit == 2
+        controller.on_success(started=0.0)
+        assert controller.limit == 3
+        for _ in range(10):
+            controller.on_success(started=0.0)
+        assert controller.limit == 3
+
+    def test_multiplicative_decrease_once_per_window(self):
+        """Calls started before the last decrease do not cut the window again."""
+        controller = AdaptiveConcurrency(initial=16, maximum=32)
+
+        controller.on_congestion(started=time.monotonic())
+        controller.on_congestion(started=0.0)
+        assert controller.limit == 8
+
+        controller.on_congestion(started=time.monotonic())
+        assert controller.limit == 4
+
+    def test_never_below_minimum(self):
+        """Repeated congestion stops at the minimum window."""
+        controller = AdaptiveConcurrency(initial=2, maximum=4, minimum=1)
+
+        for _ in range(5):
+            controller.on_congestion(started=time.monotonic())
+
+        assert controller.limit == 1
+
+    def test_latency_spike_counts_as_congestion(self):
+        """A response far slower than the average backs off once latency is known."""
+        controller = AdaptiveConcurrency(initial=20, maximum=20, latency_factor=3.0)
+        for _ in range(10):
+            controller.on_latency(started=time.monotonic(), latency=1.0)
+
+        controller.on_latency(started=time.monotonic(), latency=2.0)
+        assert controller.limit == 20
+        controller.on_latency(started=time.monotonic(), latency=5.0)
+        assert controller.limit == 10
+
+    def test_latency_step_change_cuts_window_once(self):
+        """A lasting rise in latency backs off once, then becomes the new baseline."""
+        controller = AdaptiveConcurrency(initial=10, maximum=10, latency_factor=3.0)
+        for _ in range(20):
+            controller.on_latency(started=time.monotonic(), latency=0.002)
+
+        for _ in range(20):
+            controller.on_latency(started=time.monotonic(), latency=4.0)
+        assert controller.limit == 5
+
+        # Spikes against the new baseline still count
+        controller.on_latency(started=time.monotonic(), latency=20.0)
+        assert controller.limit == 2
+
+
+class TestCompletionTracker:
+    """Tests for waiting on work from a running phase."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_expected_keys_only(self):
+        """Waiters block until their expected keys complete; other keys are done."""
+        tracker = CompletionTracker()
+        done = []
+
+        async def waiter(name, keys):
+            await tracker.wait(keys)
+            done.append(name)
+
+        tasks = [
+            asyncio.create_task(waiter("a", ["a"])),
+            asyncio.create_task(waiter("other", ["x"])),
+        ]
+        await asyncio.sleep(0)
+        assert done == []  # nothing declared yet
+
+        tracker.expect(["a"])
+        await asyncio.sleep(0)
+        assert done == ["other"]
+
+        tracker.complete("a")
+        await asyncio.gather(*tasks)
+        assert done == ["other", "a"]
+
+    @pytest.mark.asyncio
+    async def test_close_releases_waiters(self):
+        """Closing the tracker releases waiters whose keys never completed."""
+        tracker = CompletionTracker()
+        tracker.expect(["a"])
+        waiter = asyncio.create_task(tracker.wait(["a"]))
+
+        tracker.close()
+
+        await asyncio.wait_for(waiter, timeout=1)
+
+
+class TestRunConcurrently:
+    """Tests for running independent phases concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_returns_results_in_order(self):
+        """Results come back in argument order regardless of finishing order."""
+
+        async def value(x, delay):
+            await asyncio.sleep(delay)
+            return x
+
+        assert await run_concurrently(value(1, 0.02), value(2, 0)) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_the_rest(self):
+        """If one awaitable fails, the others are cancelled."""
+        cancelled = False
+
+        async def slow():
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await run_concurrently(slow(), fail())
+
+        assert cancelled
@@ -1,6 +1,7 @@
 # backend/tests/test_file_generator.py
 """File page generator tests."""
 
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -284,6 +285,10 @@ Documentation after retry.
 
     # Should have called LLM twice (original + retry)
     assert mock_llm.generate.call_count == 2
+    # The retry must not be answered from the response cache
+    first, retry = mock_llm.generate.call_args_list
+    assert first.kwargs["refresh_cache"] is False
+    assert retry.kwargs["refresh_cache"] is True
 
     # Should have logged a warning about retry
     assert "YAML parsing failed" in caplog.text
@@ -498,3 +503,180 @@ async def test_file_generator_passes_none_synopsis_by_default(generator, mock_ll
         mock_prompt.assert_called_once()
         call_kwargs = mock_prompt.call_args.kwargs
         assert call_kwargs["synopsis"] is None
+
+
+# =============================================================================
+# Map-reduce documentation for large files
+# =============================================================================
+
+
+def _large_file(function_count: int) -> tuple[str, list[dict], list]:
+    """Build a file of padded functions with matching symbol dicts and ParsedSymbols."""
+    from oya.parsing.models import ParsedSymbol, SymbolType
+
+    lines: list[str] = []
+    symbols: list[dict] = []
+    parsed: list[ParsedSymbol] = []
+    for i in range(function_count):
+        start = len(lines) + 1
+        lines.append(f"def handler_{i}():")
+        lines.extend(f"    step_{j} = compute({j})" for j in range(30))
+        symbols.append({"name": f"handler_{i}", "type": "function", "line": start})
+        parsed.append(
+            ParsedSymbol(
+                name=f"handler_{i}",
+                symbol_type=SymbolType.FUNCTION,
+                start_line=start,
+                end_line=len(lines),
+            )
+        )
+    return "\n".join(lines), symbols, parsed
+
+
+@pytest.mark.asyncio
+async def test_generate_small_file_uses_single_prompt(mock_llm_client, mock_repo):
+    """Files within the context share are documented with one LLM call."""
+    generator = FileGenerator(mock_llm_client, mock_repo, context_limit=10_000, chunk_tokens=200)
+
+    await generator.generate(
+        file_path="src/auth/login.py",
+        content="def login(user, password): pass",
+        symbols=[],
+        imports=[],
+        architecture_summary="",
+    )
+
+    assert mock_llm_client.generate.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_large_file_summarizes_chunks_then_combines(mock_llm_client, mock_repo):
+    """Large files are summarized per chunk, then the page is built from the summaries."""
+    content, symbols, parsed = _large_file(8)
+    generator = FileGenerator(mock_llm_client, mock_repo, context_limit=1000, chunk_tokens=300)
+    assert generator.is_large(content)
+
+    page, summary = await generator.generate(
+        file_path="src/handlers.py",
+        content=content,
+        symbols=symbols,
+        imports=[],
+        architecture_summary="",
+        parsed_symbols=parsed,
+    )
+
+    prompts = [call.kwargs["prompt"] for call in mock_llm_client.generate.call_args_list]
+    chunk_prompts, final_prompt = prompts[:-1], prompts[-1]
+    assert len(chunk_prompts) > 1
+    assert all("Summarize part" in prompt for prompt in chunk_prompts)
+    # Every symbol is summarized in exactly one chunk
+    for symbol in symbols:
+        assert sum(f"- {symbol['name']} " in prompt for prompt in chunk_prompts) == 1
+    # The final prompt carries the chunk summaries instead of the raw content
+    assert "File Content (Summarized)" in final_prompt
+    assert "step_29 = compute(29)" not in final_prompt
+    assert summary.purpose == "Handles user authentication"
+    assert page.target == "src/handlers.py"
+
+
+@pytest.mark.asyncio
+async def test_generate_large_file_takes_budget_slot_per_call(mock_llm_client, mock_repo):
+    """Each chunk call of a large file runs within the shared concurrency budget."""
+    from oya.generation.concurrency import ConcurrencyBudget
+
+    content, symbols, parsed = _large_file(8)
+    generator = FileGenerator(mock_llm_client, mock_repo, context_limit=1000, chunk_tokens=300)
+    budget = ConcurrencyBudget(2)
+    in_flight = 0
+    peak = 0
+
+    async def generate(prompt, system_prompt, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return mock_llm_client.generate.return_value
+
+    mock_llm_client.generate.side_effect = generate
+
+    await generator.generate(
+        file_path="src/handlers.py",
+        content=content,
+        symbols=symbols,
+        imports=[],
+        architecture_summary="",
+        parsed_symbols=parsed,
+        budget=budget,
+    )
+
+    assert mock_llm_client.generate.call_count > 3
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_generate_large_file_combines_summaries_in_tiers(mock_llm_client, mock_repo):
+    """Chunk summaries too large for the page prompt are combined before it."""
+    content, symbols, parsed = _large_file(8)
+    generator = FileGenerator(mock_llm_client, mock_repo, context_limit=1000, chunk_tokens=300)
+
+    async def generate(prompt, system_prompt, **kwargs):
+        if "Summarize part" in prompt:
+            return "chunk notes " * 70  # ~210 tokens each, over the 500 token share in total
+        if "Combine your notes" in prompt:
+            return "combined notes"
+        return mock_llm_client.generate.return_value
+
+    mock_llm_client.generate.side_effect = generate
+
+    await generator.generate(
+        file_path="src/handlers.py",
+        content=content,
+        symbols=symbols,
+        imports=[],
+        architecture_summary="",
+        parsed_symbols=parsed,
+    )
+
+    prompts = [call.kwargs["prompt"] for call in mock_llm_client.generate.call_args_list]
+    merge_prompts = [prompt for prompt in prompts if "Combine your notes" in prompt]
+    assert merge_prompts
+    # Each merge stays within the context share
+    assert all(prompt.count("chunk notes") <= 2 * 70 for prompt in merge_prompts)
+    final_prompt = prompts[-1]
+    assert "File Content (Summarized)" in final_prompt
+    assert "chunk notes" not in final_prompt
+    assert "combined notes" in final_prompt
+
+
+@pytest.mark.asyncio
+async def test_generate_large_file_bounds_calls_without_budget(mock_llm_client, mock_repo):
+    """Without a shared budget, a large file still limits its calls in flight."""
+    from oya.generation.file import LARGE_FILE_CALL_LIMIT
+
+    content, symbols, parsed = _large_file(16)
+    generator = FileGenerator(mock_llm_client, mock_repo, context_limit=1000, chunk_tokens=100)
+    in_flight = 0
+    peak = 0
+
+    async def generate(prompt, system_prompt, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return mock_llm_client.generate.return_value
+
+    mock_llm_client.generate.side_effect = generate
+
+    await generator.generate(
+        file_path="src/handlers.py",
+        content=content,
+        symbols=symbols,
+        imports=[],
+        architecture_summary="",
+        parsed_symbols=parsed,
+    )
+
+    assert mock_llm_client.generate.call_count > LARGE_FILE_CALL_LIMIT
+    assert peak == LARGE_FILE_CALL_LIMIT
@@ -87,3 +87,33 @@ def test_git_repo_lists_files(temp_git_repo: Path):
 
     assert "README.md" in files
     assert "src/main.py" in files
+
+
+def test_git_repo_gets_changed_paths(temp_git_repo: Path):
+    """Reports modified, added, deleted and renamed paths since a commit."""
+    repo = GitRepo(temp_git_repo)
+    first = repo.get_head_commit()
+
+    (temp_git_repo / "src" / "main.py").write_text("def main(): return 1")
+    (temp_git_repo / "src" / "new.py").write_text("x = 1")
+    subprocess.run(["git", "mv", "README.md", "docs.md"], cwd=temp_git_repo, capture_output=True)
+    subprocess.run(["git", "add", "-A"], cwd=temp_git_repo, capture_output=True)
+    subprocess.run(["git", "commit", "-m", "Change"], cwd=temp_git_repo, capture_output=True)
+
+    changed = repo.get_changed_paths(first)
+
+    assert changed == {"src/main.py", "src/new.py", "README.md", "docs.md"}
+
+
+def test_git_repo_changed_paths_empty_at_head(temp_git_repo: Path):
+    """No paths changed between HEAD and itself."""
+    repo = GitRepo(temp_git_repo)
+
+    assert repo.get_changed_paths(repo.get_head_commit()) == set()
+
+
+def test_git_repo_changed_paths_unknown_commit(temp_git_repo: Path):
+    """An unknown commit yields None so callers fall back to hashing."""
+    repo = GitRepo(temp_git_repo)
+
+    assert repo.get_changed_paths("0" * 40) is None
@@ -1,5 +1,7 @@
 """Job management API tests."""
 
+import json
+
 import pytest
 from httpx import ASGITransport, AsyncClient
 
@@ -44,6 +46,29 @@ async def test_get_job_status(client, workspace_with_db):
     assert data["current_phase"] == "syncing"
 
 
+async def test_get_job_status_reports_concurrency_limit(client, workspace_with_db):
+    """GET /api/jobs/{job_id} returns the LLM calls currently allowed in flight."""
+    db = get_db()
+    db.execute("UPDATE generations SET concurrency_limit = 7 WHERE id = 'test-job-123'")
+    db.commit()
+
+    response = await client.get("/api/jobs/test-job-123")
+
+    assert response.json()["concurrency_limit"] == 7
+
+
+async def test_get_job_status_reports_usage(client, workspace_with_db):
+    """GET /api/jobs/{job_id} returns the LLM usage stored with the job."""
+    usage = {"total": {"calls": 3, "prompt_tokens": 120}, "phases": {}, "pages": {}}
+    db = get_db()
+    db.execute("UPDATE generations SET usage = ? WHERE id = 'test-job-123'", (json.dumps(usage),))
+    db.commit()
+
+    response = await client.get("/api/jobs/test-job-123")
+
+    assert response.json()["usage"] == usage
+
+
 async def test_get_nonexistent_job_returns_404(client, workspace_with_db):
     """GET /api/jobs/{nonexistent} returns 404."""
     response = await client.get("/api/jobs/nonexistent-job")
@@ -142,6 +142,8 @@ async def test_llm_client_logs_queries_to_jsonl(tmp_path):
 
         await client.generate("Test prompt", system_prompt="System")
 
+    # Logging is asynchronous; wait for the writer
+    client.flush_log()
     # Verify log file was created and contains valid JSONL
     assert log_file.exists()
     with open(log_file) as f:
@@ -175,6 +177,7 @@ async def test_llm_client_logs_errors_to_jsonl(tmp_path):
             await client.generate("Test prompt")
 
     # Verify error was logged
+    client.flush_log()
     assert log_file.exists()
     with open(log_file) as f:
         entry = json.loads(f.readline())
@@ -235,6 +238,7 @@ async def test_generate_stream_logs_to_jsonl(tmp_path):
             tokens.append(token)
 
     # Verify log file was created with accumulated response
+    client.flush_log()
     assert log_file.exists()
     with open(log_file) as f:
         entry = json.loads(f.readline())
@@ -0,0 +1,161 @@
+"""LLM response cache tests."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from oya.llm import LLMClient, ResponseCache, llm_phase
+from oya.llm.cache import request_key
+
+
+@pytest.fixture
+def mock_completion():
+    """Mock litellm completion response."""
+    with patch("oya.llm.client.acompletion") as mock:
+        mock.return_value = AsyncMock(
+            choices=[AsyncMock(message=AsyncMock(content="Test response"))]
+        )
+        yield mock
+
+
+def _key(prompt, **overrides):
+    request = {"model": "gpt-4o", "system_prompt": "sys", "temperature": 0.7, "max_tokens": 100}
+    request.update(overrides)
+    return request_key(prompt=prompt, **request)
+
+
+def test_request_key_normalizes_whitespace():
+    """Line endings and surrounding whitespace do not change the key."""
+    assert _key("a\r\nb\n") == _key("  a\nb")
+    assert _key("a", system_prompt=None) == _key("a", system_prompt="")
+
+
+def test_request_key_depends_on_request():
+    """Model, prompts and sampling settings all select different responses."""
+    base = _key("a")
+
+    assert _key("b") != base
+    assert _key("a", model="gpt-4o-mini") != base
+    assert _key("a", system_prompt="other") != base
+    assert _key("a", temperature=0.3) != base
+    assert _key("a", max_tokens=200) != base
+
+
+async def test_cache_persists_responses(tmp_path):
+    """Responses survive reopening the cache."""
+    cache = ResponseCache(tmp_path / "cache.db", max_bytes=1000)
+    cache.put("k", "response")
+    cache.close()
+
+    reopened = ResponseCache(tmp_path / "cache.db", max_bytes=1000)
+
+    assert await reopened.get("k") == "response"
+    assert await reopened.get("other") is None
+    assert reopened.stats()["hits"] == 1
+    assert reopened.stats()["misses"] == 1
+    assert reopened.size == len("response")
+
+
+async def test_cache_evicts_least_recently_used(tmp_path):
+    """Storing over the size limit evicts the responses used longest ago."""
+    cache = ResponseCache(tmp_path / "cache.db", max_bytes=100)
+    cache.put("a", "a" * 40)
+    cache.put("b", "b" * 40)
+    await cache.get("a")
+
+    cache.put("c", "c" * 40)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == "a" * 40
+    assert await cache.get("c") == "c" * 40
+    assert cache.evictions == 1
+    assert cache.size == 80
+
+
+async def test_cache_evicts_down_to_target_in_batches(tmp_path):
+    """Eviction removes only as many old responses as needed to get under the target."""
+    cache = ResponseCache(tmp_path / "cache.db", max_bytes=1000)
+    for i in range(100):
+        cache.put(f"k{i}", "x" * 10)
+    await cache.get("k0")
+
+    cache.put("big", "y" * 200)
+
+    assert cache.stats()["entries"] == 71
+    assert cache.size == 900
+    assert await cache.get("k0") == "x" * 10
+    assert await cache.get("k1") is None
+
+
+async def test_cache_records_hits_when_closed(tmp_path):
+    """Last-used times of hits are written in batches, and on close."""
+    cache = ResponseCache(tmp_path / "cache.db", max_bytes=100)
+    cache.put("a", "a" * 40)
+    cache.put("b", "b" * 40)
+    await cache.get("a")
+    cache.close()
+
+    reopened = ResponseCache(tmp_path / "cache.db", max_bytes=100)
+    reopened.put("c", "c" * 40)
+
+    assert await reopened.get("a") == "a" * 40
+    assert await reopened.get("b") is None
+
+
+async def test_cache_skips_oversized_response(tmp_path):
+    """A response larger than the whole cache is not stored."""
+    cache = ResponseCache(tmp_path / "cache.db", max_bytes=10)
+
+    cache.put("a", "a" * 11)
+
+    assert await cache.get("a") is None
+    assert cache.stores == 0
+
+
+async def test_client_answers_repeated_request_from_cache(tmp_path, mock_completion):
+    """An unchanged request is answered without calling the provider."""
+    cache = ResponseCache(tmp_path / "cache.db", max_bytes=1000)
+    client = LLMClient(provider="openai", model="gpt-4o", cache=cache)
+
+    first = await client.generate("Prompt", temperature=0.5, max_tokens=100)
+    second = await client.generate("Prompt", temperature=0.5, max_tokens=100)
+    await client.generate("Other prompt", temperature=0.5, max_tokens=100)
+
+    assert first == second == "Test response"
+    assert mock_completion.call_count == 2
+    assert cache.hits == 1
+
+
+async def test_client_refresh_cache_bypasses_lookup(tmp_path, mock_completion):
+    """refresh_cache calls the provider and replaces the cached response."""
+    cache = ResponseCache(tmp_path / "cache.db", max_bytes=1000)
+    client = LLMClient(provider="openai", model="gpt-4o", cache=cache)
+    await client.generate("Prompt", temperature=0.5, max_tokens=100)
+    mock_completion.return_value = AsyncMock(
+        choices=[AsyncMock(message=AsyncMock(content="Better response"))]
+    )
+
+    response = await client.generate("Prompt", temperature=0.5, max_tokens=100, refresh_cache=True)
+
+    assert response == "Better response"
+    assert mock_completion.call_count == 2
+    assert await client.generate("Prompt", temperature=0.5, max_tokens=100) == "Better response"
+
+
+async def test_client_skips_cache_in_excluded_phase(tmp_path, mock_completion):
+    """Calls made during an excluded phase neither read nor write the cache."""
+    cache = ResponseCache(tmp_path / "cache.db", max_bytes=1000, skip_phases=["synthesis"])
+    client = LLMClient(provider="openai", model="gpt-4o", cache=cache)
+
+    async def call_in(phase):
+        with llm_phase(phase):
+            return await client.generate("Prompt", temperature=0.5, max_tokens=100)
+
+    await call_in("synthesis")
+    await asyncio.create_task(call_in("synthesis"))
+    await call_in("files")
+    await call_in("files")
+
+    assert mock_completion.call_count == 3
+    assert cache.stats()["entries"] == 1
@@ -0,0 +1,128 @@
+"""LLM query log writer tests."""
+
+import gzip
+import json
+import threading
+
+from oya.llm.querylog import QueryLog, QueryLogOptions, get_query_log, rotated_log_files
+
+
+def _entry(n, error=None, response="ok"):
+    return {"request": {"prompt": f"prompt {n}"}, "response": response, "error": error}
+
+
+def _read(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_writes_entries_in_order(tmp_path):
+    """Queued entries reach the file in order once flushed."""
+    log = QueryLog(tmp_path / "logs" / "q.jsonl")
+
+    for n in range(50):
+        log.write(_entry(n))
+    log.flush()
+
+    assert [e["request"]["prompt"] for e in _read(log.path)] == [f"prompt {n}" for n in range(50)]
+    log.close()
+
+
+def test_write_does_not_wait_for_disk(tmp_path):
+    """write() returns while the writer thread is busy."""
+    log = QueryLog(tmp_path / "q.jsonl")
+    release = threading.Event()
+    original = log._append
+
+    def slow_append(text):
+        release.wait(5)
+        original(text)
+
+    log._append = slow_append
+
+    log.write(_entry(1))
+    log.write(_entry(2))
+    assert not log.path.exists()
+
+    release.set()
+    log.flush()
+    assert len(_read(log.path)) == 2
+    log.close()
+
+
+def test_rotates_by_size_and_keeps_backups(tmp_path):
+    """Full logs are rotated, gzipped, and only `backups` of them kept."""
+    options = QueryLogOptions(max_bytes=300, backups=2, compress=True)
+    log = QueryLog(tmp_path / "q.jsonl", options)
+
+    for n in range(20):
+        log.write(_entry(n, response="x" * 100))
+        log.flush()
+    log.close()
+
+    rotated = rotated_log_files(log.path)
+    assert [f.name for f in rotated] == ["q.jsonl.1.gz", "q.jsonl.2.gz"]
+    assert log.path.stat().st_size <= 300
+    # The newest rotated log ends where the live log begins
+    rotated_lines = gzip.decompress(rotated[0].read_bytes()).decode().splitlines()
+    last_rotated = json.loads(rotated_lines[-1])["request"]["prompt"]
+    first_live = _read(log.path)[0]["request"]["prompt"]
+    assert int(first_live.split()[1]) == int(last_rotated.split()[1]) + 1
+
+
+def test_rotates_by_age(tmp_path):
+    """A log older than max_age is rotated before the next write."""
+    log = QueryLog(tmp_path / "q.jsonl", QueryLogOptions(max_age=60, compress=False))
+    log.write(_entry(1))
+    log.flush()
+    log._started_at -= 120
+
+    log.write(_entry(2))
+    log.close()
+
+    assert [e["request"]["prompt"] for e in _read(log.path)] == ["prompt 2"]
+    assert _read(tmp_path / "q.jsonl.1")[0]["request"]["prompt"] == "prompt 1"
+
+
+def test_samples_successes_but_keeps_errors(tmp_path):
+    """Sampling drops successful calls only."""
+    log = QueryLog(tmp_path / "q.jsonl", QueryLogOptions(sample_rate=0.0))
+
+    log.write(_entry(1))
+    log.write(_entry(2, error="Rate limit"))
+    log.close()
+
+    assert [e["error"] for e in _read(log.path)] == ["Rate limit"]
+    assert log.dropped == 1
+
+
+def test_truncates_long_fields(tmp_path):
+    """Prompts and responses are cut to max_chars."""
+    log = QueryLog(tmp_path / "q.jsonl", QueryLogOptions(max_chars=5))
+
+    log.write({"request": {"prompt": "abcdefgh", "temperature": 0.5}, "response": "123456"})
+    log.close()
+
+    entry = _read(log.path)[0]
+    assert entry["request"]["prompt"] == "abcde... [truncated 3 chars]"
+    assert entry["request"]["temperature"] == 0.5
+    assert entry["response"] == "12345... [truncated 1 chars]"
+
+
+def test_deleted_log_is_started_anew(tmp_path):
+    """Deleting the log file while the writer runs starts a new file."""
+    log = QueryLog(tmp_path / "q.jsonl")
+    log.write(_entry(1))
+    log.flush()
+    log.path.unlink()
+
+    log.write(_entry(2))
+    log.close()
+
+    assert [e["request"]["prompt"] for e in _read(log.path)] == ["prompt 2"]
+
+
+def test_clients_share_one_log_per_file(tmp_path):
+    """Every client logging to the same file uses one writer."""
+    path = tmp_path / "q.jsonl"
+
+    assert get_query_log(path) is get_query_log(tmp_path / "." / "q.jsonl")
@@ -0,0 +1,222 @@
+"""LLM rate limit retry and pacing tests."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from litellm.exceptions import RateLimitError
+
+from oya.llm import LLMClient, LLMRateLimitError, ResponseCache, RetryPolicy, TokenBucket
+from oya.llm.ratelimit import parse_duration, rate_limit_wait
+
+
+def _rate_limit_error(headers=None):
+    response = httpx.Response(
+        429, headers=headers or {}, request=httpx.Request("POST", "https://api.test")
+    )
+    return RateLimitError(
+        message="Rate limit exceeded", llm_provider="openai", model="gpt-4o", response=response
+    )
+
+
+def _completion(content="Test response"):
+    return AsyncMock(choices=[AsyncMock(message=AsyncMock(content=content))])
+
+
+def test_parse_duration_formats():
+    """Plain seconds and Go-style durations from reset headers are understood."""
+    assert parse_duration("20") == 20
+    assert parse_duration("1.5s") == 1.5
+    assert parse_duration("6m0s") == 360
+    assert parse_duration("20ms") == pytest.approx(0.02)
+    assert parse_duration("soon") is None
+
+
+def test_rate_limit_wait_prefers_retry_after():
+    """retry-after wins over the reset time of an exhausted allowance."""
+    assert rate_limit_wait({"Retry-After": "7"}) == 7
+    assert rate_limit_wait({"retry-after-ms": "1500", "retry-after": "7"}) == 1.5
+    assert rate_limit_wait({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+
+
+def test_rate_limit_wait_uses_exhausted_allowance_reset():
+    """The reset time counts only for an allowance that has run out."""
+    headers = {
+        "x-ratelimit-remaining-requests": "10",
+        "x-ratelimit-reset-requests": "1s",
+        "x-ratelimit-remaining-tokens": "0",
+        "x-ratelimit-reset-tokens": "12s",
+    }
+
+    assert rate_limit_wait(headers) == 12
+    assert rate_limit_wait({"x-ratelimit-remaining-requests": "3"}) is None
+    assert rate_limit_wait({}) is None
+
+
+def test_backoff_grows_within_bounds():
+    """Backoff doubles per attempt with jitter and stops at max_delay."""
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+    assert 0.5 <= policy.delay(0) <= 1.0
+    assert 2.0 <= policy.delay(2) <= 4.0
+    assert 2.5 <= policy.delay(10) <= 5.0
+    assert 4.0 <= policy.delay(0, wait=4.0) <= 5.0
+    assert policy.delay(0, wait=60.0) is None
+
+
+async def test_client_retries_after_requested_wait():
+    """A rate-limited call is retried after the wait the provider asked for."""
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    with (
+        patch("oya.llm.client.acompletion") as mock,
+        patch("oya.llm.client.asyncio.sleep", fake_sleep),
+    ):
+        mock.side_effect = [_rate_limit_error({"retry-after": "3"}), _completion()]
+        client = LLMClient(
+            provider="openai", model="gpt-4o", retry_policy=RetryPolicy(base_delay=0.5)
+        )
+
+        response = await client.generate("Test")
+
+    assert response == "Test response"
+    assert mock.call_count == 2
+    assert len(sleeps) == 1 and 3.0 <= sleeps[0] <= 3.5
+
+
+async def test_client_gives_up_after_max_retries():
+    """The rate limit error surfaces once the retries are used up."""
+    with (
+        patch("oya.llm.client.acompletion") as mock,
+        patch("oya.llm.client.asyncio.sleep", AsyncMock()),
+    ):
+        mock.side_effect = _rate_limit_error()
+        client = LLMClient(provider="openai", model="gpt-4o", retry_policy=RetryPolicy(2))
+
+        with pytest.raises(LLMRateLimitError):
+            await client.generate("Test")
+
+    assert mock.call_count == 3
+
+
+async def test_client_gives_up_on_wait_beyond_max_delay():
+    """A provider asking for longer than max_delay fails the call without sleeping."""
+    sleep = AsyncMock()
+    limiter = TokenBucket(rate=100)
+    with (
+        patch("oya.llm.client.acompletion") as mock,
+        patch("oya.llm.client.asyncio.sleep", sleep),
+    ):
+        mock.side_effect = _rate_limit_error({"retry-after": "3600"})
+        client = LLMClient(
+            provider="openai",
+            model="gpt-4o",
+            retry_policy=RetryPolicy(max_delay=60.0),
+            rate_limiter=limiter,
+        )
+
+        with pytest.raises(LLMRateLimitError):
+            await client.generate("Test")
+
+    assert mock.call_count == 1
+    sleep.assert_not_called()
+    # Other calls are not held back by the hour-long wait
+    assert limiter._paused_until < time.monotonic()
+
+
+async def test_client_reports_rate_limits():
+    """Every rate-limited attempt is reported with its start time."""
+    reported = []
+    with (
+        patch("oya.llm.client.acompletion") as mock,
+        patch("oya.llm.client.asyncio.sleep", AsyncMock()),
+    ):
+        mock.side_effect = [_rate_limit_error(), _rate_limit_error(), _completion()]
+        client = LLMClient(
+            provider="openai",
+            model="gpt-4o",
+            retry_policy=RetryPolicy(),
+            on_rate_limit=reported.append,
+        )
+        start = time.monotonic()
+
+        await client.generate("Test")
+
+    assert len(reported) == 2
+    assert all(started >= start for started in reported)
+
+
+async def test_client_reports_provider_latency_only(tmp_path):
+    """Latency is reported per answered attempt, excluding retry waits and cache hits."""
+    reported = []
+    real_sleep = asyncio.sleep
+
+    async def slow_sleep(delay):
+        await real_sleep(0.05)
+
+    with (
+        patch("oya.llm.client.acompletion") as mock,
+        patch("oya.llm.client.asyncio.sleep", slow_sleep),
+    ):
+        mock.side_effect = [_rate_limit_error({"retry-after": "0"}), _completion()]
+        client = LLMClient(
+            provider="openai",
+            model="gpt-4o",
+            cache=ResponseCache(tmp_path / "cache.db", max_bytes=1000),
+            retry_policy=RetryPolicy(base_delay=0.01),
+            on_response=lambda started, latency: reported.append(latency),
+        )
+
+        await client.generate("Test")
+        await client.generate("Test")
+
+    assert mock.call_count == 2
+    assert len(reported) == 1
+    assert reported[0] < 0.05
+
+
+async def test_stream_retries_before_first_token():
+    """A streaming call rate-limited at the start is retried."""
+
+    async def stream():
+        for token in ("a", "b"):
+            yield AsyncMock(choices=[AsyncMock(delta=AsyncMock(content=token))])
+
+    with (
+        patch("oya.llm.client.acompletion") as mock,
+        patch("oya.llm.client.asyncio.sleep", AsyncMock()),
+    ):
+        mock.side_effect = [_rate_limit_error(), stream()]
+        client = LLMClient(provider="openai", model="gpt-4o", retry_policy=RetryPolicy())
+
+        tokens = [token async for token in client.generate_stream("Test")]
+
+    assert tokens == ["a", "b"]
+
+
+async def test_token_bucket_paces_calls():
+    """Calls beyond the burst wait for tokens to refill."""
+    bucket = TokenBucket(rate=50, capacity=2)
+    start = time.monotonic()
+
+    for _ in range(4):
+        await bucket.acquire()
+
+    # Two calls from the burst, two more at 50 per second
+    assert time.monotonic() - start >= 0.035
+
+
+async def test_token_bucket_pause_holds_back_all_callers():
+    """A pause after a rate limit delays every waiting call."""
+    bucket = TokenBucket(rate=1000, capacity=10)
+    bucket.pause(0.05)
+    start = time.monotonic()
+
+    await asyncio.gather(bucket.acquire(), bucket.acquire())
+
+    assert time.monotonic() - start >= 0.045
@@ -0,0 +1,117 @@
+"""LLM token usage accounting tests."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from oya.llm import LLMClient, ResponseCache, UsageTracker, llm_page, llm_phase
+
+
+def _completion(prompt_tokens=100, completion_tokens=20):
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content="Test response"))]
+    response.usage = MagicMock(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+    return response
+
+
+def test_tracker_aggregates_by_phase_and_page():
+    """Calls add up in the total, their phase and their page."""
+    tracker = UsageTracker()
+
+    tracker.record(100, 10, 0.5, phase="files", page="a.py")
+    tracker.record(50, 5, 0.25, phase="files", page="a.py")
+    tracker.record(30, 3, phase="synthesis")
+    tracker.record(0, 0, cached=True, phase="files", page="b.py")
+    tracker.record(7, 1)
+
+    data = tracker.to_dict()
+    assert data["total"] == {
+        "calls": 5,
+        "cached_calls": 1,
+        "prompt_tokens": 187,
+        "completion_tokens": 19,
+        "cost": 0.75,
+    }
+    assert data["phases"]["files"]["prompt_tokens"] == 150
+    assert data["phases"]["other"]["calls"] == 1
+    assert data["pages"]["files"]["a.py"]["completion_tokens"] == 15
+    assert data["pages"]["files"]["b.py"]["cached_calls"] == 1
+    assert "synthesis" not in data["pages"]
+
+
+async def test_client_records_usage_of_context(tmp_path):
+    """Usage is attributed to the phase and page the call was made in."""
+    tracker = UsageTracker()
+    log_path = tmp_path / "llm.jsonl"
+    client = LLMClient(provider="openai", model="gpt-4o", usage=tracker, log_path=log_path)
+
+    with patch("oya.llm.client.acompletion", AsyncMock(return_value=_completion())):
+        with llm_phase("files"), llm_page("src/app.py"):
+            await client.generate("Prompt")
+
+    page = tracker.pages["files"]["src/app.py"]
+    assert (page.prompt_tokens, page.completion_tokens) == (100, 20)
+    # gpt-4o has known pricing
+    assert tracker.total.cost > 0
+    client.flush_log()
+    entry = json.loads(log_path.read_text())
+    assert entry["usage"]["prompt_tokens"] == 100
+
+
+async def test_cached_calls_use_no_tokens(tmp_path):
+    """A response from the cache counts as a call without tokens."""
+    tracker = UsageTracker()
+    cache = ResponseCache(tmp_path / "cache.db", max_bytes=1000)
+    client = LLMClient(provider="openai", model="gpt-4o", usage=tracker, cache=cache)
+
+    with patch("oya.llm.client.acompletion", AsyncMock(return_value=_completion())):
+        await client.generate("Prompt", temperature=0.5, max_tokens=100)
+        await client.generate("Prompt", temperature=0.5, max_tokens=100)
+
+    assert tracker.total.calls == 2
+    assert tracker.total.cached_calls == 1
+    assert tracker.total.prompt_tokens == 100
+
+
+async def test_stream_records_reported_usage():
+    """A streamed response uses the usage of its final chunk."""
+    tracker = UsageTracker()
+
+    async def stream():
+        yield MagicMock(choices=[MagicMock(delta=MagicMock(content="Hi"))], usage=None)
+        yield MagicMock(choices=[], usage=MagicMock(prompt_tokens=40, completion_tokens=2))
+
+    with patch("oya.llm.client.acompletion", AsyncMock(return_value=stream())) as mock:
+        client = LLMClient(provider="openai", model="gpt-4o", usage=tracker)
+        tokens = [token async for token in client.generate_stream("Prompt")]
+
+    assert tokens == ["Hi"]
+    assert mock.call_args.kwargs["stream_options"] == {"include_usage": True}
+    assert (tracker.total.prompt_tokens, tracker.total.completion_tokens) == (40, 2)
+
+
+async def test_stream_estimates_usage_when_not_reported():
+    """Providers that do not report stream usage are estimated from the text."""
+    tracker = UsageTracker()
+
+    async def stream():
+        yield MagicMock(choices=[MagicMock(delta=MagicMock(content="Hello there"))], usage=None)
+
+    with patch("oya.llm.client.acompletion", AsyncMock(return_value=stream())):
+        client = LLMClient(provider="openai", model="gpt-4o", usage=tracker)
+        [token async for token in client.generate_stream("Prompt")]
+
+    assert tracker.total.prompt_tokens > 0
+    assert tracker.total.completion_tokens > 0
+
+
+def test_to_dict_keeps_only_top_pages():
+    """Serialized usage keeps the most expensive pages; phase totals keep all."""
+    tracker = UsageTracker()
+    for i in range(25):
+        tracker.record(100 * i, 10, phase="files", page=f"f{i}.py")
+
+    data = tracker.to_dict(top_pages=3)
+
+    assert list(data["pages"]["files"]) == ["f24.py", "f23.py", "f22.py"]
+    assert data["phases"]["files"]["calls"] == 25
+    assert len(tracker.pages["files"]) == 25
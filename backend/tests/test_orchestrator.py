@@ -929,6 +929,74 @@ class Greeter:
             assert "file" in symbol.metadata
 
 
+# ============================================================================
+# Analysis Index Tests
+# ============================================================================
+
+
+class TestAnalysisIndex:
+    """Tests for the per-file and per-directory analysis index."""
+
+    def _symbol(self, name: str, file_path: str) -> ParsedSymbol:
+        return ParsedSymbol(
+            name=name,
+            symbol_type=SymbolType.FUNCTION,
+            start_line=1,
+            end_line=2,
+            metadata={"file": file_path},
+        )
+
+    def test_groups_symbols_by_file(self):
+        """Symbols are grouped under the file they were parsed from."""
+        from oya.generation.orchestrator import build_analysis_index
+
+        symbols = [
+            self._symbol("a", "src/a.py"),
+            self._symbol("b", "src/b.py"),
+            self._symbol("a2", "src/a.py"),
+        ]
+
+        index = build_analysis_index(["src/a.py", "src/b.py"], symbols)
+
+        assert [s.name for s in index.symbols_by_file["src/a.py"]] == ["a", "a2"]
+        assert [s.name for s in index.symbols_by_file["src/b.py"]] == ["b"]
+
+    def test_maps_directories_to_direct_files_and_children(self):
+        """Every directory knows its direct files and direct child directories."""
+        from oya.generation.orchestrator import build_analysis_index
+
+        files = ["README.md", "src/main.py", "src/api/routes.py", "src/api/v1/users.py"]
+
+        index = build_analysis_index(files, [])
+
+        assert index.files_by_dir[""] == ["README.md"]
+        assert index.files_by_dir["src"] == ["src/main.py"]
+        assert index.files_by_dir["src/api/v1"] == ["src/api/v1/users.py"]
+        assert index.child_dirs[""] == ["src"]
+        assert index.child_dirs["src"] == ["src/api"]
+        assert index.child_dirs["src/api/v1"] == []
+
+    def test_files_under_walks_subtree(self):
+        """files_under returns files from the directory and all descendants."""
+        from oya.generation.orchestrator import build_analysis_index
+
+        files = ["README.md", "src/main.py", "src/api/routes.py", "tests/test_main.py"]
+
+        index = build_analysis_index(files, [])
+
+        assert index.files_under("src") == ["src/main.py", "src/api/routes.py"]
+        assert sorted(index.files_under("")) == sorted(files)
+
+    def test_get_analysis_index_builds_when_missing(self, orchestrator):
+        """Analysis dicts without a prebuilt index get one on first use."""
+        analysis = {"files": ["src/main.py"], "symbols": [self._symbol("main", "src/main.py")]}
+
+        index = orchestrator._get_analysis_index(analysis)
+
+        assert analysis["index"] is index
+        assert [s.name for s in index.symbols_by_file["src/main.py"]] == ["main"]
+
+
 # ============================================================================
 # Task 7: Depth-First Directory Processing Tests
 # ============================================================================
@@ -1002,6 +1070,211 @@ class TestDirectoryProcessingOrder:
         assert result == [""]
 
 
+class TestParallelDirectoryGeneration:
+    """Tests for dependency-driven concurrent directory generation."""
+
+    @pytest.mark.asyncio
+    async def test_siblings_run_concurrently_and_parents_wait(self, orchestrator):
+        """Independent directories overlap; a parent starts only after its children."""
+        import asyncio
+
+        running: set[str] = set()
+        peak = 0
+        started: list[tuple[str, set[str]]] = []
+        finished: set[str] = set()
+
+        async def mock_generate(directory_path, child_summaries=None, **kwargs):
+            nonlocal peak
+            running.add(directory_path)
+            peak = max(peak, len(running))
+            started.append((directory_path, {c.directory_path for c in child_summaries or []}))
+            await asyncio.sleep(0.01)
+            running.discard(directory_path)
+            finished.add(directory_path)
+            page = GeneratedPage(
+                content="# Dir",
+                page_type="directory",
+                path=f"directories/{directory_path or 'root'}.md",
+                word_count=1,
+                target=directory_path,
+            )
+            summary = DirectorySummary(
+                directory_path=directory_path,
+                purpose=f"Purpose of {directory_path}",
+                contains=[],
+                role_in_system="",
+            )
+            return page, summary
+
+        orchestrator.directory_generator.generate = mock_generate
+
+        analysis = {
+            "files": ["a/x.py", "b/y.py", "c/z.py", "README.md"],
+            "symbols": [],
+            "file_contents": {},
+        }
+
+        pages, summaries = await orchestrator._run_directories(analysis, {})
+
+        assert len(pages) == 4
+        assert peak == 3  # a, b and c have no children and run together
+        root_children = dict(started)[""]
+        assert root_children == {"a", "b", "c"}
+        assert started[-1][0] == ""
+
+
+class TestOverlappingPhases:
+    """Tests for phases that run concurrently within a shared LLM budget."""
+
+    @staticmethod
+    def _file_result(file_path):
+        page = GeneratedPage(
+            content="# File",
+            page_type="file",
+            path=f"files/{file_path.replace('/', '-')}.md",
+            word_count=1,
+            target=file_path,
+        )
+        return page, FileSummary(file_path=file_path, purpose="File", layer="utility")
+
+    @staticmethod
+    def _directory_result(directory_path):
+        page = GeneratedPage(
+            content="# Dir",
+            page_type="directory",
+            path=f"directories/{directory_path or 'root'}.md",
+            word_count=1,
+            target=directory_path,
+        )
+        summary = DirectorySummary(
+            directory_path=directory_path, purpose="Dir", contains=[], role_in_system=""
+        )
+        return page, summary
+
+    async def _run(self, orchestrator, analysis):
+        with (
+            patch.object(orchestrator, "_run_analysis", AsyncMock(return_value=analysis)),
+            patch.object(orchestrator, "_run_synthesis", AsyncMock(return_value=SynthesisMap())),
+            patch.object(orchestrator, "_run_architecture", AsyncMock()),
+            patch.object(orchestrator, "_run_overview", AsyncMock()),
+            patch.object(orchestrator, "_run_workflows", AsyncMock(return_value=[])),
+            patch.object(orchestrator, "_save_page_with_frontmatter", AsyncMock()),
+        ):
+            return await orchestrator.run()
+
+    @pytest.mark.asyncio
+    async def test_directory_overlaps_file_tail(self, orchestrator):
+        """A directory is generated while files elsewhere are still in progress."""
+        import asyncio
+
+        slow_file_release = asyncio.Event()
+        directory_files: dict[str, list[str]] = {}
+
+        async def generate_file(file_path, **kwargs):
+            if file_path == "slow/b.py":
+                await asyncio.wait_for(slow_file_release.wait(), timeout=5)
+            return self._file_result(file_path)
+
+        async def generate_directory(directory_path, file_summaries=None, **kwargs):
+            directory_files[directory_path] = [s.file_path for s in file_summaries or []]
+            if directory_path == "fast":
+                # Only possible if directories start before the file phase ends
+                slow_file_release.set()
+            return self._directory_result(directory_path)
+
+        orchestrator.file_generator.generate = generate_file
+        orchestrator.directory_generator.generate = generate_directory
+        analysis = {
+            "files": ["fast/a.py", "slow/b.py"],
+            "symbols": [],
+            "file_tree": "",
+            "file_contents": {"fast/a.py": "a = 1", "slow/b.py": "b = 1"},
+        }
+
+        result = await self._run(orchestrator, analysis)
+
+        assert result.files_regenerated and result.directories_regenerated
+        # Each directory still saw the summaries of its own files
+        assert directory_files["fast"] == ["fast/a.py"]
+        assert directory_files["slow"] == ["slow/b.py"]
+
+    @pytest.mark.asyncio
+    async def test_budget_is_shared_across_phases(self, mock_llm_client, mock_repo, tmp_path):
+        """Overlapping file and directory generation stays within parallel_limit."""
+        import asyncio
+
+        orchestrator = GenerationOrchestrator(
+            llm_client=mock_llm_client,
+            repo=mock_repo,
+            db=MagicMock(),
+            wiki_path=tmp_path / "wiki",
+            parallel_limit=2,
+        )
+        running = 0
+        peak = 0
+
+        async def track(result):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return result
+
+        async def generate_file(file_path, **kwargs):
+            return await track(self._file_result(file_path))
+
+        async def generate_directory(directory_path, **kwargs):
+            return await track(self._directory_result(directory_path))
+
+        orchestrator.file_generator.generate = generate_file
+        orchestrator.directory_generator.generate = generate_directory
+        files = [f"d{i}/m{j}.py" for i in range(4) for j in range(3)]
+        analysis = {
+            "files": files,
+            "symbols": [],
+            "file_tree": "",
+            "file_contents": {f: f"x = {i}" for i, f in enumerate(files)},
+        }
+
+        await self._run(orchestrator, analysis)
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_architecture_overview_and_workflows_run_concurrently(self, orchestrator):
+        """The three synthesis consumers are all in flight at the same time."""
+        import asyncio
+
+        started = []
+        all_started = asyncio.Event()
+
+        def phase(name, result):
+            async def run(*args, **kwargs):
+                started.append(name)
+                if len(started) == 3:
+                    all_started.set()
+                await asyncio.wait_for(all_started.wait(), timeout=5)
+                return result
+
+            return run
+
+        page = GeneratedPage(content="# Page", page_type="overview", path="p.md", word_count=1)
+        analysis = {"files": [], "symbols": [], "file_tree": "", "file_contents": {}}
+        with (
+            patch.object(orchestrator, "_run_analysis", AsyncMock(return_value=analysis)),
+            patch.object(orchestrator, "_run_synthesis", AsyncMock(return_value=SynthesisMap())),
+            patch.object(orchestrator, "_should_regenerate_synthesis", return_value=True),
+            patch.object(orchestrator, "_run_architecture", phase("architecture", page)),
+            patch.object(orchestrator, "_run_overview", phase("overview", page)),
+            patch.object(orchestrator, "_run_workflows", phase("workflows", [])),
+            patch.object(orchestrator, "_save_page_with_frontmatter", AsyncMock()),
+        ):
+            await orchestrator.run()
+
+        assert started == ["architecture", "overview", "workflows"]
+
+
 # ============================================================================
 # Task 8: Enhanced Directory Signature Tests
 # ============================================================================
@@ -1060,6 +1333,207 @@ class TestEnhancedDirectorySignature:
         assert sig1 == sig2
 
 
+class TestProgressThrottle:
+    """Tests for coalescing progress updates by time."""
+
+    @staticmethod
+    def _progress(step, total=100):
+        return GenerationProgress(phase=GenerationPhase.FILES, step=step, total_steps=total)
+
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced_and_flushed(self):
+        """A burst delivers its first update now and only the latest on flush."""
+        from oya.generation.orchestrator import ProgressThrottle
+
+        received = []
+
+        async def callback(progress):
+            received.append(progress.step)
+
+        throttle = ProgressThrottle(callback, interval=60)
+        for step in range(1, 50):
+            await throttle.emit(self._progress(step))
+        assert received == [1]
+
+        await throttle.flush()
+        assert received == [1, 49]
+
+    @pytest.mark.asyncio
+    async def test_final_step_and_waiting_update_are_delivered(self):
+        """A phase's last step goes out at once; held updates go out after the interval."""
+        import asyncio
+
+        from oya.generation.orchestrator import ProgressThrottle
+
+        received = []
+
+        async def callback(progress):
+            received.append(progress.step)
+
+        throttle = ProgressThrottle(callback, interval=0.05)
+        await throttle.emit(self._progress(1, total=3))
+        await throttle.emit(self._progress(2, total=3))
+        await throttle.emit(self._progress(3, total=3))
+        assert received == [1, 3]
+
+        await throttle.emit(self._progress(4))
+        await asyncio.sleep(0.1)
+        assert received == [1, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_run_flushes_last_update(self, tmp_path):
+        """A throttled run still reports its final progress."""
+        mock_repo = MagicMock()
+        mock_repo.path = tmp_path
+        orchestrator = GenerationOrchestrator(
+            llm_client=AsyncMock(),
+            repo=mock_repo,
+            db=MagicMock(),
+            wiki_path=tmp_path / "wiki",
+            progress_rate=0.001,
+        )
+        received = []
+
+        async def callback(progress):
+            received.append(progress.step)
+
+        async def fake_run(progress_callback):
+            for step in range(1, 10):
+                await progress_callback(self._progress(step))
+            return "result"
+
+        with patch.object(orchestrator, "_run", fake_run):
+            assert await orchestrator.run(progress_callback=callback) == "result"
+
+        assert received == [1, 9]
+
+
+class TestDirectoryDamping:
+    """Tests for damping the directory signature cascade."""
+
+    def test_purpose_similarity_ignores_case_and_punctuation(self):
+        """Normalization ignores case, punctuation and spacing."""
+        from oya.generation.orchestrator import purpose_similarity
+
+        assert purpose_similarity("Parses  config files.", "parses config files") == 1.0
+        assert purpose_similarity("", "") == 1.0
+        assert purpose_similarity("Parses config files", "Renders HTML templates") < 0.5
+
+    def test_damped_signature_tracks_child_structure(self):
+        """Child file names and normalized purposes drive the damped signature."""
+        from oya.generation.orchestrator import compute_damped_directory_signature
+
+        file_hashes = [("app.py", "abc123")]
+        base = compute_damped_directory_signature(
+            file_hashes, [("src/api", ["a.py", "b.py"], "HTTP handlers")]
+        )
+
+        reordered = compute_damped_directory_signature(
+            file_hashes, [("src/api", ["b.py", "a.py"], "http handlers.")]
+        )
+        renamed = compute_damped_directory_signature(
+            file_hashes, [("src/api", ["a.py", "c.py"], "HTTP handlers")]
+        )
+
+        assert reordered == base
+        assert renamed != base
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        from oya.db.connection import Database
+        from oya.db.migrations import run_migrations
+
+        db = Database(tmp_path / "oya.db")
+        run_migrations(db)
+        yield db
+        db.close()
+
+    async def _generate(self, db, tmp_path, purposes, files, damping):
+        """Run the directory phase against the stored pages; return regenerated dirs."""
+        mock_repo = MagicMock()
+        mock_repo.path = tmp_path
+        mock_repo.get_head_commit.return_value = "abc123def456"
+        orchestrator = GenerationOrchestrator(
+            llm_client=AsyncMock(),
+            repo=mock_repo,
+            db=db,
+            wiki_path=tmp_path / "wiki",
+            directory_damping=damping,
+        )
+        generated: list[str] = []
+
+        async def mock_generate(directory_path, **kwargs):
+            generated.append(directory_path)
+            page = GeneratedPage(
+                content="# Dir",
+                page_type="directory",
+                path=f"directories/{directory_path or 'root'}.md",
+                word_count=1,
+                target=directory_path,
+            )
+            summary = DirectorySummary(
+                directory_path=directory_path,
+                purpose=purposes[directory_path],
+                contains=[],
+                role_in_system="",
+            )
+            return page, summary
+
+        orchestrator.directory_generator.generate = mock_generate
+        analysis = {"files": list(files), "symbols": [], "file_contents": {}}
+        await orchestrator._run_directories(analysis, files)
+        await orchestrator._flush_pages()
+        orchestrator._clear_checkpoints()
+        return set(generated)
+
+    @pytest.mark.asyncio
+    async def test_reworded_child_does_not_regenerate_parents(self, db, tmp_path):
+        """A small rewording deep in the tree stops at the changed directory."""
+        purposes = {
+            "a/b": "Parses the input files into records.",
+            "a": "Input handling",
+            "": "Project root",
+        }
+        files = {"a/b/x.py": "h1", "a/y.py": "h2"}
+        await self._generate(db, tmp_path, purposes, files, damping=0.8)
+
+        purposes.update({"a/b": "Parses input files into records", "a": "Input handling."})
+        regenerated = await self._generate(
+            db, tmp_path, purposes, {**files, "a/b/x.py": "h3"}, damping=0.8
+        )
+
+        assert regenerated == {"a/b"}
+
+    @pytest.mark.asyncio
+    async def test_material_changes_still_propagate(self, db, tmp_path):
+        """New files and rewritten purposes regenerate the parent directory."""
+        purposes = {"a/b": "Parses the input files.", "a": "Input handling", "": "Root"}
+        files = {"a/b/x.py": "h1", "a/y.py": "h2"}
+        await self._generate(db, tmp_path, purposes, files, damping=0.8)
+
+        files["a/b/z.py"] = "h3"
+        assert await self._generate(db, tmp_path, purposes, files, damping=0.8) == {"a/b", "a"}
+
+        purposes["a/b"] = "Renders HTML templates for the web UI."
+        files["a/b/x.py"] = "h4"
+        assert await self._generate(db, tmp_path, purposes, files, damping=0.8) == {"a/b", "a"}
+
+    @pytest.mark.asyncio
+    async def test_without_damping_rewording_cascades_to_root(self, db, tmp_path):
+        """With damping off, any change to a child's purpose regenerates its parents."""
+        purposes = {"a/b": "Parses the input files.", "a": "Input handling", "": "Root"}
+        files = {"a/b/x.py": "h1", "a/y.py": "h2"}
+        await self._generate(db, tmp_path, purposes, files, damping=0.0)
+
+        # Each regenerated directory's purpose is reworded slightly
+        purposes.update({"a/b": "Parses input files", "a": "Input handling."})
+        regenerated = await self._generate(
+            db, tmp_path, purposes, {**files, "a/b/x.py": "h3"}, damping=0.0
+        )
+
+        assert regenerated == {"a/b", "a", ""}
+
+
 class TestSkippedDirectoryPurposePreservation:
     """Tests for preserving purpose when directories are skipped during incremental regen."""
 
@@ -1112,13 +1586,19 @@ class TestSkippedDirectoryPurposePreservation:
         import json
         from unittest.mock import MagicMock
 
-        mock_db = MagicMock()
-        mock_cursor = MagicMock()
-        mock_db.execute.return_value = mock_cursor
-
-        # Simulate database returning metadata with purpose
+        # Simulate database returning metadata with purpose, and no notes
         metadata = {"source_hash": "sig123", "purpose": "API handlers"}
-        mock_cursor.fetchone.return_value = (json.dumps(metadata), "2024-01-01T00:00:00")
+        pages_cursor = MagicMock()
+        pages_cursor.fetchall.return_value = [
+            ("src/api", "directory", json.dumps(metadata), "2024-01-01T00:00:00")
+        ]
+        notes_cursor = MagicMock()
+        notes_cursor.fetchall.return_value = []
+
+        mock_db = MagicMock()
+        mock_db.execute.side_effect = lambda query, *args: (
+            pages_cursor if "FROM wiki_pages" in query else notes_cursor
+        )
 
         # Create minimal orchestrator with mocked db
         mock_repo = MagicMock()
@@ -1143,6 +1623,393 @@ class TestSkippedDirectoryPurposePreservation:
         assert result["purpose"] == "API handlers"
 
 
+class TestPageSnapshot:
+    """Tests for bulk loading of stored page info for incremental checks."""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        from oya.db.connection import Database
+        from oya.db.migrations import run_migrations
+
+        db = Database(tmp_path / "oya.db")
+        run_migrations(db)
+        yield db
+        db.close()
+
+    def _orchestrator(self, db, tmp_path):
+        mock_repo = MagicMock()
+        mock_repo.path = tmp_path
+        return GenerationOrchestrator(
+            llm_client=AsyncMock(), repo=mock_repo, db=db, wiki_path=tmp_path / "wiki"
+        )
+
+    def _add_page(self, db, target, page_type, source_hash, generated_at):
+        import json
+
+        db.execute(
+            """
+            INSERT INTO wiki_pages (path, type, target, generated_at, metadata)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                f"{page_type}s/{target}.md",
+                page_type,
+                target,
+                generated_at,
+                json.dumps({"source_hash": source_hash, "purpose": f"{target} purpose"}),
+            ),
+        )
+
+    def _add_note(self, db, target, updated_at):
+        db.execute(
+            """
+            INSERT INTO notes (scope, target, filepath, content, updated_at)
+            VALUES ('file', ?, ?, 'note', ?)
+            """,
+            (target, f"{target}.md", updated_at),
+        )
+
+    def test_loads_pages_and_latest_notes(self, db, tmp_path):
+        """Page info and note timestamps come from one bulk load."""
+        self._add_page(db, "src/a.py", "file", "h1", "2025-01-02 00:00:00")
+        self._add_page(db, "src", "directory", "sig", "2025-01-02 00:00:00")
+        self._add_note(db, "src/a.py", "2025-01-03 00:00:00")
+        db.commit()
+
+        snapshot = self._orchestrator(db, tmp_path)._load_page_snapshot()
+
+        assert snapshot.page_info("src/a.py", "file")["source_hash"] == "h1"
+        assert snapshot.page_info("src", "directory")["purpose"] == "src purpose"
+        assert snapshot.page_info("src/a.py", "directory") is None
+        assert snapshot.latest_notes == {"src/a.py": "2025-01-03 00:00:00"}
+
+    def test_regeneration_checks_use_snapshot(self, db, tmp_path):
+        """Checks answer from the snapshot without querying per target."""
+        from oya.generation.orchestrator import compute_content_hash
+
+        self._add_page(db, "a.py", "file", compute_content_hash("x"), "2025-01-02 00:00:00")
+        self._add_page(db, "b.py", "file", compute_content_hash("y"), "2025-01-02 00:00:00")
+        self._add_note(db, "b.py", "2025-01-03 00:00:00")
+        db.commit()
+        orchestrator = self._orchestrator(db, tmp_path)
+        orchestrator._page_snapshot = orchestrator._load_page_snapshot()
+
+        with patch.object(db, "execute") as execute:
+            unchanged, _, _ = orchestrator._should_regenerate_file("a.py", "x", {})
+            noted, _, _ = orchestrator._should_regenerate_file("b.py", "y", {})
+            changed, _, _ = orchestrator._should_regenerate_file("a.py", "z", {})
+
+        execute.assert_not_called()
+        assert (unchanged, noted, changed) == (False, True, True)
+
+
+class TestGenerationCheckpoints:
+    """Tests for resuming an interrupted generation from checkpoints."""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        from oya.db.connection import Database
+        from oya.db.migrations import run_migrations
+
+        db = Database(tmp_path / "oya.db")
+        run_migrations(db)
+        yield db
+        db.close()
+
+    def _orchestrator(self, db, tmp_path):
+        mock_repo = MagicMock()
+        mock_repo.path = tmp_path
+        mock_repo.get_head_commit.return_value = "abc123def456"
+        orchestrator = GenerationOrchestrator(
+            llm_client=AsyncMock(), repo=mock_repo, db=db, wiki_path=tmp_path / "wiki"
+        )
+        orchestrator.file_generator.generate = AsyncMock(
+            return_value=(
+                GeneratedPage(
+                    content="# main.py",
+                    page_type="file",
+                    path="files/main-py.md",
+                    word_count=1,
+                    target="main.py",
+                ),
+                FileSummary(
+                    file_path="main.py",
+                    purpose="Entry point",
+                    layer="api",
+                    key_abstractions=["main"],
+                ),
+            )
+        )
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_completed_file_is_resumed_with_full_summary(self, db, tmp_path):
+        """A file page finished before an interruption is not generated again."""
+        analysis = {"files": ["main.py"], "symbols": [], "file_contents": {"main.py": "x = 1"}}
+
+        first = self._orchestrator(db, tmp_path)
+        await first._run_files(analysis)
+        await first._flush_pages()
+        # Interrupted here: the run never completed, so checkpoints remain
+
+        second = self._orchestrator(db, tmp_path)
+        second._page_snapshot = second._load_page_snapshot()
+        pages, _, summaries, _ = await second._run_files(analysis)
+
+        second.file_generator.generate.assert_not_called()
+        assert pages == []
+        assert summaries[0].key_abstractions == ["main"]
+        assert second._resumed["file"] == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_file_ignores_stale_checkpoint(self, db, tmp_path):
+        """A checkpoint only applies to the content it was generated from."""
+        first = self._orchestrator(db, tmp_path)
+        await first._run_files(
+            {"files": ["main.py"], "symbols": [], "file_contents": {"main.py": "x = 1"}}
+        )
+        await first._flush_pages()
+
+        second = self._orchestrator(db, tmp_path)
+        await second._run_files(
+            {"files": ["main.py"], "symbols": [], "file_contents": {"main.py": "x = 2"}}
+        )
+
+        second.file_generator.generate.assert_called_once()
+        assert second._resumed["file"] == 0
+
+    @pytest.mark.asyncio
+    async def test_clear_checkpoints_after_completion(self, db, tmp_path):
+        """Completed generations leave no checkpoints to resume from."""
+        orchestrator = self._orchestrator(db, tmp_path)
+        await orchestrator._run_files(
+            {"files": ["main.py"], "symbols": [], "file_contents": {"main.py": "x = 1"}}
+        )
+        await orchestrator._flush_pages()
+        assert db.execute("SELECT COUNT(*) FROM generation_checkpoints").fetchone()[0] == 1
+
+        orchestrator._clear_checkpoints()
+
+        assert db.execute("SELECT COUNT(*) FROM generation_checkpoints").fetchone()[0] == 0
+
+
+class TestGitChangeDetection:
+    """Tests for using git to skip reading files unchanged since the last analysis."""
+
+    @pytest.fixture
+    def git_repo(self, tmp_path):
+        import subprocess
+
+        from oya.repo.git_repo import GitRepo
+
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+        for args in (
+            ["init"],
+            ["config", "user.email", "test@test.com"],
+            ["config", "user.name", "Test User"],
+        ):
+            subprocess.run(["git", *args], cwd=repo_path, capture_output=True)
+        (repo_path / "a.py").write_text("def a(): pass\n")
+        (repo_path / "b.py").write_text("def b(): pass\n")
+        subprocess.run(["git", "add", "."], cwd=repo_path, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "Initial"], cwd=repo_path, capture_output=True)
+        return GitRepo(repo_path)
+
+    def _orchestrator(self, repo, tmp_path):
+        from oya.parsing.cache import ParseCache
+
+        return GenerationOrchestrator(
+            llm_client=AsyncMock(),
+            repo=repo,
+            db=MagicMock(),
+            wiki_path=tmp_path / "wiki",
+            parse_cache=ParseCache(tmp_path / "parse.pickle"),
+            git_change_detection=True,
+        )
+
+    async def _analyze(self, repo, tmp_path):
+        """Run analysis as a generation would, in a new orchestrator."""
+        orchestrator = self._orchestrator(repo, tmp_path)
+        orchestrator._head_commit = orchestrator._documented_commit()
+        return orchestrator, await orchestrator._run_analysis()
+
+    def test_dirty_tree_documents_no_commit(self, git_repo, tmp_path):
+        """A generation over uncommitted changes records no commit."""
+        orchestrator = self._orchestrator(git_repo, tmp_path)
+        assert orchestrator._documented_commit() == git_repo.get_head_commit()
+
+        (git_repo.path / "a.py").write_text("def a(): return 1\n")
+
+        assert orchestrator._documented_commit() is None
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_are_not_read(self, git_repo, tmp_path):
+        """After a clean analysis, files git reports unchanged are served unread."""
+        import subprocess
+
+        from oya.parsing import pool
+        from oya.parsing.cache import hash_content
+
+        await self._analyze(git_repo, tmp_path)
+        (git_repo.path / "b.py").write_text("def b(): return 2\n")
+        subprocess.run(["git", "commit", "-am", "Change b"], cwd=git_repo.path, capture_output=True)
+
+        with patch.object(pool, "_read_cached", wraps=pool._read_cached) as read_cached:
+            _, analysis = await self._analyze(git_repo, tmp_path)
+
+        # Only the file git reports changed is read and checked against the cache
+        assert [c.args[1] for c in read_cached.call_args_list] == ["b.py"]
+        contents = analysis["file_contents"]
+        assert contents.info("a.py").content_hash == hash_content("def a(): pass\n")
+        assert contents.info("b.py").content_hash == hash_content("def b(): return 2\n")
+        assert contents["a.py"] == "def a(): pass\n"
+        assert [s.name for s in analysis["symbols"] if s.file == "a.py"] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_dirty_run_then_clean_run_regenerates_reverted_file(self, git_repo, tmp_path):
+        """Discarding local edits documented by a dirty run regenerates their pages."""
+        import subprocess
+
+        from oya.parsing.cache import hash_content
+
+        (git_repo.path / "a.py").write_text("def a_local(): pass\n")
+        dirty, analysis = await self._analyze(git_repo, tmp_path)
+        assert dirty._head_commit is None
+        dirty_hash = analysis["file_contents"].info("a.py").content_hash
+
+        subprocess.run(["git", "checkout", "--", "a.py"], cwd=git_repo.path, capture_output=True)
+        clean, analysis = await self._analyze(git_repo, tmp_path)
+
+        clean_hash = analysis["file_contents"].info("a.py").content_hash
+        assert clean_hash == hash_content("def a(): pass\n") != dirty_hash
+        clean._get_existing_page_info = MagicMock(
+            return_value={"source_hash": dirty_hash, "generated_at": None}
+        )
+        should_regen, _, _ = clean._should_regenerate_file("a.py", "", {}, content_hash=clean_hash)
+        assert should_regen
+
+    def test_falls_back_to_reading_without_clean_cache_commit(self, git_repo, tmp_path):
+        """A cache saved from a dirty tree, or no commit at all, disables the shortcut."""
+        orchestrator = self._orchestrator(git_repo, tmp_path)
+        head = git_repo.get_head_commit()
+
+        assert orchestrator._detect_unchanged_paths(head) is None
+        orchestrator.parse_cache.save(commit=None)
+        assert orchestrator._detect_unchanged_paths(head) is None
+        orchestrator.parse_cache.save(commit="0" * 40)
+        assert orchestrator._detect_unchanged_paths(head) is None
+        orchestrator.parse_cache.save(commit=head)
+        assert orchestrator._detect_unchanged_paths(None) is None
+        assert orchestrator._detect_unchanged_paths(head) == {"a.py", "b.py"}
+
+
+class TestIncrementalSynthesis:
+    """Tests for updating the synthesis map and gating the pages built from it."""
+
+    def _orchestrator(self, tmp_path):
+        orchestrator = GenerationOrchestrator(
+            llm_client=AsyncMock(),
+            repo=MagicMock(),
+            db=MagicMock(),
+            wiki_path=tmp_path / "wiki",
+        )
+        orchestrator._generate_architecture_page = AsyncMock()
+        orchestrator._generate_overview_page = AsyncMock()
+        orchestrator._generate_workflow_pages = AsyncMock()
+        return orchestrator
+
+    def _map(self, files: list[str], entry_points=()) -> SynthesisMap:
+        from oya.generation.summaries import EntryPointInfo
+
+        return SynthesisMap(
+            layers={"api": LayerInfo(name="api", purpose="API", files=files)},
+            project_summary="A project.",
+            entry_points=[
+                EntryPointInfo(name=name, entry_type="cli_command", file="cli.py")
+                for name in entry_points
+            ],
+        )
+
+    @pytest.mark.asyncio
+    async def test_first_run_regenerates_all_pages(self, tmp_path):
+        """Without a record of the map the pages came from, every page is generated."""
+        from oya.generation.orchestrator import PAGES_SYNTHESIS_FILE
+
+        orchestrator = self._orchestrator(tmp_path)
+
+        await orchestrator._run_high_level_pages({}, self._map(["a.py"]))
+
+        orchestrator._generate_architecture_page.assert_awaited_once()
+        orchestrator._generate_overview_page.assert_awaited_once()
+        orchestrator._generate_workflow_pages.assert_awaited_once()
+        assert (orchestrator.meta_path / PAGES_SYNTHESIS_FILE).exists()
+
+    @pytest.mark.asyncio
+    async def test_small_change_keeps_pages(self, tmp_path):
+        """A map that barely changed does not regenerate the pages built from it."""
+        orchestrator = self._orchestrator(tmp_path)
+        files = [f"f{i}.py" for i in range(50)]
+        await orchestrator._run_high_level_pages({}, self._map(files))
+        orchestrator._generate_architecture_page.reset_mock()
+        orchestrator._generate_workflow_pages.reset_mock()
+
+        await orchestrator._run_high_level_pages({}, self._map(files + ["new.py"]))
+
+        orchestrator._generate_architecture_page.assert_not_awaited()
+        orchestrator._generate_workflow_pages.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_new_entry_point_regenerates_only_workflows(self, tmp_path):
+        """New entry points regenerate workflows even when the map barely changed."""
+        from oya.generation.orchestrator import PAGES_SYNTHESIS_FILE
+        from oya.generation.synthesis import load_synthesis_map
+
+        orchestrator = self._orchestrator(tmp_path)
+        files = [f"f{i}.py" for i in range(50)]
+        await orchestrator._run_high_level_pages({}, self._map(files, ["init"]))
+        orchestrator._generate_architecture_page.reset_mock()
+        orchestrator._generate_workflow_pages.reset_mock()
+
+        await orchestrator._run_high_level_pages({}, self._map(files, ["init", "build"]))
+
+        orchestrator._generate_architecture_page.assert_not_awaited()
+        orchestrator._generate_workflow_pages.assert_awaited_once()
+        baseline, _ = load_synthesis_map(str(orchestrator.meta_path), PAGES_SYNTHESIS_FILE)
+        assert [ep.name for ep in baseline.entry_points] == ["init", "build"]
+
+    @pytest.mark.asyncio
+    async def test_large_change_regenerates_all_pages(self, tmp_path):
+        """A map that changed beyond the threshold regenerates every page."""
+        orchestrator = self._orchestrator(tmp_path)
+        await orchestrator._run_high_level_pages({}, self._map(["a.py", "b.py"]))
+        orchestrator._generate_overview_page.reset_mock()
+
+        await orchestrator._run_high_level_pages({}, self._map(["c.py", "d.py"]))
+
+        orchestrator._generate_overview_page.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_synthesis_updates_previous_map(self, tmp_path):
+        """With a previous map and known changed files, synthesis is updated in place."""
+        from oya.generation.synthesis import save_synthesis_map
+
+        orchestrator = self._orchestrator(tmp_path)
+        previous = self._map(["a.py"])
+        save_synthesis_map(previous, str(orchestrator.meta_path))
+        orchestrator._regenerated_files = {"a.py"}
+        orchestrator.synthesis_generator.update = AsyncMock(return_value=SynthesisMap())
+        orchestrator.synthesis_generator.generate = AsyncMock()
+        summaries = [FileSummary(file_path="a.py", purpose="A", layer="api")]
+
+        await orchestrator._run_synthesis(summaries, [])
+
+        orchestrator.synthesis_generator.generate.assert_not_awaited()
+        args = orchestrator.synthesis_generator.update.await_args.args
+        assert args[0].layers["api"].files == ["a.py"]
+        assert args[3] == {"a.py"}
+
+
 # ============================================================================
 # Task 9: Graph-Based Architecture Integration Tests
 # ============================================================================
@@ -1892,3 +2759,24 @@ class TestSynopsisPassedToFileGenerator:
         assert len(captured_kwargs) == 1
         assert "synopsis" in captured_kwargs[0]
         assert captured_kwargs[0]["synopsis"] is None
+
+
+class TestLLMPhaseAttribution:
+    """Tests for attributing LLM calls to generation phases."""
+
+    async def test_phase_method_sets_llm_phase(self):
+        """LLM calls inside a phase method, including its tasks, see that phase."""
+        import asyncio
+
+        from oya.generation.orchestrator import GenerationPhase, in_llm_phase
+        from oya.llm.client import current_llm_phase
+
+        @in_llm_phase(GenerationPhase.SYNTHESIS)
+        async def phase():
+            async def call():
+                return current_llm_phase()
+
+            return current_llm_phase(), await asyncio.create_task(call())
+
+        assert await phase() == ("synthesis", "synthesis")
+        assert current_llm_phase() is None
@@ -199,3 +199,60 @@ class TestOrchestratorWorkflows:
         assert any("orders" in p or "cli" in p for p in path_names), (
             "Should have orders or cli workflow"
         )
+
+    @pytest.mark.asyncio
+    async def test_run_workflows_generates_groups_concurrently(self, mock_orchestrator):
+        """Workflow groups run concurrently; pages keep group order despite completion order."""
+        import asyncio
+
+        from oya.generation.overview import GeneratedPage
+
+        synthesis_map = SynthesisMap(
+            entry_points=[
+                EntryPointInfo(
+                    name=f"get_{name}",
+                    entry_type="api_route",
+                    file=f"api/{name}.py",
+                    description=f"/api/{name}",
+                )
+                for name in ("users", "orders", "items")
+            ],
+        )
+        analysis = {"symbols": [], "file_contents": {}, "file_imports": {}}
+
+        in_flight = 0
+        peak = 0
+        call_order: list[str] = []
+
+        async def generate(workflow_group, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            call_order.append(workflow_group.slug)
+            # Earlier groups finish last
+            await asyncio.sleep(0.03 - 0.01 * len(call_order))
+            in_flight -= 1
+            return GeneratedPage(
+                content="# Workflow",
+                page_type="workflow",
+                path=f"workflows/{workflow_group.slug}.md",
+                word_count=2,
+            )
+
+        mock_orchestrator.workflow_generator.generate = generate
+        steps: list[int] = []
+
+        async def progress(p):
+            steps.append(p.step)
+
+        pages = await mock_orchestrator._run_workflows(
+            analysis=analysis,
+            progress_callback=progress,
+            synthesis_map=synthesis_map,
+        )
+
+        assert peak > 1
+        # Groups start in order, so the page order matches the call order
+        assert len(pages) == 3
+        assert [p.path for p in pages] == [f"workflows/{slug}.md" for slug in call_order]
+        assert steps == [0, 1, 2, 3]
@@ -0,0 +1,141 @@
+"""Tests for the persistent parse cache."""
+
+import pickle
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from oya.parsing.cache import ParseCache, hash_content
+from oya.parsing.fallback_parser import FallbackParser
+from oya.parsing.pool import parse_files
+from oya.parsing.registry import ParserRegistry
+
+
+async def _collect(outcomes):
+    return [outcome async for outcome in outcomes]
+
+
+@pytest.fixture
+def registry():
+    return ParserRegistry()
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "meta" / "cache" / "parse.pickle"
+
+
+def _parse(repo, path):
+    content = (repo / path).read_text()
+    return content, ParserRegistry().parse_file(Path(path), content)
+
+
+class TestParseCache:
+    """Tests for ParseCache storage."""
+
+    def test_round_trip(self, tmp_path, cache_path):
+        """Saved entries are served back for unchanged content."""
+        (tmp_path / "a.py").write_text("def hello():\n    pass\n")
+        content, result = _parse(tmp_path, "a.py")
+
+        cache = ParseCache(cache_path)
+        cache.put("a.py", hash_content(content), result, None)
+        cache.save()
+
+        entry = ParseCache(cache_path).get("a.py", hash_content(content), content)
+
+        assert entry is not None
+        assert [s.name for s in entry.result.file.symbols] == ["hello"]
+        # Raw content is not stored, but restored on a hit
+        assert entry.result.file.raw_content == content
+
+    def test_changed_content_misses(self, tmp_path, cache_path):
+        """An entry is not used once the file content changes."""
+        (tmp_path / "a.py").write_text("x = 1\n")
+        content, result = _parse(tmp_path, "a.py")
+        cache = ParseCache(cache_path)
+        cache.put("a.py", hash_content(content), result, None)
+
+        assert cache.get("a.py", hash_content("x = 2\n"), "x = 2\n") is None
+        assert cache.misses == 1
+
+    def test_version_change_discards_cache(self, tmp_path, cache_path):
+        """Entries written by another parser version are ignored."""
+        (tmp_path / "a.py").write_text("x = 1\n")
+        content, result = _parse(tmp_path, "a.py")
+        cache = ParseCache(cache_path, version="1")
+        cache.put("a.py", hash_content(content), result, None)
+        cache.save()
+
+        assert ParseCache(cache_path, version="2").known_hashes(["a.py"]) == {}
+
+    def test_unreadable_cache_is_empty(self, cache_path):
+        """A corrupt cache file is treated as an empty cache."""
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_bytes(b"not a pickle")
+
+        assert ParseCache(cache_path).entries == {}
+
+    def test_malformed_entries_are_ignored(self, cache_path):
+        """Entries that are not ParseCacheEntry objects are dropped on load."""
+        cache_path.parent.mkdir(parents=True)
+        with cache_path.open("wb") as f:
+            pickle.dump({"version": "1", "entries": {"a.py": "not an entry"}}, f)
+
+        assert ParseCache(cache_path, version="1").entries == {}
+
+    def test_save_prunes_removed_files(self, tmp_path, cache_path):
+        """Saving with keep drops entries for files that no longer exist."""
+        cache = ParseCache(cache_path)
+        cache.put("a.py", "h1", None, None)
+        cache.put("b.py", "h2", None, None)
+        cache.save(keep=["a.py"])
+
+        assert list(ParseCache(cache_path).entries) == ["a.py"]
+
+
+class TestParseFilesWithCache:
+    """Tests for cache use while parsing."""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_files_are_parsed(self, tmp_path, cache_path, registry):
+        """A second run parses only the files whose content changed."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        for name in ("a", "b", "c"):
+            (repo / f"{name}.py").write_text(f"def {name}():\n    pass\n")
+        files = ["a.py", "b.py", "c.py"]
+
+        cache = ParseCache(cache_path)
+        await _collect(parse_files(repo, files, 1, registry, FallbackParser(), cache=cache))
+        cache.save(keep=files)
+
+        (repo / "b.py").write_text("def b_changed():\n    pass\n")
+        cache = ParseCache(cache_path)
+        with patch.object(registry, "parse_file", wraps=registry.parse_file) as parse:
+            outcomes = await _collect(
+                parse_files(repo, files, 1, registry, FallbackParser(), cache=cache)
+            )
+
+        assert [call.args[0] for call in parse.call_args_list] == [Path("b.py")]
+        assert cache.hits == 2
+        by_path = {o.path: o for o in outcomes}
+        assert sorted(by_path) == files
+        assert [s.name for s in by_path["b.py"].result.file.symbols] == ["b_changed"]
+        assert [s.name for s in by_path["a.py"].result.file.symbols] == ["a"]
+        assert by_path["a.py"].content == "def a():\n    pass\n"
+
+    @pytest.mark.asyncio
+    async def test_deleted_file_is_not_served_from_cache(self, tmp_path, cache_path, registry):
+        """A cached file that was deleted is reported as missing."""
+        (tmp_path / "a.py").write_text("x = 1\n")
+        cache = ParseCache(cache_path)
+        await _collect(parse_files(tmp_path, ["a.py"], 1, registry, FallbackParser(), cache))
+
+        (tmp_path / "a.py").unlink()
+        outcomes = await _collect(
+            parse_files(tmp_path, ["a.py"], 1, registry, FallbackParser(), cache)
+        )
+
+        assert outcomes[0].missing
@@ -0,0 +1,133 @@
+"""Tests for multi-process file parsing."""
+
+from unittest.mock import patch
+
+import pytest
+
+from oya.parsing.fallback_parser import FallbackParser
+from oya.parsing.pool import (
+    PROCESS_POOL_MIN_FILES,
+    parse_files,
+    read_and_parse,
+    resolve_parse_workers,
+)
+from oya.parsing.registry import ParserRegistry
+
+
+async def _collect(outcomes):
+    return [outcome async for outcome in outcomes]
+
+
+@pytest.fixture
+def registry():
+    return ParserRegistry()
+
+
+@pytest.fixture
+def fallback():
+    return FallbackParser()
+
+
+class TestReadAndParse:
+    """Tests for parsing a single file."""
+
+    def test_parses_file(self, tmp_path, registry, fallback):
+        """A readable file is parsed by its language parser."""
+        (tmp_path / "a.py").write_text("def hello():\n    pass\n")
+
+        outcome = read_and_parse(tmp_path, "a.py", registry, fallback)
+
+        assert outcome.content.startswith("def hello")
+        assert outcome.result.ok
+        assert outcome.fallback is None
+        assert [s.name for s in outcome.result.file.symbols] == ["hello"]
+
+    def test_missing_file(self, tmp_path, registry, fallback):
+        """A missing file yields an empty outcome, not an error."""
+        outcome = read_and_parse(tmp_path, "gone.py", registry, fallback)
+
+        assert outcome.missing
+        assert outcome.error is None
+
+    def test_parse_failure_uses_fallback(self, tmp_path, registry, fallback):
+        """A file the language parser rejects is handed to the fallback parser."""
+        (tmp_path / "broken.py").write_text("def broken(\n    pass\n")
+
+        outcome = read_and_parse(tmp_path, "broken.py", registry, fallback)
+
+        assert not outcome.result.ok
+        assert outcome.fallback is not None
+        assert outcome.fallback.file is not None
+
+    def test_read_error_is_recorded(self, tmp_path, registry, fallback):
+        """Exceptions while reading are captured on the outcome."""
+        (tmp_path / "a.py").write_text("x = 1\n")
+
+        with patch("pathlib.Path.read_text", side_effect=PermissionError("denied")):
+            outcome = read_and_parse(tmp_path, "a.py", registry, fallback)
+
+        assert outcome.error == "denied"
+        assert not outcome.missing
+
+
+class TestResolveParseWorkers:
+    """Tests for worker count resolution."""
+
+    def test_explicit_count(self):
+        assert resolve_parse_workers(3) == 3
+
+    def test_zero_means_cpu_count(self):
+        with patch("oya.parsing.pool.os.cpu_count", return_value=8):
+            assert resolve_parse_workers(0) == 8
+
+    def test_unknown_cpu_count(self):
+        with patch("oya.parsing.pool.os.cpu_count", return_value=None):
+            assert resolve_parse_workers(0) == 1
+
+
+class TestParseFiles:
+    """Tests for parsing many files."""
+
+    @pytest.mark.asyncio
+    async def test_in_process_preserves_order(self, tmp_path, registry, fallback):
+        """With one worker, files are parsed in-process in the given order."""
+        files = []
+        for i in range(5):
+            (tmp_path / f"m{i}.py").write_text(f"def f{i}():\n    pass\n")
+            files.append(f"m{i}.py")
+
+        with patch("oya.parsing.pool.ProcessPoolExecutor") as executor:
+            outcomes = await _collect(parse_files(tmp_path, files, 4, registry, fallback))
+
+        # Too few files to be worth starting a pool
+        executor.assert_not_called()
+        assert [o.path for o in outcomes] == files
+
+    @pytest.mark.asyncio
+    async def test_process_pool_parses_every_file(self, tmp_path, registry, fallback):
+        """With enough files, worker processes parse every one of them."""
+        files = []
+        for i in range(PROCESS_POOL_MIN_FILES + 5):
+            (tmp_path / f"m{i}.py").write_text(f"def f{i}():\n    pass\n")
+            files.append(f"m{i}.py")
+
+        outcomes = await _collect(parse_files(tmp_path, files, 2, registry, fallback))
+
+        by_path = {o.path: o for o in outcomes}
+        assert sorted(by_path) == sorted(files)
+        for i in range(len(files)):
+            result = by_path[f"m{i}.py"].result
+            assert [s.name for s in result.file.symbols] == [f"f{i}"]
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_falls_back_in_process(self, tmp_path, registry, fallback):
+        """If the pool cannot start, files are parsed in-process instead."""
+        files = []
+        for i in range(PROCESS_POOL_MIN_FILES):
+            (tmp_path / f"m{i}.py").write_text("x = 1\n")
+            files.append(f"m{i}.py")
+
+        with patch("oya.parsing.pool.ProcessPoolExecutor", side_effect=OSError("no fork")):
+            outcomes = await _collect(parse_files(tmp_path, files, 2, registry, fallback))
+
+        assert [o.path for o in outcomes] == files
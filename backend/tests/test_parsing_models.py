@@ -152,3 +152,36 @@ def test_reference_exports():
         line=1,
     )
     assert ref.source == "a"
+
+
+def test_symbol_metadata_splits_file_and_extras():
+    """Metadata reads and writes go to the file field and the extra dict."""
+    symbol = ParsedSymbol(
+        name="f",
+        symbol_type=SymbolType.FUNCTION,
+        start_line=1,
+        end_line=2,
+        metadata={"file": "src/a.py", "raises": ["ValueError"]},
+    )
+
+    assert symbol.file == "src/a.py"
+    assert symbol.extra == {"raises": ["ValueError"]}
+    assert symbol.metadata == {"file": "src/a.py", "raises": ["ValueError"]}
+
+    symbol.metadata["calls"] = ["g"]
+    del symbol.metadata["raises"]
+    assert dict(symbol.metadata) == {"file": "src/a.py", "calls": ["g"]}
+
+
+def test_symbol_without_metadata_allocates_no_dict():
+    """Symbols are slotted and carry no metadata dict until one is needed."""
+    import pickle
+
+    symbol = ParsedSymbol(name="f", symbol_type=SymbolType.FUNCTION, start_line=1, end_line=2)
+    symbol.metadata["file"] = "src/a.py"
+
+    assert not hasattr(symbol, "__dict__")
+    assert symbol.extra is None
+    assert symbol.metadata.get("raises", []) == []
+    assert "raises" not in symbol.metadata
+    assert pickle.loads(pickle.dumps(symbol)) == symbol
@@ -74,6 +74,23 @@ def test_get_file_prompt_includes_content():
     assert "Authentication system" in prompt
 
 
+def test_get_file_prompt_with_section_summaries_replaces_content():
+    """Section summaries of a large file stand in for its content."""
+    prompt = get_file_prompt(
+        file_path="src/big.py",
+        content="def huge(): pass",
+        symbols=[],
+        imports=[],
+        architecture_summary="",
+        section_summaries=[(1, 40, "Defines huge()."), (41, 90, "Defines helpers.")],
+    )
+
+    assert "def huge(): pass" not in prompt
+    assert "### Lines 1-40" in prompt
+    assert "Defines helpers." in prompt
+    assert "file_summary:" in prompt
+
+
 def test_file_template_includes_developer_audience():
     """File template must specify developer audience."""
     from oya.generation.prompts import FILE_TEMPLATE
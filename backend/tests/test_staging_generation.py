@@ -52,8 +52,9 @@ class TestStagingDirectory:
         # Promote
         promote_staging_to_production(staging, production)
 
-        # Production should have new content only
+        # Production should have new content only, with no previous build left
         assert not staging.exists()
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".oyawiki"]
         assert not (production / "wiki" / "old.md").exists()
         assert (production / "wiki" / "new.md").read_text() == "new content"
 
@@ -120,6 +121,158 @@ class TestStagingDirectory:
         assert not (staging / "corrupted.txt").exists()
         assert (staging / "wiki" / "overview.md").read_text() == "# Good Overview"
 
+    def test_prepare_staging_resumes_interrupted_build_of_same_mode(self, tmp_path: Path):
+        """A fully prepared staging directory is kept for a build of the same mode."""
+        from oya.fileio import replace_text
+        from oya.generation.staging import prepare_staging_directory
+
+        staging = tmp_path / ".oyawiki-building"
+        production = tmp_path / ".oyawiki"
+        production.mkdir()
+        (production / "wiki").mkdir()
+        (production / "wiki" / "overview.md").write_text("# Old Overview")
+
+        assert prepare_staging_directory(staging, production, mode="incremental") is False
+
+        # The interrupted build made progress in staging (pages are written by replacement)
+        replace_text(staging / "wiki" / "overview.md", "# New Overview")
+
+        assert prepare_staging_directory(staging, production, mode="incremental") is True
+        assert (staging / "wiki" / "overview.md").read_text() == "# New Overview"
+
+        # A build of another mode starts over from production
+        assert prepare_staging_directory(staging, production, mode="full") is False
+        assert (staging / "wiki" / "overview.md").read_text() == "# Old Overview"
+
+    def test_resumed_build_promotes_current_job_row(self, tmp_path: Path):
+        """A resumed build records the current job and supersedes the interrupted one."""
+        from oya.api.routers.repos import _record_job_in_staging
+        from oya.db.connection import Database
+        from oya.db.migrations import run_migrations
+        from oya.generation.staging import (
+            prepare_staging_directory,
+            promote_staging_to_production,
+        )
+
+        staging = tmp_path / ".oyawiki-building"
+        production = tmp_path / ".oyawiki"
+        (production / "meta").mkdir(parents=True)
+
+        # The interrupted job was copied into staging while it was running
+        db = Database(production / "meta" / "oya.db")
+        run_migrations(db)
+        db.execute(
+            "INSERT INTO generations (id, type, status) VALUES ('old-job', 'incremental', 'running')"
+        )
+        db.commit()
+        db.close()
+        assert prepare_staging_directory(staging, production, mode="incremental") is False
+
+        # After a restart the new job is tracked in production only
+        db = Database(production / "meta" / "oya.db")
+        db.execute("UPDATE generations SET status = 'failed' WHERE id = 'old-job'")
+        db.execute(
+            "INSERT INTO generations (id, type, status, current_phase) "
+            "VALUES ('new-job', 'incremental', 'running', '1:syncing')"
+        )
+        db.commit()
+        assert prepare_staging_directory(staging, production, mode="incremental") is True
+
+        staging_db = Database(staging / "meta" / "oya.db")
+        _record_job_in_staging(db, staging_db, "new-job")
+        staging_db.execute("UPDATE generations SET status = 'completed' WHERE id = 'new-job'")
+        staging_db.commit()
+        staging_db.close()
+        db.close()
+
+        promote_staging_to_production(staging, production)
+
+        promoted = Database(production / "meta" / "oya.db")
+        rows = {
+            row["id"]: row
+            for row in promoted.execute("SELECT id, status, current_phase FROM generations")
+        }
+        promoted.close()
+        assert rows["new-job"]["status"] == "completed"
+        assert rows["new-job"]["current_phase"] == "1:syncing"
+        assert rows["old-job"]["status"] == "failed"
+
+    def test_prepare_staging_does_not_resume_unprepared_staging(self, tmp_path: Path):
+        """Staging without a resume marker (e.g. a crash mid-copy) is rebuilt."""
+        from oya.generation.staging import prepare_staging_directory
+
+        staging = tmp_path / ".oyawiki-building"
+        staging.mkdir()
+        (staging / "partial.txt").write_text("half copied")
+
+        assert prepare_staging_directory(staging, tmp_path / ".oyawiki", mode="full") is False
+        assert not (staging / "partial.txt").exists()
+
+    def test_promote_removes_resume_marker(self, tmp_path: Path):
+        """Promoted builds are complete and carry no resume marker into production."""
+        from oya.generation.staging import (
+            RESUME_MARKER,
+            prepare_staging_directory,
+            promote_staging_to_production,
+        )
+
+        staging = tmp_path / ".oyawiki-building"
+        production = tmp_path / ".oyawiki"
+        prepare_staging_directory(staging, production, mode="incremental")
+
+        promote_staging_to_production(staging, production)
+
+        assert not (production / RESUME_MARKER).exists()
+
+    def test_prepare_staging_shares_files_without_exposing_writes(self, tmp_path: Path):
+        """Staging shares page storage, but rebuilt pages never change production."""
+        from unittest.mock import patch
+
+        from oya.fileio import replace_text
+        from oya.generation.staging import prepare_staging_directory
+
+        staging = tmp_path / ".oyawiki-building"
+        production = tmp_path / ".oyawiki"
+        (production / "wiki").mkdir(parents=True)
+        (production / "wiki" / "overview.md").write_text("# Old")
+        (production / "meta" / "chroma").mkdir(parents=True)
+        (production / "meta" / "oya.db").write_bytes(b"db")
+        (production / "meta" / "chroma" / "index.bin").write_bytes(b"vectors")
+
+        # Without reflinks, as on most filesystems
+        with patch("oya.generation.staging._reflink", return_value=False):
+            prepare_staging_directory(staging, production)
+
+        page = staging / "wiki" / "overview.md"
+        assert page.stat().st_ino == (production / "wiki" / "overview.md").stat().st_ino
+        # Files written in place are copied
+        for in_place in ("meta/oya.db", "meta/chroma/index.bin"):
+            assert (staging / in_place).stat().st_ino != (production / in_place).stat().st_ino
+
+        replace_text(page, "# New")
+
+        assert page.read_text() == "# New"
+        assert (production / "wiki" / "overview.md").read_text() == "# Old"
+
+    def test_promote_falls_back_to_renames(self, tmp_path: Path):
+        """Without an atomic exchange, production is replaced by two renames."""
+        from unittest.mock import patch
+
+        from oya.generation.staging import promote_staging_to_production
+
+        staging = tmp_path / ".oyawiki-building"
+        production = tmp_path / ".oyawiki"
+        production.mkdir()
+        (production / "old.md").write_text("old")
+        staging.mkdir()
+        (staging / "new.md").write_text("new")
+
+        with patch("oya.generation.staging._exchange", return_value=False):
+            promote_staging_to_production(staging, production)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".oyawiki"]
+        assert (production / "new.md").read_text() == "new"
+
     def test_has_incomplete_build_detects_staging(self, tmp_path: Path):
         """has_incomplete_build returns True when staging directory exists."""
         from oya.generation.staging import has_incomplete_build
@@ -0,0 +1,173 @@
+"""Tests for indexing wiki pages while generation is running."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from oya.db.connection import Database
+from oya.generation.page_writer import PendingPage
+from oya.indexing.service import IndexingService
+from oya.indexing.streaming import StreamingIndexer
+
+
+def _page(path: str, content: str, **metadata) -> PendingPage:
+    return PendingPage(
+        path=path,
+        content=content,
+        page_type="file",
+        word_count=len(content.split()),
+        target=None,
+        metadata=metadata,
+    )
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    """Create a temporary database with FTS table."""
+    db = Database(tmp_path / "test.db")
+    db.executescript("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS fts_content USING fts5(
+            content,
+            title,
+            path UNINDEXED,
+            type UNINDEXED,
+            section_header,
+            chunk_id UNINDEXED,
+            chunk_index UNINDEXED,
+            content_rowid UNINDEXED
+        );
+    """)
+    db.commit()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def wiki_path(tmp_path):
+    path = tmp_path / "wiki"
+    (path / "files").mkdir(parents=True)
+    return path
+
+
+@pytest.fixture
+def vectorstore():
+    return MagicMock()
+
+
+@pytest.fixture
+def service(vectorstore, temp_db, wiki_path, tmp_path):
+    return IndexingService(
+        vectorstore=vectorstore, db=temp_db, wiki_path=wiki_path, meta_path=tmp_path / "meta"
+    )
+
+
+def _fts_paths(db: Database) -> list[str]:
+    rows = db.execute("SELECT DISTINCT path FROM fts_content ORDER BY path").fetchall()
+    return [row[0] for row in rows]
+
+
+class TestStreamingIndexer:
+    """Tests for StreamingIndexer."""
+
+    @pytest.mark.asyncio
+    async def test_submitted_pages_are_indexed_in_background(self, service, temp_db, vectorstore):
+        """Submitted pages are indexed without waiting for finish()."""
+        indexer = StreamingIndexer(service)
+
+        indexer.submit([_page("files/a-py.md", "# a.py\n\nModule a.")])
+        for _ in range(50):
+            if indexer.indexed_count:
+                break
+            await asyncio.sleep(0.01)
+
+        assert indexer.indexed_count == 1
+        assert _fts_paths(temp_db) == ["files/a-py.md"]
+        vectorstore.add_documents.assert_called_once()
+        indexer.cancel()
+
+    @pytest.mark.asyncio
+    async def test_finish_indexes_only_pages_not_submitted(
+        self, service, temp_db, vectorstore, wiki_path
+    ):
+        """Pages already indexed from submissions are not read from disk again."""
+        (wiki_path / "files" / "a-py.md").write_text("# a.py\n\nModule a.")
+        (wiki_path / "overview.md").write_text("# Overview\n\nUnchanged page.")
+        indexer = StreamingIndexer(service)
+        indexer.submit([_page("files/a-py.md", "# a.py\n\nModule a.")])
+
+        total = await indexer.finish()
+
+        assert total == 2
+        assert _fts_paths(temp_db) == ["files/a-py.md", "overview.md"]
+        assert temp_db.execute("SELECT COUNT(*) FROM fts_content").fetchone()[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_resaved_page_replaces_earlier_chunks(self, service, temp_db, vectorstore):
+        """A page saved twice in a run is indexed once, with its latest content."""
+        indexer = StreamingIndexer(service)
+        indexer.submit([_page("files/a-py.md", "# a.py\n\nOld text.")])
+        indexer.submit([_page("files/a-py.md", "# a.py\n\nNew text.")])
+
+        await indexer.finish()
+
+        rows = temp_db.execute("SELECT content FROM fts_content").fetchall()
+        assert len(rows) == 1
+        assert "New text." in rows[0][0]
+        vectorstore.delete.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_file_chunks_use_analysis_and_page_layer(self, service, vectorstore):
+        """File page chunks carry symbols from analysis and the page's layer."""
+        indexer = StreamingIndexer(service)
+        indexer.set_analysis(
+            symbols=[{"name": "handler", "type": "function", "file": "src/a.py", "line": 1}],
+            file_imports={"src/a.py": ["os"]},
+        )
+        indexer.submit([_page("files/src-a-py.md", "# src/a.py\n\nDefines handler.", layer="api")])
+
+        await indexer.finish()
+
+        metadata = vectorstore.add_documents.call_args.kwargs["metadatas"][0]
+        assert metadata["layer"] == "api"
+        assert "handler" in metadata["symbols"]
+        assert "os" in metadata["imports"]
+
+    @pytest.mark.asyncio
+    async def test_finish_raises_persistent_errors(self, service, vectorstore, wiki_path):
+        """An error that persists into the final pass surfaces from finish()."""
+        (wiki_path / "files" / "a-py.md").write_text("# a.py\n\nModule a.")
+        vectorstore.add_documents.side_effect = RuntimeError("embedding failed")
+        indexer = StreamingIndexer(service)
+        indexer.submit([_page("files/a-py.md", "# a.py\n\nModule a.")])
+
+        with pytest.raises(RuntimeError, match="embedding failed"):
+            await indexer.finish()
+
+    @pytest.mark.asyncio
+    async def test_background_failure_is_logged_and_left_to_final_pass(
+        self, service, temp_db, vectorstore, wiki_path, caplog
+    ):
+        """After a background failure, pages are indexed by finish() instead."""
+        (wiki_path / "files" / "a-py.md").write_text("# a.py\n\nModule a.")
+        (wiki_path / "files" / "b-py.md").write_text("# b.py\n\nModule b.")
+        vectorstore.add_documents.side_effect = [RuntimeError("embedding failed"), None]
+        indexer = StreamingIndexer(service)
+
+        indexer.submit([_page("files/a-py.md", "# a.py\n\nModule a.")])
+        for _ in range(50):
+            if "Background indexing failed" in caplog.text:
+                break
+            await asyncio.sleep(0.01)
+        assert "embedding failed" in caplog.text
+
+        indexer.submit([_page("files/b-py.md", "# b.py\n\nModule b.")])
+        await asyncio.sleep(0.01)
+        assert vectorstore.add_documents.call_count == 1
+        assert _fts_paths(temp_db) == []
+
+        total = await indexer.finish()
+
+        assert total == 2
+        assert _fts_paths(temp_db) == ["files/a-py.md", "files/b-py.md"]
+        assert temp_db.execute("SELECT COUNT(*) FROM fts_content").fetchone()[0] == 2
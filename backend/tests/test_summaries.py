@@ -1582,6 +1582,232 @@ class TestSynthesisBatchingForLargeInputs:
         assert all_files_in_merged == original_files, "Merged map should contain all original files"
 
 
+class TestConcurrentSynthesisBatching:
+    """Batches run concurrently and their maps are merged in LLM tiers."""
+
+    @staticmethod
+    def _llm_client(max_in_flight: list[int]):
+        """Mock LLM returning one component named after the prompt kind."""
+        import asyncio
+        import json
+        from unittest.mock import AsyncMock
+
+        in_flight = 0
+
+        async def generate(prompt, system_prompt, temperature):
+            nonlocal in_flight
+            in_flight += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            kind = "merged" if "Merge the following partial syntheses" in prompt else "batch"
+            return json.dumps(
+                {
+                    "key_components": [
+                        {"name": f"{kind}-{len(prompt)}", "file": "a.py", "role": "r"}
+                    ],
+                    "dependency_graph": {"api": ["domain"]},
+                    "project_summary": f"{kind} summary",
+                    "layer_interactions": f"{kind} interactions",
+                }
+            )
+
+        client = AsyncMock()
+        client.generate.side_effect = generate
+        return client
+
+    @staticmethod
+    def _file_summaries(count: int):
+        from oya.generation.summaries import FileSummary
+
+        return [
+            FileSummary(
+                file_path=f"src/module_{i}.py",
+                purpose="Handles a part of the request pipeline " * 3,
+                layer="api" if i % 2 else "domain",
+            )
+            for i in range(count)
+        ]
+
+    def test_batches_run_concurrently_within_budget(self):
+        """Batch calls overlap, but never exceed the shared budget."""
+        import asyncio
+
+        from oya.generation.concurrency import ConcurrencyBudget
+        from oya.generation.synthesis import SynthesisGenerator
+
+        max_in_flight = [0]
+
+        async def run():
+            client = self._llm_client(max_in_flight)
+            generator = SynthesisGenerator(client, context_limit=1000, budget=ConcurrencyBudget(3))
+            return await generator.generate(self._file_summaries(200), [])
+
+        synthesis_map = asyncio.run(run())
+
+        assert max_in_flight[0] == 3
+        assert synthesis_map.project_summary == "merged summary"
+        all_files = {f for layer in synthesis_map.layers.values() for f in layer.files}
+        assert len(all_files) == 200
+
+    def test_reduce_merges_in_logarithmic_tiers(self):
+        """Maps are merged in groups, so 20 batches take two merge tiers."""
+        import asyncio
+
+        from oya.generation.summaries import SynthesisMap
+        from oya.generation.synthesis import SYNTHESIS_MERGE_FAN_IN, SynthesisGenerator
+
+        max_in_flight = [0]
+        client = self._llm_client(max_in_flight)
+        generator = SynthesisGenerator(client, context_limit=1000)
+        batch_results = [SynthesisMap(project_summary=f"part {i}") for i in range(20)]
+
+        merged = asyncio.run(generator.reduce_batch_results(batch_results))
+
+        # 20 maps -> 3 groups (tier 1) -> 1 group (tier 2)
+        first_tier = -(-20 // SYNTHESIS_MERGE_FAN_IN)
+        assert client.generate.call_count == first_tier + 1
+        assert merged.project_summary == "merged summary"
+
+    def test_failed_merge_falls_back_to_basic_merge(self):
+        """If the merge call fails, the deterministic merge result is kept."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from oya.generation.summaries import SynthesisMap
+        from oya.generation.synthesis import SynthesisGenerator
+
+        client = AsyncMock()
+        client.generate.side_effect = RuntimeError("provider down")
+        generator = SynthesisGenerator(client, context_limit=1000)
+        batch_results = [
+            SynthesisMap(project_summary="short"),
+            SynthesisMap(project_summary="the longest summary"),
+        ]
+
+        merged = asyncio.run(generator.reduce_batch_results(batch_results))
+
+        assert merged.project_summary == "the longest summary"
+
+
+class TestIncrementalSynthesisUpdate:
+    """Updating a previous SynthesisMap re-synthesizes only affected layers."""
+
+    @staticmethod
+    def _summaries(layers: dict[str, int]):
+        from oya.generation.summaries import FileSummary
+
+        return [
+            FileSummary(file_path=f"{layer}/f{i}.py", purpose=f"{layer} file {i}", layer=layer)
+            for layer, count in layers.items()
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _previous(summaries):
+        from oya.generation.summaries import ComponentInfo
+        from oya.generation.synthesis import SynthesisGenerator
+
+        previous = SynthesisGenerator(llm_client=None).group_files_by_layer(summaries)
+        previous.key_components = [
+            ComponentInfo(name="Router", file="api/f0.py", role="Routes", layer="api"),
+            ComponentInfo(name="Model", file="domain/f0.py", role="Models", layer="domain"),
+        ]
+        previous.dependency_graph = {"api": ["domain"]}
+        previous.project_summary = "Previous summary"
+        previous.layer_interactions = "Previous interactions"
+        return previous
+
+    @staticmethod
+    def _llm_client():
+        import json
+        from unittest.mock import AsyncMock
+
+        client = AsyncMock()
+        client.generate.return_value = json.dumps(
+            {
+                "key_components": [
+                    {"name": "NewModel", "file": "domain/f1.py", "role": "r", "layer": "domain"},
+                    {"name": "Stray", "file": "api/f1.py", "role": "r", "layer": "api"},
+                ],
+                "dependency_graph": {"domain": ["utility"]},
+                "project_summary": "Partial summary",
+                "layer_interactions": "Partial interactions",
+            }
+        )
+        return client
+
+    def test_update_resynthesizes_only_affected_layers(self):
+        """Only the changed file's layer goes to the LLM; other layers are kept."""
+        import asyncio
+
+        from oya.generation.synthesis import SynthesisGenerator
+
+        summaries = self._summaries({"api": 10, "domain": 10})
+        client = self._llm_client()
+        generator = SynthesisGenerator(client, context_limit=100_000)
+
+        updated = asyncio.run(
+            generator.update(self._previous(summaries), summaries, [], {"domain/f1.py"})
+        )
+
+        client.generate.assert_awaited_once()
+        prompt = client.generate.await_args.kwargs["prompt"]
+        assert "domain/f1.py" in prompt
+        assert "api/f1.py" not in prompt
+        assert [c.name for c in updated.key_components] == ["Router", "NewModel"]
+        assert updated.dependency_graph == {"api": ["domain"], "domain": ["utility"]}
+        assert updated.project_summary == "Previous summary"
+        assert updated.layer_interactions == "Previous interactions"
+        assert set(updated.layers["api"].files) == {f"api/f{i}.py" for i in range(10)}
+
+    def test_update_falls_back_to_full_synthesis(self):
+        """When many files changed, the whole codebase is synthesized again."""
+        import asyncio
+
+        from oya.generation.synthesis import SynthesisGenerator
+
+        summaries = self._summaries({"api": 4, "domain": 4})
+        client = self._llm_client()
+        generator = SynthesisGenerator(client, context_limit=100_000)
+        changed = {fs.file_path for fs in summaries[:4]}
+
+        updated = asyncio.run(generator.update(self._previous(summaries), summaries, [], changed))
+
+        prompt = client.generate.await_args.kwargs["prompt"]
+        assert "api/f1.py" in prompt and "domain/f1.py" in prompt
+        assert updated.project_summary == "Partial summary"
+
+    def test_affected_layers_include_moved_and_removed_files(self):
+        """Layers gaining or losing files are affected, not just the changed file's."""
+        from oya.generation.synthesis import SynthesisGenerator
+
+        summaries = self._summaries({"api": 3, "domain": 3, "utility": 3})
+        generator = SynthesisGenerator(llm_client=None)
+        previous = generator.group_files_by_layer(summaries)
+        current = generator.group_files_by_layer(
+            [fs for fs in summaries if fs.file_path != "utility/f2.py"]
+        )
+
+        assert generator.affected_layers(previous, current, {"api/f0.py"}) == {"api", "utility"}
+
+    def test_change_ratio(self):
+        """The change ratio is the share of facts found in only one map."""
+        from oya.generation.summaries import LayerInfo, SynthesisMap
+        from oya.generation.synthesis import synthesis_change_ratio
+
+        def synthesis(files):
+            return SynthesisMap(
+                layers={"api": LayerInfo(name="api", purpose="", files=files)},
+                project_summary="Same",
+            )
+
+        files = [f"f{i}.py" for i in range(8)]
+        assert synthesis_change_ratio(synthesis(files), synthesis(files)) == 0.0
+        # 8 files + 2 summary facts before, one more file after: 1 of 11 facts differs
+        assert synthesis_change_ratio(synthesis(files), synthesis(files + ["x.py"])) == 1 / 11
+
+
 class TestSynthesisMapPersistence:
     """Tests for SynthesisMap persistence to synthesis.json.
 
@@ -27,6 +27,21 @@ export interface JobCreated {
   message: string
 }
 
+export interface TokenUsage {
+  calls: number
+  cached_calls: number
+  prompt_tokens: number
+  completion_tokens: number
+  cost: number
+}
+
+export interface JobUsage {
+  total: TokenUsage
+  phases: Record<string, TokenUsage>
+  // Most expensive pages of each phase, not every page
+  pages: Record<string, Record<string, TokenUsage>>
+}
+
 export interface JobStatus {
   job_id: string
   type: string
@@ -37,6 +52,8 @@ export interface JobStatus {
   total_phases: number | null
   error_message: string | null
   changes_made?: boolean | null
+  concurrency_limit?: number | null
+  usage?: JobUsage | null
 }
 
 export interface WikiPage {
@@ -77,6 +94,7 @@ export interface ProgressEvent {
   total_phases: number | null
   current_step: number | null
   total_steps: number | null
+  concurrency_limit?: number | null
   error?: string
 }
 